@@ -0,0 +1,120 @@
+"""
+Compare the data sources of `pcs_scraper.data_source` on the recorded pages in `benchmarks/fixtures`.
+
+Every `DataSource` method is called with the same arguments on each source. Pages come from the
+page cache after the warm-up call, so the timings measure parsing, not downloading. For each call
+the median time, the peak memory and the coverage are reported: the number of values returned
+(dict entries and scalars that are not empty, list rows), or the error raised. The parsed values
+the scrapers keep in the shared cache (rider info, image URLs) are cleared before every call, so
+both sources parse the page.
+
+The recorded pages are placeholders that only follow the markup the BeautifulSoup scrapers rely
+on (see `benchmarks/fixtures/README.md`); the `procyclingstats` library cannot parse several of
+them. Calls for which a source returns no values are flagged as not comparable at the end: their
+timings measure a failed parse, not the library. Re-record the fixtures from procyclingstats.com
+for a valid comparison of those calls.
+
+Usage (from the repository root):
+    python -m benchmarks.compare_data_sources
+    python -m benchmarks.compare_data_sources -k rider_info -n 50
+"""
+from benchmarks.run_benchmarks import FixtureTransport, measure, SMALL_RIDER, GRAND_TOUR_RIDER, MONUMENT, SEASON
+from pcs_scraper.data_source import ScraperDataSource
+from pcs_scraper.fetcher import set_transport
+from helpers.format_helper import reformat_name
+from storage.cache_backend import get_cache
+import argparse
+import sys
+
+CALLS = [
+    ("rider_info[small rider]", "rider_info", (SMALL_RIDER,)),
+    ("rider_info[grand tour rider]", "rider_info", (GRAND_TOUR_RIDER,)),
+    ("rider_image_url", "rider_image_url", (GRAND_TOUR_RIDER,)),
+    ("team_history", "team_history", (GRAND_TOUR_RIDER,)),
+    ("points_per_season", "points_per_season", (GRAND_TOUR_RIDER,)),
+    ("points_per_speciality", "points_per_speciality", (GRAND_TOUR_RIDER,)),
+    ("season_results", "season_results", (GRAND_TOUR_RIDER, SEASON)),
+    ("rider_program", "rider_program", (GRAND_TOUR_RIDER,)),
+    ("active_seasons", "active_seasons", (GRAND_TOUR_RIDER,)),
+    ("rider_result_in_race", "rider_result_in_race", (SMALL_RIDER, MONUMENT, SEASON)),
+    ("race_flag", "race_flag", (MONUMENT,)),
+]
+
+
+def coverage(value) -> int:
+    """Number of values in a data source result, see the module docstring."""
+    if isinstance(value, dict):
+        return sum(1 for v in value.values() if v not in (None, "", [], {}))
+    if isinstance(value, list):
+        return len(value)
+    return 0 if value in (None, "") else 1
+
+
+def build_sources() -> list:
+    from pcs_scraper.procyclingstats_source import ProcyclingstatsDataSource
+
+    return [ScraperDataSource(), ProcyclingstatsDataSource()]
+
+
+# Shared cache entries of parsed values that the scrapers read before parsing a rider's page
+PARSED_CACHE_KEYS = ("rider_info:{}", "rider_image:{}")
+
+
+def run_call(source, method: str, args: tuple):
+    def run():
+        # Bypass the parsed value caches so every call parses the page
+        for key in PARSED_CACHE_KEYS:
+            get_cache().delete(key.format(reformat_name(args[0])))
+        return getattr(source, method)(*args)
+    return run
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the PCS data sources on the recorded pages.")
+    parser.add_argument("-k", "--filter", default="", help="only run calls whose name contains this text")
+    parser.add_argument("-n", "--repeat", type=int, default=20, help="timed runs per call")
+    args = parser.parse_args(argv)
+
+    sources = build_sources()
+    previous_transport = set_transport(FixtureTransport())
+    totals = {source.name: 0 for source in sources}
+    not_comparable = []  # calls for which a source returned nothing or failed
+    try:
+        header = f"{'call':<32}" + "".join(f" | {source.name:^33}" for source in sources)
+        print(header)
+        print(f"{'':<32}" + f" | {'median ms':>10} {'peak KiB':>10} {'values':>11}" * len(sources))
+        print("-" * len(header))
+
+        for name, method, call_args in CALLS:
+            if args.filter not in name:
+                continue
+
+            line = f"{name:<32}"
+            for source in sources:
+                func = run_call(source, method, call_args)
+                try:
+                    values = coverage(func())
+                    result = measure(func, args.repeat)
+                except Exception as e:
+                    line += f" | {'error: ' + type(e).__name__:>33}"
+                    not_comparable.append(f"{name} ({source.name})")
+                    continue
+                if not values:
+                    not_comparable.append(f"{name} ({source.name})")
+                totals[source.name] += values
+                line += f" | {result['median_ms']:>10.2f} {result['peak_kib']:>10.1f} {values:>11}"
+            print(line)
+    finally:
+        set_transport(previous_transport)
+
+    print()
+    for source in sources:
+        print(f"{source.name}: {totals[source.name]} values in total")
+    if not_comparable:
+        print()
+        print("Not comparable, no values parsed from the placeholder pages: " + ", ".join(not_comparable))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
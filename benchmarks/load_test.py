@@ -0,0 +1,281 @@
+"""
+Load test for the slash commands in `main.py`.
+
+The PCS fetch path is pointed at a local `PCSStandInServer` serving the recorded fixtures, and
+every command callback is driven with fake `discord.Interaction` objects, so neither
+procyclingstats.com nor Discord is ever contacted. Commands are tested one after the other;
+for each of them the throughput, latency percentiles, time to the first response (the Discord
+3 second acknowledgement deadline), time to the first message with content and the time the
+event loop was blocked are reported.
+
+Usage (from the repository root):
+    python -m benchmarks.load_test --concurrency 20 --requests 100 --latency-ms 250 --error-rate 0.02
+"""
+import matplotlib
+matplotlib.use("Agg")
+
+from benchmarks.pcs_server import PCSStandInServer
+from pcs_scraper.fetcher import requests_transport, set_transport
+from constants import pcs_base_url
+from datetime import datetime, timezone
+import argparse
+import asyncio
+import itertools
+import time
+
+ACK_DEADLINE = 3.0  # seconds Discord allows before an interaction must be acknowledged
+DISCORD_LATENCY = 0.05  # simulated round trip of every call to the Discord API, set from --discord-latency-ms
+
+# command name -> keyword arguments, all resolvable from the recorded fixtures
+SCENARIOS = {
+    "birthdate": {"name": "Luca Bernardi"},
+    "age": {"name": "Luca Bernardi"},
+    "place-of-birth": {"name": "Luca Bernardi"},
+    "weight": {"name": "Luca Bernardi"},
+    "height": {"name": "Luca Bernardi"},
+    "nationality": {"name": "Luca Bernardi"},
+    "rider-image": {"name": "Luca Bernardi"},
+    "team-history": {"name": "Luca Bernardi"},
+    "points-per-season": {"name": "Luca Bernardi"},
+    "points-per-speciality": {"name": "Luca Bernardi"},
+    "season-results": {"name": "Luca Bernardi", "season": 2024},
+    "rider-program": {"name": "Luca Bernardi"},
+    "compare-rider-programs": {"name1": "Luca Bernardi", "name2": "Arno Vermeulen"},
+    "compare-riders": {"riders": "Luca Bernardi, Arno Vermeulen"},
+    "compare-rider-season-results": {"name1": "Luca Bernardi", "name2": "Arno Vermeulen", "season": 2024},
+    "rider-past-results": {"name": "Arno Vermeulen", "race": "Ronde van Vlaanderen"},
+    "career": {"name": "Arno Vermeulen"},
+    "rider-race-result": {"name": "Arno Vermeulen", "race": "Ronde van Vlaanderen", "season": 2024},
+    "race-flag": {"race": "Ronde van Vlaanderen"},
+}
+
+_ids = itertools.count(1)
+
+
+class _FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.name = f"loadtest-{user_id}"
+
+
+class _FakeResponse:
+    def __init__(self, interaction):
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def defer(self, **kwargs):
+        self._acknowledge()
+        await asyncio.sleep(DISCORD_LATENCY)
+
+    async def send_message(self, content=None, **kwargs):
+        self._acknowledge()
+        await asyncio.sleep(DISCORD_LATENCY)
+        self._interaction.messages.append((content, kwargs))
+        self._interaction.first_message_at = self._interaction.first_message_at or time.perf_counter()
+
+    def _acknowledge(self):
+        if self._done:
+            raise RuntimeError("This interaction has already been responded to before")
+        self._done = True
+        self._interaction.acknowledged_at = time.perf_counter()
+
+
+class _FakeMessage:
+    def __init__(self, interaction, index):
+        self._interaction = interaction
+        self._index = index
+
+    async def edit(self, **kwargs):
+        await asyncio.sleep(DISCORD_LATENCY)
+        content, sent = self._interaction.messages[self._index]
+        self._interaction.messages[self._index] = (kwargs.get("content", content), {**sent, **kwargs})
+
+
+class _FakeFollowup:
+    def __init__(self, interaction):
+        self._interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        if not self._interaction.response.is_done():
+            raise RuntimeError("Followup sent before the interaction was acknowledged")
+        await asyncio.sleep(DISCORD_LATENCY)
+        self._interaction.messages.append((content, kwargs))
+        self._interaction.first_message_at = self._interaction.first_message_at or time.perf_counter()
+        return _FakeMessage(self._interaction, len(self._interaction.messages) - 1)
+
+
+class FakeInteraction:
+    """Minimal stand-in for `discord.Interaction` recording everything the command sends."""
+
+    def __init__(self, command_name: str, user_id: int = 1, guild_id: int = 1):
+        self.id = next(_ids)
+        self.token = f"loadtest-token-{self.id}"
+        self.command_name = command_name
+        self.user = _FakeUser(user_id)
+        self.guild_id = guild_id
+        self.channel_id = guild_id
+        self.created_at = datetime.now(timezone.utc)
+        self.extras = {}
+        self.response = _FakeResponse(self)
+        self.followup = _FakeFollowup(self)
+        self.messages = []
+        self.started_at = time.perf_counter()
+        self.acknowledged_at = None
+        self.first_message_at = None
+
+    async def edit_original_response(self, content=None, **kwargs):
+        await asyncio.sleep(DISCORD_LATENCY)
+        self.messages.append((content, kwargs))
+
+
+class EventLoopMonitor:
+    """
+    Measures how long the event loop is blocked by repeatedly sleeping for `interval` seconds
+    and recording how late it wakes up.
+    """
+
+    def __init__(self, interval: float = 0.01, tolerance: float = 0.002):
+        self.interval = interval
+        self.tolerance = tolerance
+        self.blocked = 0.0
+        self.max_lag = 0.0
+        self._task = None
+        self._sleep_started = None
+
+    def _record(self, lag: float):
+        if lag > self.tolerance:
+            self.blocked += lag
+            self.max_lag = max(self.max_lag, lag)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._sleep_started = loop.time()
+            await asyncio.sleep(self.interval)
+            self._record(loop.time() - self._sleep_started - self.interval)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        # The last sleep may already be overdue without the monitor having had a chance to run
+        if self._sleep_started is not None:
+            self._record(asyncio.get_running_loop().time() - self._sleep_started - self.interval)
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+async def run_command(command, kwargs: dict, total: int, concurrency: int, users: int) -> dict:
+    """Invoke `command` `total` times with at most `concurrency` invocations in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, ack_latencies, first_message_latencies = [], [], []
+    errors = 0
+    missed_deadline = 0
+
+    async def invoke(i: int):
+        nonlocal errors, missed_deadline
+        async with semaphore:
+            interaction = FakeInteraction(command.name, user_id=i % users + 1)
+            try:
+                await command.callback(interaction, **kwargs)
+            except Exception:
+                errors += 1
+            finished = time.perf_counter()
+            latencies.append(finished - interaction.started_at)
+            ack = (interaction.acknowledged_at or finished) - interaction.started_at
+            ack_latencies.append(ack)
+            first_message_latencies.append((interaction.first_message_at or finished) - interaction.started_at)
+            if ack > ACK_DEADLINE:
+                missed_deadline += 1
+
+    monitor = EventLoopMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(invoke(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    await monitor.stop()
+
+    return {
+        "throughput": total / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "ack_p99": percentile(ack_latencies, 99),
+        "first_p50": percentile(first_message_latencies, 50),
+        "missed_deadline": missed_deadline,
+        "errors": errors,
+        "blocked": monitor.blocked,
+        "blocked_pct": monitor.blocked / elapsed * 100 if elapsed else 0.0,
+        "max_lag": monitor.max_lag,
+    }
+
+
+async def run_load_test(args) -> dict:
+    import main
+
+    commands = {c.name: c for c in main.client.tree.get_commands(guild=main.COMMAND_GUILD)}
+    main.client.response_cache.enabled = not args.no_response_cache
+    selected = args.commands.split(",") if args.commands else list(SCENARIOS)
+
+    results = {}
+    for name in selected:
+        if name not in commands:
+            print(f"Skipping unknown command '{name}'")
+            continue
+        results[name] = await run_command(commands[name], SCENARIOS[name], args.requests, args.concurrency, args.users)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the slash commands against a local PCS stand-in.")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="invocations in flight per command")
+    parser.add_argument("-n", "--requests", type=int, default=50, help="invocations per command")
+    parser.add_argument("--users", type=int, default=10, help="number of distinct fake users issuing commands")
+    parser.add_argument("--commands", default="", help="comma separated command names (default: all)")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="latency of the PCS stand-in")
+    parser.add_argument("--jitter-ms", type=float, default=100.0, help="random extra latency of the PCS stand-in")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of PCS requests failing with 503")
+    parser.add_argument("--no-response-cache", action="store_true", help="always run the commands instead of replaying recent identical responses")
+    parser.add_argument("--discord-latency-ms", type=float, default=50.0, help="simulated Discord API round trip")
+    args = parser.parse_args(argv)
+
+    global DISCORD_LATENCY
+    DISCORD_LATENCY = args.discord_latency_ms / 1000
+
+    server = PCSStandInServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+    server.start_in_background()
+    previous_transport = set_transport(lambda url: requests_transport(url.replace(pcs_base_url, server.base_url, 1)))
+
+    try:
+        results = asyncio.run(run_load_test(args))
+    finally:
+        set_transport(previous_transport)
+        server.shutdown()
+
+    header = (f"{'command':<30} {'req/s':>7} {'p50 s':>7} {'p95 s':>7} {'p99 s':>7} {'ack p99':>8} {'1st msg':>8} "
+              f"{'>3s ack':>8} {'errors':>7} {'blocked s':>10} {'blocked %':>10} {'max lag s':>10}")
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        print(f"{name:<30} {r['throughput']:>7.1f} {r['p50']:>7.2f} {r['p95']:>7.2f} {r['p99']:>7.2f} "
+              f"{r['ack_p99']:>8.2f} {r['first_p50']:>8.2f} {r['missed_deadline']:>8} {r['errors']:>7} {r['blocked']:>10.2f} "
+              f"{r['blocked_pct']:>10.1f} {r['max_lag']:>10.2f}")
+    print(f"\nPCS stand-in served {server.request_count} requests ({server.error_count} injected errors)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Local stand-in for procyclingstats.com serving the recorded fixture pages.
+
+The server answers every path listed in `benchmarks/fixtures/manifest.json` with the recorded
+page, after an optional artificial latency, and can inject server errors at a given rate.
+
+Usage (from the repository root):
+    python -m benchmarks.pcs_server --port 8080 --latency-ms 300 --error-rate 0.05
+"""
+from benchmarks.run_benchmarks import FixtureTransport, FIXTURES_DIR
+from constants import pcs_base_url
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import argparse
+import random
+import threading
+import time
+
+
+class PCSStandInServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server serving recorded PCS pages.
+
+    Args:
+        port (int): Port to listen on, 0 picks a free port.
+        latency_ms (float): Base latency added to every response.
+        jitter_ms (float): Random extra latency, uniformly drawn from [0, jitter_ms].
+        error_rate (float): Fraction of requests answered with a 503 error.
+        fixtures_dir (Path): Directory holding the recorded pages and their manifest.
+    """
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 fixtures_dir: Path = FIXTURES_DIR):
+        self.pages = {url[len(pcs_base_url) - 1:]: html for url, html in FixtureTransport(fixtures_dir).pages.items()}
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.request_count = 0
+        self.error_count = 0
+        self._lock = threading.Lock()
+        super().__init__(("127.0.0.1", port), _PCSRequestHandler)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="pcs-stand-in", daemon=True)
+        thread.start()
+        return thread
+
+
+class _PCSRequestHandler(BaseHTTPRequestHandler):
+    server: PCSStandInServer
+
+    def do_GET(self):
+        server = self.server
+        with server._lock:
+            server.request_count += 1
+
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if random.random() < server.error_rate:
+            with server._lock:
+                server.error_count += 1
+            self._reply(503, "<html><body>Service Unavailable</body></html>")
+            return
+
+        page = server.pages.get(self.path.rstrip("/") or "/")
+        if page is None:
+            self._reply(404, "<html><body>Page not found</body></html>")
+        else:
+            self._reply(200, page)
+
+    def _reply(self, status: int, body: str):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # keep load test output readable
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve recorded PCS pages locally.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = PCSStandInServer(args.port, args.latency_ms, args.jitter_ms, args.error_rate)
+    print(f"Serving {len(server.pages)} recorded PCS pages on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
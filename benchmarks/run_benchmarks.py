@@ -0,0 +1,196 @@
+"""
+Offline benchmark suite for the PCS scrapers, services and chart functions.
+
+Every benchmark runs against the recorded pages in `benchmarks/fixtures`, so no request is
+ever sent to procyclingstats.com. For each benchmark the median/min wall time and the peak
+memory allocated during a single call are reported, and compared against a stored baseline.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks                  # run and compare against baseline.json
+    python -m benchmarks.run_benchmarks --save-baseline  # run and store the results as baseline
+    python -m benchmarks.run_benchmarks -k season        # only run benchmarks matching "season"
+"""
+import matplotlib
+matplotlib.use("Agg")
+
+from pcs_scraper.fetcher import set_transport
+from pathlib import Path
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+SMALL_RIDER = "Arno Vermeulen"
+GRAND_TOUR_RIDER = "Luca Bernardi"
+MONUMENT = "Ronde van Vlaanderen"
+SEASON = 2024
+
+
+class FixtureTransport:
+    """Fetch transport serving pages from the recorded fixture corpus instead of PCS."""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR):
+        with open(fixtures_dir / "manifest.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        # Load everything up front so disk I/O never ends up in the measurements
+        self.pages = {url: (fixtures_dir / filename).read_text(encoding="utf-8") for url, filename in manifest.items()}
+
+    def __call__(self, url: str) -> str:
+        if url not in self.pages:
+            raise LookupError(f"No recorded fixture for {url}")
+        return self.pages[url]
+
+
+def _season_container(transport: FixtureTransport, rider_slug: str):
+    from bs4 import BeautifulSoup
+    from constants import rider_base_url
+
+    doc = BeautifulSoup(transport(f"{rider_base_url}{rider_slug}/{SEASON}"), "html.parser")
+    return doc.find("div", id="rdrResultCont")
+
+
+def build_benchmarks(transport: FixtureTransport):
+    """
+    Build the list of benchmarks.
+
+    Returns:
+        list[tuple[str, str, callable]]: (group, name, function) triples. Each function performs
+            exactly one call of the code under test.
+    """
+    from pcs_scraper import rider_info_scraper
+    from helpers.format_helper import reformat_name
+    from storage.cache_backend import get_cache
+    from pcs_scraper.rider_season_scraper import parse_races
+    from pcs_scraper.rider_points_scraper import get_points_per_season
+    from pcs_scraper.rider_team_history_scraper import get_rider_team_history
+    from pcs_scraper.race_result_scraper import get_rider_result_in_race
+    from services.result_comparison import compare_results
+    from services.program_comparison import compare_programs
+    from helpers.plotter import plot_points_table_style, plot_points_per_speciality_table
+
+    small_container = _season_container(transport, "arno-vermeulen")
+    grand_tour_container = _season_container(transport, "luca-bernardi")
+
+    def fetch_rider_info(name):
+        def run():
+            # Bypass the rider info cache so every call parses the page
+            get_cache().delete(f"rider_info:{reformat_name(name)}")
+            return rider_info_scraper._fetch_rider_info(name)
+        return run
+
+    season_points = get_points_per_season(GRAND_TOUR_RIDER)
+    speciality_points = {"one_day_races": 3450, "gc": 5210, "time_trial": 1830, "sprint": 640, "climber": 6120, "hills": 2980}
+
+    return [
+        ("parser", "parse_races[small rider]", lambda: parse_races(small_container)),
+        ("parser", "parse_races[grand tour rider]", lambda: parse_races(grand_tour_container)),
+        ("parser", "_fetch_rider_info[small rider]", fetch_rider_info(SMALL_RIDER)),
+        ("parser", "_fetch_rider_info[grand tour rider]", fetch_rider_info(GRAND_TOUR_RIDER)),
+        ("parser", "get_points_per_season[grand tour rider]", lambda: get_points_per_season(GRAND_TOUR_RIDER)),
+        ("parser", "get_rider_team_history[grand tour rider]", lambda: get_rider_team_history(GRAND_TOUR_RIDER)),
+        ("parser", "get_rider_result_in_race[monument]", lambda: get_rider_result_in_race(SMALL_RIDER, MONUMENT, SEASON)),
+        ("service", "compare_results", lambda: compare_results(GRAND_TOUR_RIDER, SMALL_RIDER, SEASON)),
+        ("service", "compare_programs", lambda: compare_programs(GRAND_TOUR_RIDER, SMALL_RIDER)),
+        ("chart", "plot_points_table_style", lambda: plot_points_table_style(season_points, rider_name=GRAND_TOUR_RIDER)),
+        ("chart", "plot_points_per_speciality_table", lambda: plot_points_per_speciality_table(speciality_points, rider_name=GRAND_TOUR_RIDER)),
+    ]
+
+
+def measure(func, repeat: int) -> dict:
+    """
+    Time `func` `repeat` times (after one warm-up call) and measure its peak memory.
+
+    Returns:
+        dict: {"median_ms", "min_ms", "peak_kib"}
+    """
+    func()  # warm-up: imports, regex compilation, font cache...
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Measured separately, tracemalloc slows down the timed runs considerably
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def find_regressions(name: str, result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a description of every metric of `result` that is worse than `baseline` beyond `tolerance`."""
+    reference = baseline.get(name)
+    if not reference:
+        return []
+
+    regressions = []
+    for metric in ("median_ms", "peak_kib"):
+        old, new = reference.get(metric), result[metric]
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"{metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run the offline PCS benchmark suite.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("-n", "--repeat", type=int, default=20, help="timed runs per benchmark (charts use a fifth)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run's results as the new baseline")
+    args = parser.parse_args(argv)
+
+    transport = FixtureTransport()
+    previous_transport = set_transport(transport)
+    try:
+        benchmarks = build_benchmarks(transport)
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+        results = {}
+        flagged = {}
+        print(f"{'benchmark':<45} {'median ms':>10} {'min ms':>10} {'peak KiB':>10}")
+        for group, name, func in benchmarks:
+            if args.filter not in name:
+                continue
+
+            repeat = max(1, args.repeat // 5) if group == "chart" else args.repeat
+            result = measure(func, repeat)
+            results[name] = result
+
+            regressions = find_regressions(name, result, baseline, args.tolerance)
+            if regressions:
+                flagged[name] = regressions
+            marker = "  REGRESSION" if regressions else ""
+            print(f"{name:<45} {result['median_ms']:>10.2f} {result['min_ms']:>10.2f} {result['peak_kib']:>10.1f}{marker}")
+    finally:
+        set_transport(previous_transport)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline found at {args.baseline}, run with --save-baseline to create one.")
+        return 0
+
+    for name, regressions in flagged.items():
+        print(f"\nRegression in {name}: " + ", ".join(regressions))
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,4 +5,15 @@ rider_base_url = "https://www.procyclingstats.com/rider/"
 team_base_url = "https://www.procyclingstats.com/team/"
 pcs_base_url = "https://www.procyclingstats.com/"
 
+PAGE_CACHE_TTL = 60 * 60  # seconds a fetched PCS page is reused
+CURRENT_SEASON_CACHE_TTL = 15 * 60  # seconds a rider's page of the running season is reused
+LIVE_RACE_CACHE_TTL = 2 * 60  # seconds a result page of a race that is not finished yet is reused
+RIDER_INFO_CACHE_TTL = 24 * 60 * 60  # seconds parsed rider profile info is reused
+RIDER_IMAGE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds the URL of a rider's picture is reused
+PAGE_STALE_GRACE = 6 * 60 * 60  # seconds an expired page is still served while it is refreshed in the background
+RESPONSE_CACHE_TTL = 60  # seconds the fully built response of a command is replayed for identical repeats
 
+COMMAND_DEADLINE = 30  # seconds a command may spend scraping before it answers with what it has
+INTERACTION_TOKEN_LIFETIME = 15 * 60  # seconds Discord accepts answers to an interaction
+
+RIDER_THUMBNAIL_SIZE = 256  # pixels, longest side of the stored rider picture thumbnails
@@ -0,0 +1,74 @@
+from helpers.metrics import increment
+import asyncio
+import functools
+
+
+class _DeferredResponse:
+    """
+    Stand-in for `interaction.response` once the middleware deferred the interaction: the
+    command's own `defer` is a no-op and its response is sent as the first follow-up.
+    """
+
+    def __init__(self, interaction):
+        self._interaction = interaction
+
+    def __getattr__(self, name):
+        return getattr(self._interaction.response, name)
+
+    def is_done(self) -> bool:
+        return True
+
+    async def defer(self, **kwargs):
+        pass
+
+    async def send_message(self, content=None, **kwargs):
+        kwargs.pop("delete_after", None)  # not supported by follow-ups
+        return await self._interaction.followup.send(content, **kwargs)
+
+
+class _DeferredInteraction:
+    def __init__(self, interaction):
+        self._interaction = interaction
+        self.response = _DeferredResponse(interaction)
+
+    def __getattr__(self, name):
+        return getattr(self._interaction, name)
+
+
+class AutoDefer:
+    """
+    Middleware acknowledging every interaction within Discord's 3 second limit.
+
+    When `is_cached(command_name, kwargs)` says the command can answer from cached data, the
+    command runs as is and answers inline. Otherwise the interaction is deferred before the
+    command runs, and the command's `response.send_message` is turned into a follow-up, so a
+    slow scrape can no longer make the interaction expire. Both paths are counted per command
+    as "auto_defer.<command>.inline|deferred". `is_cached` runs in a worker thread, since it may
+    query the cache backend.
+
+    Args:
+        is_cached (callable): `is_cached(command_name, kwargs) -> bool`.
+    """
+
+    def __init__(self, is_cached):
+        self.is_cached = is_cached
+
+    def _answers_inline(self, command_name: str, kwargs: dict) -> bool:
+        try:
+            return self.is_cached(command_name, kwargs)
+        except Exception as e:  # e.g. the cache backend is unreachable, defer to be safe
+            print(f"Cache check for /{command_name} failed: {e}")
+            return False
+
+    def wrap(self, command_name, callback):
+        @functools.wraps(callback)
+        async def wrapper(interaction, *args, **kwargs):
+            if await asyncio.to_thread(self._answers_inline, command_name, kwargs):
+                increment(f"auto_defer.{command_name}.inline")
+                return await callback(interaction, *args, **kwargs)
+
+            increment(f"auto_defer.{command_name}.deferred")
+            await interaction.response.defer()
+            return await callback(_DeferredInteraction(interaction), *args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,55 @@
+from helpers.deadline import Deadline, DeadlineExceeded
+from helpers.response_cache import normalize_argument
+from helpers.metrics import increment
+from constants import INTERACTION_TOKEN_LIFETIME
+import functools
+import json
+
+
+class CommandDeadlines:
+    """
+    Middleware giving every command a `Deadline` owned by the user and guild it runs for.
+
+    The deadline is kept in `interaction.extras["deadline"]` and applied while the command
+    runs, so the fair scheduler (`pcs_scraper.fair_scheduler`) queues its downloads under
+    the user and guild, and cancels them once nobody can receive the answer anymore:
+        - when the interaction token expires, `INTERACTION_TOKEN_LIFETIME` after the command;
+        - when the same user runs the same command with the same arguments again, which
+          supersedes the earlier invocation (counted as "scheduler.superseded").
+    Commands with their own time budget shorten this deadline, see `Deadline.shorten`.
+    """
+
+    def __init__(self):
+        self._running = {}  # (user id, command, normalized arguments) -> Deadline
+
+    def wrap(self, command_name, callback):
+        @functools.wraps(callback)
+        async def wrapper(interaction, *args, **kwargs):
+            deadline = Deadline(INTERACTION_TOKEN_LIFETIME, owner=(interaction.user.id, interaction.guild_id))
+            interaction.extras["deadline"] = deadline
+
+            arguments = json.dumps({name: normalize_argument(value) for name, value in kwargs.items()}, sort_keys=True, default=str)
+            key = (interaction.user.id, command_name, arguments)
+            previous = self._running.get(key)
+            if previous is not None:
+                increment("scheduler.superseded")
+                previous.cancel()
+            self._running[key] = deadline
+
+            try:
+                with deadline:
+                    return await callback(interaction, *args, **kwargs)
+            except DeadlineExceeded:
+                if self._running.get(key) is deadline:
+                    raise
+                # Superseded: the newer invocation answers instead
+                message = f"Cancelled, replaced by your newer /{command_name}."
+                if interaction.response.is_done():
+                    await interaction.followup.send(message, ephemeral=True)
+                else:
+                    await interaction.response.send_message(message, ephemeral=True)
+            finally:
+                if self._running.get(key) is deadline:
+                    del self._running[key]
+
+        return wrapper
@@ -0,0 +1,70 @@
+from discord import app_commands
+from pathlib import Path
+import hashlib
+import json
+
+
+class PCSCommandTree(app_commands.CommandTree):
+    """
+    Command tree that runs every registered command callback through a chain of middlewares.
+
+    A middleware is a callable `middleware(command_name, callback) -> callback` that returns
+    a wrapped coroutine function (built with `functools.wraps` so discord.py still sees the
+    original parameters). Middlewares are applied in list order, the first one being the
+    outermost wrapper.
+    """
+
+    def __init__(self, client, middlewares=()):
+        super().__init__(client)
+        self.middlewares = list(middlewares)
+
+    def command(self, **kwargs):
+        register = super().command(**kwargs)
+
+        def decorator(func):
+            command_name = kwargs.get("name") or func.__name__
+            for middleware in reversed(self.middlewares):
+                func = middleware(command_name, func)
+            return register(func)
+
+        return decorator
+
+    def signature_hash(self, guild=None) -> str:
+        """
+        Hash the command payloads Discord would receive for `guild` (or the global commands).
+
+        Args:
+            guild (discord.abc.Snowflake | None): Guild whose commands to hash.
+
+        Returns:
+            str: Hex SHA-256 digest, which changes whenever a name, description or parameter changes.
+        """
+        payload = [command.to_dict(self) for command in self.get_commands(guild=guild)]
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    async def sync_if_changed(self, guild=None, hash_path=".command_tree_hash") -> bool:
+        """
+        Sync the commands with Discord, but only if they changed since the last successful sync.
+
+        Syncing is a rate-limited API call, so the hash of the last synced commands is stored per
+        guild in `hash_path`. Delete that file to force a sync.
+
+        Args:
+            guild (discord.abc.Snowflake | None): Guild to sync, None for the global commands.
+            hash_path (str): File storing the last synced hashes.
+
+        Returns:
+            bool: True if a sync was performed.
+        """
+        path = Path(hash_path)
+        key = str(guild.id) if guild else "global"
+        current = self.signature_hash(guild)
+
+        stored = json.loads(path.read_text()) if path.exists() else {}
+        if stored.get(key) == current:
+            return False
+
+        await self.sync(guild=guild)
+        stored[key] = current
+        path.write_text(json.dumps(stored, indent=2))
+        return True
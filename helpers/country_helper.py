@@ -1,5 +1,6 @@
-from bs4 import BeautifulSoup
-import pycountry
+from helpers.country_table import COUNTRIES, COUNTRY_NAMES
+from unidecode import unidecode
+import re
 
 def country_code_to_emoji(code: str) -> str:
     """
@@ -15,23 +16,53 @@ def country_code_to_emoji(code: str) -> str:
         return code  # fallback, return original if not 2 letters
     return chr(ord(code[0].upper()) + 127397) + chr(ord(code[1].upper()) + 127397)
 
+def normalize_country_name(country_name: str) -> str:
+    """
+    Normalize a country name for lookups in `COUNTRIES`.
+
+    Accents, case, punctuation and "&" vs "and" are ignored, so "Côte d'Ivoire" and
+    "cote d ivoire", or "Trinidad & Tobago" and "Trinidad and Tobago" match.
+
+    Args:
+        country_name (str): Country name as written on PCS or in ISO 3166.
+
+    Returns:
+        str: The normalized name (e.g., "Bosnia & Herzegovina" -> "bosnia and herzegovina").
+    """
+    name = unidecode(country_name).lower().replace("&", " and ")
+    name = re.sub(r"[^a-z0-9]+", " ", name)
+    return name.strip()
+
 def country_to_emoji(country_name):
     """
     Convert a country name to the corresponding flag emoji.
 
+    Uses the precomputed table in `helpers.country_table`, which knows ISO names and aliases
+    as well as the spellings used by PCS (e.g., "Great Britain", "Czech Republic").
+
     Args:
         country_name (str): Full country name (e.g., "Netherlands").
 
     Returns:
         str: Flag emoji if the country is recognized, otherwise an empty string.
     """
-    country = pycountry.countries.get(name=country_name)
-    if not country:
+    if not country_name:
         return ""
 
-    # Convert ISO alpha-2 code to regional indicator symbols
-    code = country.alpha_2.upper()
-    return ''.join(chr(ord(c) + 127397) for c in code)
+    country = COUNTRIES.get(normalize_country_name(country_name))
+    return country[1] if country else ""
+
+def country_code_to_name(code: str | None) -> str | None:
+    """
+    Convert a 2-letter ISO country code to the country name, as PCS spells nationalities.
+
+    Args:
+        code (str | None): ISO 3166-1 alpha-2 country code, in any case (e.g., "si").
+
+    Returns:
+        str | None: The country name (e.g., "Slovenia"), None if the code is unknown.
+    """
+    return COUNTRY_NAMES.get(code.upper()) if code else None
 
 def get_flag_emoji_from_html(element) -> str:
     """
@@ -47,6 +78,8 @@ def get_flag_emoji_from_html(element) -> str:
     """
     # If a string is passed, parse it
     if isinstance(element, str):
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(element, "html.parser")
         flag_span = soup.find("span", class_="flag")
     else:
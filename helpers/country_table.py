@@ -0,0 +1,736 @@
+"""
+Frozen lookup tables from normalized country names to (ISO 3166-1 alpha-2 code, flag emoji),
+and from those codes back to country names.
+
+Generated by `python -m tools.build_country_table`, do not edit by hand.
+
+Every code is an ISO 3166-1 alpha-2 code except "XK" for Kosovo, which has no ISO code;
+XK is the user-assigned code used by the UCI and the Unicode flag sequences.
+"""
+from types import MappingProxyType
+
+COUNTRIES = MappingProxyType({
+    'afghanistan': ('AF', '🇦🇫'),
+    'aland islands': ('AX', '🇦🇽'),
+    'albania': ('AL', '🇦🇱'),
+    'algeria': ('DZ', '🇩🇿'),
+    'american samoa': ('AS', '🇦🇸'),
+    'andorra': ('AD', '🇦🇩'),
+    'angola': ('AO', '🇦🇴'),
+    'anguilla': ('AI', '🇦🇮'),
+    'antarctica': ('AQ', '🇦🇶'),
+    'antigua and barbuda': ('AG', '🇦🇬'),
+    'arab republic of egypt': ('EG', '🇪🇬'),
+    'argentina': ('AR', '🇦🇷'),
+    'argentine republic': ('AR', '🇦🇷'),
+    'armenia': ('AM', '🇦🇲'),
+    'aruba': ('AW', '🇦🇼'),
+    'ascension and tristan da cunha saint helena': ('SH', '🇸🇭'),
+    'australia': ('AU', '🇦🇺'),
+    'austria': ('AT', '🇦🇹'),
+    'azerbaijan': ('AZ', '🇦🇿'),
+    'bahamas': ('BS', '🇧🇸'),
+    'bahrain': ('BH', '🇧🇭'),
+    'bangladesh': ('BD', '🇧🇩'),
+    'barbados': ('BB', '🇧🇧'),
+    'belarus': ('BY', '🇧🇾'),
+    'belgium': ('BE', '🇧🇪'),
+    'belize': ('BZ', '🇧🇿'),
+    'benin': ('BJ', '🇧🇯'),
+    'bermuda': ('BM', '🇧🇲'),
+    'bhutan': ('BT', '🇧🇹'),
+    'bolivarian republic of venezuela': ('VE', '🇻🇪'),
+    'bolivia': ('BO', '🇧🇴'),
+    'bolivia plurinational state of': ('BO', '🇧🇴'),
+    'bonaire': ('BQ', '🇧🇶'),
+    'bonaire sint eustatius and saba': ('BQ', '🇧🇶'),
+    'bosnia and herzegovina': ('BA', '🇧🇦'),
+    'botswana': ('BW', '🇧🇼'),
+    'bouvet island': ('BV', '🇧🇻'),
+    'brazil': ('BR', '🇧🇷'),
+    'british indian ocean territory': ('IO', '🇮🇴'),
+    'british virgin islands': ('VG', '🇻🇬'),
+    'brunei': ('BN', '🇧🇳'),
+    'brunei darussalam': ('BN', '🇧🇳'),
+    'bulgaria': ('BG', '🇧🇬'),
+    'burkina faso': ('BF', '🇧🇫'),
+    'burma': ('MM', '🇲🇲'),
+    'burundi': ('BI', '🇧🇮'),
+    'cabo verde': ('CV', '🇨🇻'),
+    'cambodia': ('KH', '🇰🇭'),
+    'cameroon': ('CM', '🇨🇲'),
+    'canada': ('CA', '🇨🇦'),
+    'cape verde': ('CV', '🇨🇻'),
+    'cayman islands': ('KY', '🇰🇾'),
+    'central african republic': ('CF', '🇨🇫'),
+    'chad': ('TD', '🇹🇩'),
+    'chile': ('CL', '🇨🇱'),
+    'china': ('CN', '🇨🇳'),
+    'chinese taipei': ('TW', '🇹🇼'),
+    'christmas island': ('CX', '🇨🇽'),
+    'cocos keeling islands': ('CC', '🇨🇨'),
+    'colombia': ('CO', '🇨🇴'),
+    'commonwealth of dominica': ('DM', '🇩🇲'),
+    'commonwealth of the bahamas': ('BS', '🇧🇸'),
+    'commonwealth of the northern mariana islands': ('MP', '🇲🇵'),
+    'comoros': ('KM', '🇰🇲'),
+    'congo': ('CG', '🇨🇬'),
+    'congo the democratic republic of the': ('CD', '🇨🇩'),
+    'cook islands': ('CK', '🇨🇰'),
+    'costa rica': ('CR', '🇨🇷'),
+    'cote d ivoire': ('CI', '🇨🇮'),
+    'croatia': ('HR', '🇭🇷'),
+    'cuba': ('CU', '🇨🇺'),
+    'curacao': ('CW', '🇨🇼'),
+    'cyprus': ('CY', '🇨🇾'),
+    'czech republic': ('CZ', '🇨🇿'),
+    'czechia': ('CZ', '🇨🇿'),
+    'democratic people s republic of korea': ('KP', '🇰🇵'),
+    'democratic republic of sao tome and principe': ('ST', '🇸🇹'),
+    'democratic republic of the congo': ('CD', '🇨🇩'),
+    'democratic republic of timor leste': ('TL', '🇹🇱'),
+    'democratic socialist republic of sri lanka': ('LK', '🇱🇰'),
+    'denmark': ('DK', '🇩🇰'),
+    'djibouti': ('DJ', '🇩🇯'),
+    'dominica': ('DM', '🇩🇲'),
+    'dominican republic': ('DO', '🇩🇴'),
+    'dr congo': ('CD', '🇨🇩'),
+    'east timor': ('TL', '🇹🇱'),
+    'eastern republic of uruguay': ('UY', '🇺🇾'),
+    'ecuador': ('EC', '🇪🇨'),
+    'egypt': ('EG', '🇪🇬'),
+    'el salvador': ('SV', '🇸🇻'),
+    'england': ('GB', '🇬🇧'),
+    'equatorial guinea': ('GQ', '🇬🇶'),
+    'eritrea': ('ER', '🇪🇷'),
+    'estonia': ('EE', '🇪🇪'),
+    'eswatini': ('SZ', '🇸🇿'),
+    'ethiopia': ('ET', '🇪🇹'),
+    'falkland islands': ('FK', '🇫🇰'),
+    'falkland islands malvinas': ('FK', '🇫🇰'),
+    'faroe islands': ('FO', '🇫🇴'),
+    'federal democratic republic of ethiopia': ('ET', '🇪🇹'),
+    'federal democratic republic of nepal': ('NP', '🇳🇵'),
+    'federal republic of germany': ('DE', '🇩🇪'),
+    'federal republic of nigeria': ('NG', '🇳🇬'),
+    'federal republic of somalia': ('SO', '🇸🇴'),
+    'federated states of micronesia': ('FM', '🇫🇲'),
+    'federative republic of brazil': ('BR', '🇧🇷'),
+    'fiji': ('FJ', '🇫🇯'),
+    'finland': ('FI', '🇫🇮'),
+    'france': ('FR', '🇫🇷'),
+    'french guiana': ('GF', '🇬🇫'),
+    'french polynesia': ('PF', '🇵🇫'),
+    'french republic': ('FR', '🇫🇷'),
+    'french southern territories': ('TF', '🇹🇫'),
+    'gabon': ('GA', '🇬🇦'),
+    'gabonese republic': ('GA', '🇬🇦'),
+    'gambia': ('GM', '🇬🇲'),
+    'georgia': ('GE', '🇬🇪'),
+    'germany': ('DE', '🇩🇪'),
+    'ghana': ('GH', '🇬🇭'),
+    'gibraltar': ('GI', '🇬🇮'),
+    'grand duchy of luxembourg': ('LU', '🇱🇺'),
+    'great britain': ('GB', '🇬🇧'),
+    'greece': ('GR', '🇬🇷'),
+    'greenland': ('GL', '🇬🇱'),
+    'grenada': ('GD', '🇬🇩'),
+    'guadeloupe': ('GP', '🇬🇵'),
+    'guam': ('GU', '🇬🇺'),
+    'guatemala': ('GT', '🇬🇹'),
+    'guernsey': ('GG', '🇬🇬'),
+    'guinea': ('GN', '🇬🇳'),
+    'guinea bissau': ('GW', '🇬🇼'),
+    'guyana': ('GY', '🇬🇾'),
+    'haiti': ('HT', '🇭🇹'),
+    'hashemite kingdom of jordan': ('JO', '🇯🇴'),
+    'heard island and mcdonald islands': ('HM', '🇭🇲'),
+    'hellenic republic': ('GR', '🇬🇷'),
+    'holland': ('NL', '🇳🇱'),
+    'holy see vatican city state': ('VA', '🇻🇦'),
+    'honduras': ('HN', '🇭🇳'),
+    'hong kong': ('HK', '🇭🇰'),
+    'hong kong china': ('HK', '🇭🇰'),
+    'hong kong special administrative region of china': ('HK', '🇭🇰'),
+    'hungary': ('HU', '🇭🇺'),
+    'iceland': ('IS', '🇮🇸'),
+    'independent state of papua new guinea': ('PG', '🇵🇬'),
+    'independent state of samoa': ('WS', '🇼🇸'),
+    'india': ('IN', '🇮🇳'),
+    'indonesia': ('ID', '🇮🇩'),
+    'iran': ('IR', '🇮🇷'),
+    'iran islamic republic of': ('IR', '🇮🇷'),
+    'iraq': ('IQ', '🇮🇶'),
+    'ireland': ('IE', '🇮🇪'),
+    'islamic republic of afghanistan': ('AF', '🇦🇫'),
+    'islamic republic of iran': ('IR', '🇮🇷'),
+    'islamic republic of mauritania': ('MR', '🇲🇷'),
+    'islamic republic of pakistan': ('PK', '🇵🇰'),
+    'isle of man': ('IM', '🇮🇲'),
+    'israel': ('IL', '🇮🇱'),
+    'italian republic': ('IT', '🇮🇹'),
+    'italy': ('IT', '🇮🇹'),
+    'ivory coast': ('CI', '🇨🇮'),
+    'jamaica': ('JM', '🇯🇲'),
+    'japan': ('JP', '🇯🇵'),
+    'jersey': ('JE', '🇯🇪'),
+    'jordan': ('JO', '🇯🇴'),
+    'kazakhstan': ('KZ', '🇰🇿'),
+    'kenya': ('KE', '🇰🇪'),
+    'kingdom of bahrain': ('BH', '🇧🇭'),
+    'kingdom of belgium': ('BE', '🇧🇪'),
+    'kingdom of bhutan': ('BT', '🇧🇹'),
+    'kingdom of cambodia': ('KH', '🇰🇭'),
+    'kingdom of denmark': ('DK', '🇩🇰'),
+    'kingdom of eswatini': ('SZ', '🇸🇿'),
+    'kingdom of lesotho': ('LS', '🇱🇸'),
+    'kingdom of morocco': ('MA', '🇲🇦'),
+    'kingdom of norway': ('NO', '🇳🇴'),
+    'kingdom of saudi arabia': ('SA', '🇸🇦'),
+    'kingdom of spain': ('ES', '🇪🇸'),
+    'kingdom of sweden': ('SE', '🇸🇪'),
+    'kingdom of thailand': ('TH', '🇹🇭'),
+    'kingdom of the netherlands': ('NL', '🇳🇱'),
+    'kingdom of tonga': ('TO', '🇹🇴'),
+    'kiribati': ('KI', '🇰🇮'),
+    'korea': ('KR', '🇰🇷'),
+    'korea democratic people s republic of': ('KP', '🇰🇵'),
+    'korea republic of': ('KR', '🇰🇷'),
+    'kosovo': ('XK', '🇽🇰'),
+    'kuwait': ('KW', '🇰🇼'),
+    'kyrgyz republic': ('KG', '🇰🇬'),
+    'kyrgyzstan': ('KG', '🇰🇬'),
+    'lao people s democratic republic': ('LA', '🇱🇦'),
+    'laos': ('LA', '🇱🇦'),
+    'latvia': ('LV', '🇱🇻'),
+    'lebanese republic': ('LB', '🇱🇧'),
+    'lebanon': ('LB', '🇱🇧'),
+    'lesotho': ('LS', '🇱🇸'),
+    'liberia': ('LR', '🇱🇷'),
+    'libya': ('LY', '🇱🇾'),
+    'liechtenstein': ('LI', '🇱🇮'),
+    'lithuania': ('LT', '🇱🇹'),
+    'luxembourg': ('LU', '🇱🇺'),
+    'macao': ('MO', '🇲🇴'),
+    'macao special administrative region of china': ('MO', '🇲🇴'),
+    'macau': ('MO', '🇲🇴'),
+    'macedonia': ('MK', '🇲🇰'),
+    'madagascar': ('MG', '🇲🇬'),
+    'malawi': ('MW', '🇲🇼'),
+    'malaysia': ('MY', '🇲🇾'),
+    'maldives': ('MV', '🇲🇻'),
+    'mali': ('ML', '🇲🇱'),
+    'malta': ('MT', '🇲🇹'),
+    'marshall islands': ('MH', '🇲🇭'),
+    'martinique': ('MQ', '🇲🇶'),
+    'mauritania': ('MR', '🇲🇷'),
+    'mauritius': ('MU', '🇲🇺'),
+    'mayotte': ('YT', '🇾🇹'),
+    'mexico': ('MX', '🇲🇽'),
+    'micronesia': ('FM', '🇫🇲'),
+    'micronesia federated states of': ('FM', '🇫🇲'),
+    'moldova': ('MD', '🇲🇩'),
+    'moldova republic of': ('MD', '🇲🇩'),
+    'monaco': ('MC', '🇲🇨'),
+    'mongolia': ('MN', '🇲🇳'),
+    'montenegro': ('ME', '🇲🇪'),
+    'montserrat': ('MS', '🇲🇸'),
+    'morocco': ('MA', '🇲🇦'),
+    'mozambique': ('MZ', '🇲🇿'),
+    'myanmar': ('MM', '🇲🇲'),
+    'namibia': ('NA', '🇳🇦'),
+    'nauru': ('NR', '🇳🇷'),
+    'nepal': ('NP', '🇳🇵'),
+    'netherlands': ('NL', '🇳🇱'),
+    'new caledonia': ('NC', '🇳🇨'),
+    'new zealand': ('NZ', '🇳🇿'),
+    'nicaragua': ('NI', '🇳🇮'),
+    'niger': ('NE', '🇳🇪'),
+    'nigeria': ('NG', '🇳🇬'),
+    'niue': ('NU', '🇳🇺'),
+    'norfolk island': ('NF', '🇳🇫'),
+    'north korea': ('KP', '🇰🇵'),
+    'north macedonia': ('MK', '🇲🇰'),
+    'northern ireland': ('GB', '🇬🇧'),
+    'northern mariana islands': ('MP', '🇲🇵'),
+    'norway': ('NO', '🇳🇴'),
+    'oman': ('OM', '🇴🇲'),
+    'pakistan': ('PK', '🇵🇰'),
+    'palau': ('PW', '🇵🇼'),
+    'palestine': ('PS', '🇵🇸'),
+    'palestine state of': ('PS', '🇵🇸'),
+    'panama': ('PA', '🇵🇦'),
+    'papua new guinea': ('PG', '🇵🇬'),
+    'paraguay': ('PY', '🇵🇾'),
+    'people s democratic republic of algeria': ('DZ', '🇩🇿'),
+    'people s republic of bangladesh': ('BD', '🇧🇩'),
+    'people s republic of china': ('CN', '🇨🇳'),
+    'peru': ('PE', '🇵🇪'),
+    'philippines': ('PH', '🇵🇭'),
+    'pitcairn': ('PN', '🇵🇳'),
+    'plurinational state of bolivia': ('BO', '🇧🇴'),
+    'poland': ('PL', '🇵🇱'),
+    'portugal': ('PT', '🇵🇹'),
+    'portuguese republic': ('PT', '🇵🇹'),
+    'principality of andorra': ('AD', '🇦🇩'),
+    'principality of liechtenstein': ('LI', '🇱🇮'),
+    'principality of monaco': ('MC', '🇲🇨'),
+    'province of china taiwan': ('TW', '🇹🇼'),
+    'puerto rico': ('PR', '🇵🇷'),
+    'qatar': ('QA', '🇶🇦'),
+    'republic of albania': ('AL', '🇦🇱'),
+    'republic of angola': ('AO', '🇦🇴'),
+    'republic of armenia': ('AM', '🇦🇲'),
+    'republic of austria': ('AT', '🇦🇹'),
+    'republic of azerbaijan': ('AZ', '🇦🇿'),
+    'republic of belarus': ('BY', '🇧🇾'),
+    'republic of benin': ('BJ', '🇧🇯'),
+    'republic of bosnia and herzegovina': ('BA', '🇧🇦'),
+    'republic of botswana': ('BW', '🇧🇼'),
+    'republic of bulgaria': ('BG', '🇧🇬'),
+    'republic of burundi': ('BI', '🇧🇮'),
+    'republic of cabo verde': ('CV', '🇨🇻'),
+    'republic of cameroon': ('CM', '🇨🇲'),
+    'republic of chad': ('TD', '🇹🇩'),
+    'republic of chile': ('CL', '🇨🇱'),
+    'republic of colombia': ('CO', '🇨🇴'),
+    'republic of costa rica': ('CR', '🇨🇷'),
+    'republic of cote d ivoire': ('CI', '🇨🇮'),
+    'republic of croatia': ('HR', '🇭🇷'),
+    'republic of cuba': ('CU', '🇨🇺'),
+    'republic of cyprus': ('CY', '🇨🇾'),
+    'republic of djibouti': ('DJ', '🇩🇯'),
+    'republic of ecuador': ('EC', '🇪🇨'),
+    'republic of el salvador': ('SV', '🇸🇻'),
+    'republic of equatorial guinea': ('GQ', '🇬🇶'),
+    'republic of estonia': ('EE', '🇪🇪'),
+    'republic of fiji': ('FJ', '🇫🇯'),
+    'republic of finland': ('FI', '🇫🇮'),
+    'republic of ghana': ('GH', '🇬🇭'),
+    'republic of guatemala': ('GT', '🇬🇹'),
+    'republic of guinea': ('GN', '🇬🇳'),
+    'republic of guinea bissau': ('GW', '🇬🇼'),
+    'republic of guyana': ('GY', '🇬🇾'),
+    'republic of haiti': ('HT', '🇭🇹'),
+    'republic of honduras': ('HN', '🇭🇳'),
+    'republic of iceland': ('IS', '🇮🇸'),
+    'republic of india': ('IN', '🇮🇳'),
+    'republic of indonesia': ('ID', '🇮🇩'),
+    'republic of iraq': ('IQ', '🇮🇶'),
+    'republic of kazakhstan': ('KZ', '🇰🇿'),
+    'republic of kenya': ('KE', '🇰🇪'),
+    'republic of kiribati': ('KI', '🇰🇮'),
+    'republic of korea': ('KR', '🇰🇷'),
+    'republic of latvia': ('LV', '🇱🇻'),
+    'republic of liberia': ('LR', '🇱🇷'),
+    'republic of lithuania': ('LT', '🇱🇹'),
+    'republic of madagascar': ('MG', '🇲🇬'),
+    'republic of malawi': ('MW', '🇲🇼'),
+    'republic of maldives': ('MV', '🇲🇻'),
+    'republic of mali': ('ML', '🇲🇱'),
+    'republic of malta': ('MT', '🇲🇹'),
+    'republic of mauritius': ('MU', '🇲🇺'),
+    'republic of moldova': ('MD', '🇲🇩'),
+    'republic of mozambique': ('MZ', '🇲🇿'),
+    'republic of myanmar': ('MM', '🇲🇲'),
+    'republic of namibia': ('NA', '🇳🇦'),
+    'republic of nauru': ('NR', '🇳🇷'),
+    'republic of nicaragua': ('NI', '🇳🇮'),
+    'republic of north macedonia': ('MK', '🇲🇰'),
+    'republic of palau': ('PW', '🇵🇼'),
+    'republic of panama': ('PA', '🇵🇦'),
+    'republic of paraguay': ('PY', '🇵🇾'),
+    'republic of peru': ('PE', '🇵🇪'),
+    'republic of poland': ('PL', '🇵🇱'),
+    'republic of san marino': ('SM', '🇸🇲'),
+    'republic of senegal': ('SN', '🇸🇳'),
+    'republic of serbia': ('RS', '🇷🇸'),
+    'republic of seychelles': ('SC', '🇸🇨'),
+    'republic of sierra leone': ('SL', '🇸🇱'),
+    'republic of singapore': ('SG', '🇸🇬'),
+    'republic of slovenia': ('SI', '🇸🇮'),
+    'republic of south africa': ('ZA', '🇿🇦'),
+    'republic of south sudan': ('SS', '🇸🇸'),
+    'republic of suriname': ('SR', '🇸🇷'),
+    'republic of tajikistan': ('TJ', '🇹🇯'),
+    'republic of the congo': ('CG', '🇨🇬'),
+    'republic of the gambia': ('GM', '🇬🇲'),
+    'republic of the marshall islands': ('MH', '🇲🇭'),
+    'republic of the niger': ('NE', '🇳🇪'),
+    'republic of the philippines': ('PH', '🇵🇭'),
+    'republic of the sudan': ('SD', '🇸🇩'),
+    'republic of trinidad and tobago': ('TT', '🇹🇹'),
+    'republic of tunisia': ('TN', '🇹🇳'),
+    'republic of turkiye': ('TR', '🇹🇷'),
+    'republic of uganda': ('UG', '🇺🇬'),
+    'republic of uzbekistan': ('UZ', '🇺🇿'),
+    'republic of vanuatu': ('VU', '🇻🇺'),
+    'republic of yemen': ('YE', '🇾🇪'),
+    'republic of zambia': ('ZM', '🇿🇲'),
+    'republic of zimbabwe': ('ZW', '🇿🇼'),
+    'reunion': ('RE', '🇷🇪'),
+    'romania': ('RO', '🇷🇴'),
+    'russia': ('RU', '🇷🇺'),
+    'russian federation': ('RU', '🇷🇺'),
+    'rwanda': ('RW', '🇷🇼'),
+    'rwandese republic': ('RW', '🇷🇼'),
+    'saint barthelemy': ('BL', '🇧🇱'),
+    'saint helena': ('SH', '🇸🇭'),
+    'saint helena ascension and tristan da cunha': ('SH', '🇸🇭'),
+    'saint kitts and nevis': ('KN', '🇰🇳'),
+    'saint lucia': ('LC', '🇱🇨'),
+    'saint martin french part': ('MF', '🇲🇫'),
+    'saint pierre and miquelon': ('PM', '🇵🇲'),
+    'saint vincent and the grenadines': ('VC', '🇻🇨'),
+    'samoa': ('WS', '🇼🇸'),
+    'san marino': ('SM', '🇸🇲'),
+    'sao tome and principe': ('ST', '🇸🇹'),
+    'saudi arabia': ('SA', '🇸🇦'),
+    'scotland': ('GB', '🇬🇧'),
+    'senegal': ('SN', '🇸🇳'),
+    'serbia': ('RS', '🇷🇸'),
+    'seychelles': ('SC', '🇸🇨'),
+    'sierra leone': ('SL', '🇸🇱'),
+    'singapore': ('SG', '🇸🇬'),
+    'sint eustatius and saba bonaire': ('BQ', '🇧🇶'),
+    'sint maarten dutch part': ('SX', '🇸🇽'),
+    'slovak republic': ('SK', '🇸🇰'),
+    'slovakia': ('SK', '🇸🇰'),
+    'slovenia': ('SI', '🇸🇮'),
+    'socialist republic of viet nam': ('VN', '🇻🇳'),
+    'solomon islands': ('SB', '🇸🇧'),
+    'somalia': ('SO', '🇸🇴'),
+    'south africa': ('ZA', '🇿🇦'),
+    'south georgia and the south sandwich islands': ('GS', '🇬🇸'),
+    'south korea': ('KR', '🇰🇷'),
+    'south sudan': ('SS', '🇸🇸'),
+    'spain': ('ES', '🇪🇸'),
+    'sri lanka': ('LK', '🇱🇰'),
+    'st kitts and nevis': ('KN', '🇰🇳'),
+    'st lucia': ('LC', '🇱🇨'),
+    'st vincent and the grenadines': ('VC', '🇻🇨'),
+    'state of israel': ('IL', '🇮🇱'),
+    'state of kuwait': ('KW', '🇰🇼'),
+    'state of palestine': ('PS', '🇵🇸'),
+    'state of qatar': ('QA', '🇶🇦'),
+    'sudan': ('SD', '🇸🇩'),
+    'sultanate of oman': ('OM', '🇴🇲'),
+    'suriname': ('SR', '🇸🇷'),
+    'svalbard and jan mayen': ('SJ', '🇸🇯'),
+    'swaziland': ('SZ', '🇸🇿'),
+    'sweden': ('SE', '🇸🇪'),
+    'swiss confederation': ('CH', '🇨🇭'),
+    'switzerland': ('CH', '🇨🇭'),
+    'syria': ('SY', '🇸🇾'),
+    'syrian arab republic': ('SY', '🇸🇾'),
+    'taiwan': ('TW', '🇹🇼'),
+    'taiwan province of china': ('TW', '🇹🇼'),
+    'tajikistan': ('TJ', '🇹🇯'),
+    'tanzania': ('TZ', '🇹🇿'),
+    'tanzania united republic of': ('TZ', '🇹🇿'),
+    'thailand': ('TH', '🇹🇭'),
+    'the bahamas': ('BS', '🇧🇸'),
+    'the democratic republic of the congo': ('CD', '🇨🇩'),
+    'the gambia': ('GM', '🇬🇲'),
+    'the netherlands': ('NL', '🇳🇱'),
+    'the state of eritrea': ('ER', '🇪🇷'),
+    'the state of palestine': ('PS', '🇵🇸'),
+    'timor leste': ('TL', '🇹🇱'),
+    'togo': ('TG', '🇹🇬'),
+    'togolese republic': ('TG', '🇹🇬'),
+    'tokelau': ('TK', '🇹🇰'),
+    'tonga': ('TO', '🇹🇴'),
+    'trinidad and tobago': ('TT', '🇹🇹'),
+    'tunisia': ('TN', '🇹🇳'),
+    'turkey': ('TR', '🇹🇷'),
+    'turkiye': ('TR', '🇹🇷'),
+    'turkmenistan': ('TM', '🇹🇲'),
+    'turks and caicos islands': ('TC', '🇹🇨'),
+    'tuvalu': ('TV', '🇹🇻'),
+    'u s virgin islands': ('VI', '🇻🇮'),
+    'uae': ('AE', '🇦🇪'),
+    'uganda': ('UG', '🇺🇬'),
+    'ukraine': ('UA', '🇺🇦'),
+    'union of the comoros': ('KM', '🇰🇲'),
+    'united arab emirates': ('AE', '🇦🇪'),
+    'united kingdom': ('GB', '🇬🇧'),
+    'united kingdom of great britain and northern ireland': ('GB', '🇬🇧'),
+    'united mexican states': ('MX', '🇲🇽'),
+    'united republic of tanzania': ('TZ', '🇹🇿'),
+    'united states': ('US', '🇺🇸'),
+    'united states minor outlying islands': ('UM', '🇺🇲'),
+    'united states of america': ('US', '🇺🇸'),
+    'uruguay': ('UY', '🇺🇾'),
+    'us virgin islands': ('VI', '🇻🇮'),
+    'usa': ('US', '🇺🇸'),
+    'uzbekistan': ('UZ', '🇺🇿'),
+    'vanuatu': ('VU', '🇻🇺'),
+    'vatican': ('VA', '🇻🇦'),
+    'venezuela': ('VE', '🇻🇪'),
+    'venezuela bolivarian republic of': ('VE', '🇻🇪'),
+    'viet nam': ('VN', '🇻🇳'),
+    'vietnam': ('VN', '🇻🇳'),
+    'virgin islands british': ('VG', '🇻🇬'),
+    'virgin islands of the united states': ('VI', '🇻🇮'),
+    'virgin islands u s': ('VI', '🇻🇮'),
+    'wales': ('GB', '🇬🇧'),
+    'wallis and futuna': ('WF', '🇼🇫'),
+    'western sahara': ('EH', '🇪🇭'),
+    'yemen': ('YE', '🇾🇪'),
+    'zambia': ('ZM', '🇿🇲'),
+    'zimbabwe': ('ZW', '🇿🇼'),
+})
+
+# ISO code -> country name, as PCS spells the nationality where it lists it
+COUNTRY_NAMES = MappingProxyType({
+    'AD': 'Andorra',
+    'AE': 'United Arab Emirates',
+    'AF': 'Afghanistan',
+    'AG': 'Antigua and Barbuda',
+    'AI': 'Anguilla',
+    'AL': 'Albania',
+    'AM': 'Armenia',
+    'AO': 'Angola',
+    'AQ': 'Antarctica',
+    'AR': 'Argentina',
+    'AS': 'American Samoa',
+    'AT': 'Austria',
+    'AU': 'Australia',
+    'AW': 'Aruba',
+    'AX': 'Åland Islands',
+    'AZ': 'Azerbaijan',
+    'BA': 'Bosnia and Herzegovina',
+    'BB': 'Barbados',
+    'BD': 'Bangladesh',
+    'BE': 'Belgium',
+    'BF': 'Burkina Faso',
+    'BG': 'Bulgaria',
+    'BH': 'Bahrain',
+    'BI': 'Burundi',
+    'BJ': 'Benin',
+    'BL': 'Saint Barthélemy',
+    'BM': 'Bermuda',
+    'BN': 'Brunei Darussalam',
+    'BO': 'Bolivia',
+    'BQ': 'Bonaire, Sint Eustatius and Saba',
+    'BR': 'Brazil',
+    'BS': 'Bahamas',
+    'BT': 'Bhutan',
+    'BV': 'Bouvet Island',
+    'BW': 'Botswana',
+    'BY': 'Belarus',
+    'BZ': 'Belize',
+    'CA': 'Canada',
+    'CC': 'Cocos (Keeling) Islands',
+    'CD': 'DR Congo',
+    'CF': 'Central African Republic',
+    'CG': 'Congo',
+    'CH': 'Switzerland',
+    'CI': 'Ivory Coast',
+    'CK': 'Cook Islands',
+    'CL': 'Chile',
+    'CM': 'Cameroon',
+    'CN': 'China',
+    'CO': 'Colombia',
+    'CR': 'Costa Rica',
+    'CU': 'Cuba',
+    'CV': 'Cape Verde',
+    'CW': 'Curaçao',
+    'CX': 'Christmas Island',
+    'CY': 'Cyprus',
+    'CZ': 'Czech Republic',
+    'DE': 'Germany',
+    'DJ': 'Djibouti',
+    'DK': 'Denmark',
+    'DM': 'Dominica',
+    'DO': 'Dominican Republic',
+    'DZ': 'Algeria',
+    'EC': 'Ecuador',
+    'EE': 'Estonia',
+    'EG': 'Egypt',
+    'EH': 'Western Sahara',
+    'ER': 'Eritrea',
+    'ES': 'Spain',
+    'ET': 'Ethiopia',
+    'FI': 'Finland',
+    'FJ': 'Fiji',
+    'FK': 'Falkland Islands (Malvinas)',
+    'FM': 'Micronesia, Federated States of',
+    'FO': 'Faroe Islands',
+    'FR': 'France',
+    'GA': 'Gabon',
+    'GB': 'Great Britain',
+    'GD': 'Grenada',
+    'GE': 'Georgia',
+    'GF': 'French Guiana',
+    'GG': 'Guernsey',
+    'GH': 'Ghana',
+    'GI': 'Gibraltar',
+    'GL': 'Greenland',
+    'GM': 'Gambia',
+    'GN': 'Guinea',
+    'GP': 'Guadeloupe',
+    'GQ': 'Equatorial Guinea',
+    'GR': 'Greece',
+    'GS': 'South Georgia and the South Sandwich Islands',
+    'GT': 'Guatemala',
+    'GU': 'Guam',
+    'GW': 'Guinea-Bissau',
+    'GY': 'Guyana',
+    'HK': 'Hong Kong',
+    'HM': 'Heard Island and McDonald Islands',
+    'HN': 'Honduras',
+    'HR': 'Croatia',
+    'HT': 'Haiti',
+    'HU': 'Hungary',
+    'ID': 'Indonesia',
+    'IE': 'Ireland',
+    'IL': 'Israel',
+    'IM': 'Isle of Man',
+    'IN': 'India',
+    'IO': 'British Indian Ocean Territory',
+    'IQ': 'Iraq',
+    'IR': 'Iran',
+    'IS': 'Iceland',
+    'IT': 'Italy',
+    'JE': 'Jersey',
+    'JM': 'Jamaica',
+    'JO': 'Jordan',
+    'JP': 'Japan',
+    'KE': 'Kenya',
+    'KG': 'Kyrgyzstan',
+    'KH': 'Cambodia',
+    'KI': 'Kiribati',
+    'KM': 'Comoros',
+    'KN': 'Saint Kitts and Nevis',
+    'KP': 'North Korea',
+    'KR': 'South Korea',
+    'KW': 'Kuwait',
+    'KY': 'Cayman Islands',
+    'KZ': 'Kazakhstan',
+    'LA': 'Laos',
+    'LB': 'Lebanon',
+    'LC': 'Saint Lucia',
+    'LI': 'Liechtenstein',
+    'LK': 'Sri Lanka',
+    'LR': 'Liberia',
+    'LS': 'Lesotho',
+    'LT': 'Lithuania',
+    'LU': 'Luxembourg',
+    'LV': 'Latvia',
+    'LY': 'Libya',
+    'MA': 'Morocco',
+    'MC': 'Monaco',
+    'MD': 'Moldova',
+    'ME': 'Montenegro',
+    'MF': 'Saint Martin (French part)',
+    'MG': 'Madagascar',
+    'MH': 'Marshall Islands',
+    'MK': 'North Macedonia',
+    'ML': 'Mali',
+    'MM': 'Myanmar',
+    'MN': 'Mongolia',
+    'MO': 'Macau',
+    'MP': 'Northern Mariana Islands',
+    'MQ': 'Martinique',
+    'MR': 'Mauritania',
+    'MS': 'Montserrat',
+    'MT': 'Malta',
+    'MU': 'Mauritius',
+    'MV': 'Maldives',
+    'MW': 'Malawi',
+    'MX': 'Mexico',
+    'MY': 'Malaysia',
+    'MZ': 'Mozambique',
+    'NA': 'Namibia',
+    'NC': 'New Caledonia',
+    'NE': 'Niger',
+    'NF': 'Norfolk Island',
+    'NG': 'Nigeria',
+    'NI': 'Nicaragua',
+    'NL': 'Netherlands',
+    'NO': 'Norway',
+    'NP': 'Nepal',
+    'NR': 'Nauru',
+    'NU': 'Niue',
+    'NZ': 'New Zealand',
+    'OM': 'Oman',
+    'PA': 'Panama',
+    'PE': 'Peru',
+    'PF': 'French Polynesia',
+    'PG': 'Papua New Guinea',
+    'PH': 'Philippines',
+    'PK': 'Pakistan',
+    'PL': 'Poland',
+    'PM': 'Saint Pierre and Miquelon',
+    'PN': 'Pitcairn',
+    'PR': 'Puerto Rico',
+    'PS': 'Palestine',
+    'PT': 'Portugal',
+    'PW': 'Palau',
+    'PY': 'Paraguay',
+    'QA': 'Qatar',
+    'RE': 'Réunion',
+    'RO': 'Romania',
+    'RS': 'Serbia',
+    'RU': 'Russia',
+    'RW': 'Rwanda',
+    'SA': 'Saudi Arabia',
+    'SB': 'Solomon Islands',
+    'SC': 'Seychelles',
+    'SD': 'Sudan',
+    'SE': 'Sweden',
+    'SG': 'Singapore',
+    'SH': 'Saint Helena, Ascension and Tristan da Cunha',
+    'SI': 'Slovenia',
+    'SJ': 'Svalbard and Jan Mayen',
+    'SK': 'Slovakia',
+    'SL': 'Sierra Leone',
+    'SM': 'San Marino',
+    'SN': 'Senegal',
+    'SO': 'Somalia',
+    'SR': 'Suriname',
+    'SS': 'South Sudan',
+    'ST': 'Sao Tome and Principe',
+    'SV': 'El Salvador',
+    'SX': 'Sint Maarten (Dutch part)',
+    'SY': 'Syria',
+    'SZ': 'Eswatini',
+    'TC': 'Turks and Caicos Islands',
+    'TD': 'Chad',
+    'TF': 'French Southern Territories',
+    'TG': 'Togo',
+    'TH': 'Thailand',
+    'TJ': 'Tajikistan',
+    'TK': 'Tokelau',
+    'TL': 'Timor-Leste',
+    'TM': 'Turkmenistan',
+    'TN': 'Tunisia',
+    'TO': 'Tonga',
+    'TR': 'Turkey',
+    'TT': 'Trinidad and Tobago',
+    'TV': 'Tuvalu',
+    'TW': 'Chinese Taipei',
+    'TZ': 'Tanzania',
+    'UA': 'Ukraine',
+    'UG': 'Uganda',
+    'UM': 'United States Minor Outlying Islands',
+    'US': 'USA',
+    'UY': 'Uruguay',
+    'UZ': 'Uzbekistan',
+    'VA': 'Holy See (Vatican City State)',
+    'VC': 'Saint Vincent and the Grenadines',
+    'VE': 'Venezuela',
+    'VG': 'Virgin Islands, British',
+    'VI': 'Virgin Islands, U.S.',
+    'VN': 'Vietnam',
+    'VU': 'Vanuatu',
+    'WF': 'Wallis and Futuna',
+    'WS': 'Samoa',
+    'XK': 'Kosovo',
+    'YE': 'Yemen',
+    'YT': 'Mayotte',
+    'ZA': 'South Africa',
+    'ZM': 'Zambia',
+    'ZW': 'Zimbabwe',
+})
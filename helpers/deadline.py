@@ -0,0 +1,92 @@
+from contextvars import ContextVar
+import time
+
+# Deadline of the command the current code runs for, see `Deadline.__enter__`
+_current = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is started after the deadline of the command it is done for."""
+
+
+class Deadline:
+    """
+    Time budget of one command, passed from the command down to the services and scrapers.
+
+    Services check it between sub-fetches and stop waiting for sub-fetches when it expires,
+    setting `partial` so the command can mark its answer as incomplete. Inside `with deadline:`
+    (and in worker threads started from there with a copy of the context) the fetcher also
+    refuses to start downloads once the deadline has passed.
+
+    Args:
+        seconds (float | None): Seconds from now until the deadline, None for no deadline.
+        owner (tuple | None): (user id, guild id) the command runs for, which the fair
+            scheduler queues its downloads under.
+    """
+
+    def __init__(self, seconds: float | None, owner: tuple | None = None):
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self.owner = owner
+        self.partial = False
+        self._tokens = []
+
+    def remaining(self) -> float | None:
+        """Seconds left until the deadline, never negative; None without a deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def shorten(self, seconds: float):
+        """Move the deadline to `seconds` from now, unless it is already sooner."""
+        expires_at = time.monotonic() + seconds
+        if self.expires_at is None or expires_at < self.expires_at:
+            self.expires_at = expires_at
+
+    def cancel(self):
+        """Expire the deadline now, e.g. because the user is no longer waiting for the answer."""
+        self.expires_at = time.monotonic()
+
+    def check(self):
+        """
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        if self.expired:
+            self.partial = True
+            raise DeadlineExceeded("The time to answer this command ran out")
+
+    def run(self, function, *args):
+        """Call `function(*args)` with this deadline applied, e.g. in a worker thread."""
+        token = _current.set(self)
+        try:
+            return function(*args)
+        finally:
+            _current.reset(token)
+
+    def __enter__(self):
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _current.reset(self._tokens.pop())
+
+
+def current_deadline() -> Deadline | None:
+    """Return the deadline applied to the current context, if any."""
+    return _current.get()
+
+
+def check_deadline():
+    """
+    Check the deadline applied to the current context, if any.
+
+    Raises:
+        DeadlineExceeded: If it has passed.
+    """
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
@@ -1,6 +1,5 @@
 from constants import MAX_FIELD_LENGTH, MAX_EMBED_DESCRIPTION_LENGTH
 from unidecode import unidecode
-import discord
 import re
 
 def reformat_name(name: str) -> str:
@@ -100,4 +99,33 @@ def ordinal(n: int) -> str:
         suffix = "th"
     else:
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
-    return f"{n}{suffix}"
\ No newline at end of file
+    return f"{n}{suffix}"
+
+def format_roster_table(roster: list[dict], rows: list[dict | None], max_len=MAX_EMBED_DESCRIPTION_LENGTH) -> str:
+    """
+    Render a team roster as a monospaced table for an embed description.
+
+    Args:
+        roster (list[dict]): Roster entries with a "name" key, in display order.
+        rows (list[dict | None]): Row per roster entry as built by `get_roster_row`, None
+            while it is still loading.
+        max_len (int): Maximum length of the result, riders that do not fit are left out.
+
+    Returns:
+        str: The table wrapped in a code block.
+    """
+    lines = [f"{'Rider':<24} {'Age':>3} {'Nationality':<14} {'Pts':>5}"]
+    for rider, row in zip(roster, rows):
+        name = rider["name"][:24]
+        if row is None:
+            lines.append(f"{name:<24} {'…':>3} {'…':<14} {'…':>5}")
+            continue
+        points = row["points"] if row["points"] is not None else "-"
+        lines.append(f"{name:<24} {row['age'] or '-':>3} {(row['nationality'] or '-')[:14]:<14} {points:>5}")
+
+    table = ""
+    for line in lines:
+        if len(table) + len(line) + 8 > max_len:  # keep room for the code fences
+            break
+        table += line + "\n"
+    return f"```\n{table}```"
@@ -0,0 +1,41 @@
+from collections import Counter
+import threading
+
+_counters = Counter()
+_lock = threading.Lock()
+
+
+def increment(name: str, amount: int = 1):
+    """
+    Increase an in-process counter.
+
+    Counter names are dotted paths (e.g., "page_cache.completed_season.hit"), so related
+    counters can be listed together with `counters(prefix)`.
+    """
+    with _lock:
+        _counters[name] += amount
+
+
+def counters(prefix: str = "") -> dict[str, int]:
+    """Return a snapshot of every counter whose name starts with `prefix`."""
+    with _lock:
+        return {name: value for name, value in sorted(_counters.items()) if name.startswith(prefix)}
+
+
+def hit_rates(prefix: str) -> dict[str, tuple[int, int]]:
+    """
+    Group "<prefix>.<class>.hit" / "<prefix>.<class>.miss" counters per class.
+
+    Returns:
+        dict[str, tuple[int, int]]: class -> (hits, misses)
+    """
+    rates = {}
+    for name, value in counters(prefix + ".").items():
+        cls, _, outcome = name[len(prefix) + 1:].rpartition(".")
+        hits, misses = rates.get(cls, (0, 0))
+        if outcome == "hit":
+            hits += value
+        elif outcome == "miss":
+            misses += value
+        rates[cls] = (hits, misses)
+    return rates
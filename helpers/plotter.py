@@ -1,6 +1,23 @@
-import matplotlib.pyplot as plt
 import io
 
+SPECIALITY_COLORS = {
+    "one_day_races": "limegreen",
+    "gc": "red",
+    "time_trial": "deepskyblue",
+    "sprint": "orange",
+    "climber": "mediumpurple",
+    "hills": "hotpink"
+}
+
+SPECIALITY_LABELS = {
+    "one_day_races": "Oneday race",
+    "gc": "GC",
+    "time_trial": "Time Trial",
+    "sprint": "Sprint",
+    "climber": "Climber",
+    "hills": "Hill"
+}
+
 def plot_points_per_speciality_table(points_data: dict, rider_name="Rider"):
     """
     Create a horizontal bar chart styled like a table for a rider's PCS points per speciality.
@@ -20,23 +37,7 @@ def plot_points_per_speciality_table(points_data: dict, rider_name="Rider"):
         io.BytesIO | None: A buffer containing the PNG image of the plot.
             Returns None if `points_data` is empty.
     """
-    SPECIALITY_COLORS = {
-        "one_day_races": "limegreen",
-        "gc": "red",
-        "time_trial": "deepskyblue",
-        "sprint": "orange",
-        "climber": "mediumpurple",
-        "hills": "hotpink"
-    }
-
-    SPECIALITY_LABELS = {
-        "one_day_races": "Oneday race",
-        "gc": "GC",
-        "time_trial": "Time Trial",
-        "sprint": "Sprint",
-        "climber": "Climber",
-        "hills": "Hill"
-    }
+    import matplotlib.pyplot as plt  # imported on first chart, it dominates the bot's startup time
 
     if not points_data:
         return None
@@ -95,6 +96,8 @@ def plot_points_table_style(points_data, rider_name="Rider"):
     Returns:
         io.BytesIO: A buffer containing the PNG image of the plot.
     """
+    import matplotlib.pyplot as plt
+
     seasons = [str(d["season"]) for d in points_data]
     points = [d["points"] for d in points_data]
     ranks = [d["rank"] for d in points_data]
@@ -138,4 +141,67 @@ def plot_points_table_style(points_data, rider_name="Rider"):
     plt.savefig(buffer, format='png', dpi=150)
     plt.close(fig)
     buffer.seek(0)
-    return buffer
\ No newline at end of file
+    return buffer
+
+def plot_rider_comparison_table(rows: list[dict]):
+    """
+    Render the profiles of several riders as one table image.
+
+    Args:
+        rows (list[dict]): Riders as returned by `services.rider_comparison.compare_riders`:
+            "name", "info" (age, height, weight, nationality...) and "points_per_speciality",
+            the latter two None for a rider whose profile could not be loaded.
+
+    Returns:
+        io.BytesIO: A buffer containing the PNG image of the table. The highest points of each
+            speciality are highlighted in its colour.
+    """
+    import matplotlib.pyplot as plt
+
+    specialties = list(SPECIALITY_COLORS.keys())
+    headers = ["Rider", "Age", "Height", "Weight", "Nationality"] + [SPECIALITY_LABELS[s] for s in specialties]
+
+    cells = []
+    for row in rows:
+        info = row["info"] or {}
+        points = row["points_per_speciality"]
+        cells.append(
+            [row["name"]]
+            + [info.get(field) or "-" for field in ("age", "height", "weight", "nationality")]
+            + [str(points.get(s, 0)) if points is not None else "-" for s in specialties]
+        )
+
+    fig, ax = plt.subplots(figsize=(10, 0.4 * len(rows) + 0.8))
+    ax.axis("off")
+    table = ax.table(cellText=cells, colLabels=headers, loc="center", cellLoc="center")
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 1.6)
+    table.auto_set_column_width(range(len(headers)))
+
+    for column in range(len(headers)):
+        header = table[0, column]
+        header.set_text_props(weight="bold")
+        header.set_facecolor("lightgrey")
+
+    # Highlight the best rider of every speciality
+    first_speciality_column = len(headers) - len(specialties)
+    for offset, s in enumerate(specialties):
+        values = [row["points_per_speciality"].get(s, 0) for row in rows if row["points_per_speciality"] is not None]
+        best = max(values, default=0)
+        if best <= 0:
+            continue
+        for index, row in enumerate(rows):
+            if row["points_per_speciality"] is not None and row["points_per_speciality"].get(s, 0) == best:
+                cell = table[index + 1, first_speciality_column + offset]
+                cell.set_facecolor(SPECIALITY_COLORS[s])
+                cell.set_text_props(weight="bold")
+
+    ax.set_title("PCS Rider Comparison", pad=10)
+    plt.tight_layout()
+
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format='png', dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,222 @@
+import asyncio
+import functools
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from pathlib import Path
+
+# Sampler of the command invocation running in the current context, if it is profiled
+_active_sampler = ContextVar("active_sampler", default=None)
+
+
+class _StackSampler(threading.Thread):
+    """
+    Background thread that periodically samples the Python stacks of one command invocation.
+
+    Only the command's own threads are sampled: the event loop thread while it runs the
+    command's coroutine (`command_frame` is on its stack), and the worker threads while they
+    run tasks the command handed to a `ProfiledThreadPoolExecutor` (e.g. `asyncio.to_thread`).
+    Other commands running at the same time do not show up in the profile.
+
+    Samples are aggregated as "folded" stacks (one line per unique stack, frames separated
+    by semicolons, followed by a sample count), which is the input format of flamegraph.pl,
+    inferno and speedscope.
+    """
+
+    def __init__(self, interval: float, command_frame, loop_thread_id: int):
+        super().__init__(name="command-profiler", daemon=True)
+        self.interval = interval
+        self.command_frame = command_frame
+        self.loop_thread_id = loop_thread_id
+        self.samples = Counter()
+        self._workers = Counter()  # thread id -> tasks of the command it is running
+        self._workers_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def track(self, function, *args, **kwargs):
+        """Call `function` in a worker thread, sampling that thread while it runs."""
+        thread_id = threading.get_ident()
+        with self._workers_lock:
+            self._workers[thread_id] += 1
+        token = _active_sampler.set(self)  # tasks this one submits belong to the command too
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _active_sampler.reset(token)
+            with self._workers_lock:
+                self._workers[thread_id] -= 1
+                if not self._workers[thread_id]:
+                    del self._workers[thread_id]
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+            with self._workers_lock:
+                workers = set(self._workers)
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != self.loop_thread_id and thread_id not in workers:
+                    continue
+
+                frames = []
+                in_command = thread_id in workers
+                while frame is not None:
+                    in_command = in_command or frame is self.command_frame
+                    code = frame.f_code
+                    filename = os.path.basename(code.co_filename)
+                    frames.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if not in_command:  # the event loop is running another command or callback
+                    continue
+
+                thread_name = thread_names.get(thread_id, str(thread_id))
+                stack = ";".join([thread_name] + frames[::-1])
+                self.samples[stack] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class ProfiledThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool whose tasks are sampled as part of the profiled command that submitted them.
+
+    Installed as the event loop's default executor (see `CommandProfiler.install`), so the
+    work of `asyncio.to_thread` is attributed to its command, and used by the services that
+    fan out downloads in their own pools. Outside a profiled command it is a plain pool.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        sampler = _active_sampler.get()
+        if sampler is None:
+            return super().submit(fn, *args, **kwargs)
+        return super().submit(sampler.track, fn, *args, **kwargs)
+
+
+class CommandProfiler:
+    """
+    Opt-in sampling profiler for slash command callbacks.
+
+    Each profiled invocation runs a stack sampler for the duration of the callback and
+    writes the collected samples as a flamegraph-ready `.folded` file to `output_dir`.
+    An invocation is kept when it was randomly sampled (`sample_rate`) or when it took
+    longer than `threshold_ms`. Only the newest `max_files` dumps are kept per command.
+    """
+
+    def __init__(self, output_dir="profiles", sample_rate: float = 0.0, threshold_ms: float | None = None,
+                 interval_ms: float = 5.0, max_files: int = 20):
+        self.output_dir = Path(output_dir)
+        self.sample_rate = sample_rate
+        self.threshold_ms = threshold_ms
+        self.interval = interval_ms / 1000
+        self.max_files = max_files
+
+    @classmethod
+    def from_env(cls):
+        """
+        Build a profiler from environment variables.
+
+        Recognised variables:
+            - PROFILE_SAMPLE_RATE: fraction of invocations to profile (0.0 - 1.0).
+            - PROFILE_THRESHOLD_MS: keep every invocation slower than this many milliseconds.
+            - PROFILE_DIR: directory for profile dumps (default "profiles").
+            - PROFILE_INTERVAL_MS: sampling interval (default 5).
+            - PROFILE_MAX_FILES: dumps kept per command (default 20).
+
+        Returns:
+            CommandProfiler: The configured profiler, disabled if neither a sample rate nor
+                a threshold is set.
+        """
+        threshold = os.getenv("PROFILE_THRESHOLD_MS")
+        return cls(
+            output_dir=os.getenv("PROFILE_DIR", "profiles"),
+            sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+            threshold_ms=float(threshold) if threshold else None,
+            interval_ms=float(os.getenv("PROFILE_INTERVAL_MS", "5")),
+            max_files=int(os.getenv("PROFILE_MAX_FILES", "20")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or self.threshold_ms is not None
+
+    def install(self, loop):
+        """Make `loop` run `asyncio.to_thread` work in a pool the profiler can attribute to commands."""
+        if self.enabled:
+            loop.set_default_executor(ProfiledThreadPoolExecutor(thread_name_prefix="asyncio"))
+
+    def wrap(self, command_name: str, callback):
+        """
+        Wrap a command callback so its invocations are profiled.
+
+        Args:
+            command_name (str): Name of the slash command, used in the dump file names.
+            callback (coroutine function): The command callback.
+
+        Returns:
+            coroutine function: The wrapped callback, or `callback` itself when profiling is disabled.
+        """
+        if not self.enabled:
+            return callback
+
+        @functools.wraps(callback)
+        async def wrapper(*args, **kwargs):
+            sampled = random.random() < self.sample_rate
+            if not sampled and self.threshold_ms is None:
+                return await callback(*args, **kwargs)
+
+            sampler = _StackSampler(self.interval, sys._getframe(), threading.get_ident())
+            token = _active_sampler.set(sampler)
+            sampler.start()
+            start = time.perf_counter()
+            try:
+                return await callback(*args, **kwargs)
+            finally:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                _active_sampler.reset(token)  # so the threads below are not sampled themselves
+                # Joining the sampler waits up to one interval and the dump is file I/O, neither
+                # may block the event loop
+                await asyncio.to_thread(sampler.stop)
+                slow = self.threshold_ms is not None and elapsed_ms >= self.threshold_ms
+                if sampled or slow:
+                    await asyncio.to_thread(self._write_dump, command_name, elapsed_ms, sampler.samples)
+
+        return wrapper
+
+    def _write_dump(self, command_name: str, elapsed_ms: float, samples: Counter):
+        if not samples:
+            return
+
+        safe_name = re.sub(r"[^a-z0-9_-]", "_", command_name.lower())
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # The random suffix keeps invocations finishing within the same second apart
+        path = self.output_dir / f"{safe_name}__{time.strftime('%Y%m%d-%H%M%S')}-{int(elapsed_ms)}ms-{uuid.uuid4().hex[:8]}.folded"
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError as e:
+            print(f"Could not write profile for /{command_name}: {e}")
+            return
+
+        print(f"Profiled /{command_name} ({elapsed_ms:.0f} ms) -> {path}")
+        self._rotate(safe_name)
+
+    def _rotate(self, safe_name: str):
+        if self.max_files <= 0:
+            return
+
+        dumps = sorted(self.output_dir.glob(f"{safe_name}__*.folded"), key=lambda p: p.stat().st_mtime)
+        for old in dumps[:-self.max_files]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
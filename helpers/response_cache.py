@@ -0,0 +1,185 @@
+from storage.cache_backend import get_cache
+from helpers.metrics import increment
+from unidecode import unidecode
+import asyncio
+import base64
+import functools
+import io
+import json
+import re
+
+
+def normalize_argument(value):
+    """Normalize a command argument so e.g. "Tadej Pogačar" and " tadej  pogacar" share a cache entry."""
+    if isinstance(value, str):
+        return re.sub(r"\s+", " ", unidecode(value)).strip().lower()
+    return value
+
+
+def _record_message(content, kwargs) -> dict:
+    import discord
+
+    embeds = kwargs.get("embeds") or ([kwargs["embed"]] if kwargs.get("embed") else [])
+    files = kwargs.get("files") or ([kwargs["file"]] if kwargs.get("file") else [])
+
+    recorded_files = []
+    for file in files:
+        data = file.fp.read()
+        file.reset()  # rewind, the file still has to be sent
+        recorded_files.append({"filename": file.filename, "data": base64.b64encode(data).decode("ascii")})
+
+    return {
+        "content": content,
+        "embeds": [embed.to_dict() for embed in embeds if isinstance(embed, discord.Embed)],
+        "files": recorded_files,
+    }
+
+
+def _message_kwargs(message: dict) -> dict:
+    import discord
+
+    kwargs = {}
+    if message["content"] is not None:
+        kwargs["content"] = message["content"]
+    if message["embeds"]:
+        kwargs["embeds"] = [discord.Embed.from_dict(embed) for embed in message["embeds"]]
+    if message["files"]:
+        kwargs["files"] = [discord.File(io.BytesIO(base64.b64decode(file["data"])), filename=file["filename"]) for file in message["files"]]
+    return kwargs
+
+
+def mark_incomplete(interaction):
+    """
+    Keep the response of this command out of the response cache, e.g. because some of its
+    data could not be loaded. Responses cut short by the command's deadline are skipped
+    without this.
+    """
+    interaction.extras["incomplete"] = True
+
+
+class _RecordingResponse:
+    def __init__(self, response, messages):
+        self._response = response
+        self._messages = messages
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    async def send_message(self, content=None, **kwargs):
+        self._messages.append(_record_message(content, kwargs))
+        return await self._response.send_message(content, **kwargs)
+
+
+class _RecordingMessage:
+    """Proxy of a sent follow-up message, recording the edits of a response sent progressively."""
+
+    def __init__(self, message, messages, index):
+        self._message = message
+        self._messages = messages
+        self._index = index
+
+    def __getattr__(self, name):
+        return getattr(self._message, name)
+
+    async def edit(self, **kwargs):
+        recorded = _record_message(kwargs.get("content"), kwargs)
+        message = self._messages[self._index]
+        if "content" in kwargs:
+            message["content"] = recorded["content"]
+        if "embed" in kwargs or "embeds" in kwargs:
+            message["embeds"] = recorded["embeds"]
+        if "attachments" in kwargs or recorded["files"]:
+            message["files"] = recorded["files"]
+        return await self._message.edit(**kwargs)
+
+
+class _RecordingFollowup:
+    def __init__(self, followup, messages):
+        self._followup = followup
+        self._messages = messages
+
+    def __getattr__(self, name):
+        return getattr(self._followup, name)
+
+    async def send(self, content=None, **kwargs):
+        self._messages.append(_record_message(content, kwargs))
+        message = await self._followup.send(content, **kwargs)
+        if message is None:
+            return None
+        return _RecordingMessage(message, self._messages, len(self._messages) - 1)
+
+
+class _RecordingInteraction:
+    """Proxy of an interaction recording every message the command sends through it."""
+
+    def __init__(self, interaction, messages):
+        self._interaction = interaction
+        self.response = _RecordingResponse(interaction.response, messages)
+        self.followup = _RecordingFollowup(interaction.followup, messages)
+
+    def __getattr__(self, name):
+        return getattr(self._interaction, name)
+
+
+class ResponseCache:
+    """
+    Middleware replaying the fully built response of a recent identical command.
+
+    The embeds and attachments a command sends are stored in the shared cache backend for
+    `ttl` seconds, keyed by the command name and its normalized arguments. A repeat within
+    that time is answered from the cache, without scraping, formatting or plotting. It runs in
+    front of `AutoDefer`, so a replay answers inline and a miss is deferred like any other
+    command; the cache backend is queried in a worker thread.
+
+    Only responses in which every message has an embed or attachment are stored; plain text
+    replies are how the commands report errors and missing data. Partial responses, built
+    when the command's deadline (`interaction.extras["deadline"]`) ran out or marked with
+    `mark_incomplete` because some data could not be loaded, are not stored.
+
+    Args:
+        commands (iterable[str]): Names of the commands whose responses may be reused.
+        ttl (float): Seconds a response is reused.
+    """
+
+    def __init__(self, commands, ttl: float = 60):
+        self.commands = set(commands)
+        self.ttl = ttl
+        self.enabled = True
+
+    def key(self, command_name: str, kwargs: dict) -> str:
+        arguments = {name: normalize_argument(value) for name, value in kwargs.items()}
+        return f"response:{command_name}:{json.dumps(arguments, sort_keys=True, ensure_ascii=False)}"
+
+    async def replay(self, interaction, messages: list[dict]):
+        first, *rest = messages
+        await interaction.response.send_message(**_message_kwargs(first))
+        for message in rest:
+            await interaction.followup.send(**_message_kwargs(message))
+
+    def wrap(self, command_name, callback):
+        if command_name not in self.commands:
+            return callback
+
+        @functools.wraps(callback)
+        async def wrapper(interaction, *args, **kwargs):
+            if not self.enabled:
+                return await callback(interaction, *args, **kwargs)
+
+            key = self.key(command_name, kwargs)
+            cached = await asyncio.to_thread(get_cache().get, key)
+            if cached:
+                increment(f"response_cache.{command_name}.hit")
+                await self.replay(interaction, cached)
+                return
+
+            increment(f"response_cache.{command_name}.miss")
+            messages = []
+            result = await callback(_RecordingInteraction(interaction, messages), *args, **kwargs)
+            deadline = interaction.extras.get("deadline")
+            if interaction.extras.get("incomplete") or (deadline is not None and deadline.partial):
+                return result
+            if messages and all(message["embeds"] or message["files"] for message in messages):
+                await asyncio.to_thread(get_cache().set, key, messages, self.ttl)
+            return result
+
+        return wrapper
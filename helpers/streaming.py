@@ -0,0 +1,100 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+_END = object()
+
+
+async def iterate_in_thread(generator_function, *args, buffer: int = 16):
+    """
+    Run a synchronous generator (e.g. a scraper) in a worker thread and yield its items on
+    the event loop as soon as they are produced.
+
+    The worker runs in a copy of the caller's context, blocks once `buffer` items are waiting,
+    and stops when the consumer stops iterating. An exception raised by the generator is
+    re-raised in the consumer.
+
+    Args:
+        generator_function (callable): Function returning the generator to run.
+        *args: Arguments for `generator_function`.
+        buffer (int): Maximum number of produced items waiting to be consumed.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(buffer)
+    stopped = threading.Event()
+
+    def put(item, error=None):
+        asyncio.run_coroutine_threadsafe(queue.put((item, error)), loop).result()
+
+    def produce():
+        try:
+            for item in generator_function(*args):
+                if stopped.is_set():
+                    return
+                put(item)
+        except Exception as e:
+            put(_END, e)
+        else:
+            put(_END)
+
+    producer = loop.run_in_executor(None, contextvars.copy_context().run, produce)
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        stopped.set()
+        while not queue.empty():  # unblock a worker waiting for room in the queue
+            queue.get_nowait()
+        await producer
+
+
+class EmbedStream:
+    """
+    Sends the embeds of a response while they are still being built.
+
+    Every `update` sends the embeds that were not sent yet as follow-up messages and edits
+    the ones that changed. The last embed is the one still growing, so it is edited at most
+    once every `edit_interval` seconds; `finish` sends the final state of every embed.
+
+    Args:
+        interaction (discord.Interaction): A deferred interaction.
+        edit_interval (float): Minimum number of seconds between two edits of the last embed.
+    """
+
+    def __init__(self, interaction, edit_interval: float = 1.0):
+        self.interaction = interaction
+        self.edit_interval = edit_interval
+        self.messages = []
+        self._sent = []  # embed dict per sent message, to skip edits that change nothing
+        self._last_edit = 0
+
+    @property
+    def started(self) -> bool:
+        return bool(self.messages)
+
+    async def update(self, embeds, final: bool = False):
+        for i, embed in enumerate(embeds):
+            data = embed.to_dict()
+            if i >= len(self.messages):
+                self.messages.append(await self.interaction.followup.send(embed=embed, wait=True))
+                self._sent.append(data)
+                self._last_edit = time.monotonic()
+                continue
+
+            if data == self._sent[i]:
+                continue
+            is_growing = i == len(embeds) - 1 and not final
+            if is_growing and time.monotonic() - self._last_edit < self.edit_interval:
+                continue
+            await self.messages[i].edit(embed=embed)
+            self._sent[i] = data
+            self._last_edit = time.monotonic()
+
+    async def finish(self, embeds):
+        await self.update(embeds, final=True)
@@ -1,4 +1,5 @@
 from helpers.format_helper import reformat_name
+from constants import team_base_url
 
 def race_result_url(name: str, season: int) -> str:
     """
@@ -13,6 +14,19 @@ def race_result_url(name: str, season: int) -> str:
     """
     return f"https://www.procyclingstats.com/race/{reformat_name(name)}/{season}/result"
 
+def race_startlist_url(name: str, season: int) -> str:
+    """
+    Build the URL for a race's startlist on ProCyclingStats.
+
+    Args:
+        name (str): The race name (will be reformatted to PCS URL format).
+        season (int): The season year
+
+    Returns:
+        str: The formatted PCS startlist URL.
+    """
+    return f"https://www.procyclingstats.com/race/{reformat_name(name)}/{season}/startlist"
+
 def race_url(name: str) -> str:
     """
         Build the URL for a race result on ProCyclingStats.
@@ -23,4 +37,17 @@ def race_url(name: str) -> str:
         Returns:
             str: The formatted PCS race URL.
         """
-    return f"https://www.procyclingstats.com/race/{reformat_name(name)}"
\ No newline at end of file
+    return f"https://www.procyclingstats.com/race/{reformat_name(name)}"
+
+def team_url(name: str, season: int) -> str:
+    """
+    Build the URL for a team's season page on ProCyclingStats.
+
+    Args:
+        name (str): The team name (will be reformatted to PCS URL format).
+        season (int): The season year
+
+    Returns:
+        str: The formatted PCS team URL.
+    """
+    return f"{team_base_url}{reformat_name(name)}-{season}"
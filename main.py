@@ -1,33 +1,189 @@
-from pcs_scraper.rider_info_scraper import get_rider_age, get_rider_nationality, get_rider_weight, get_rider_height, get_rider_birthdate, get_rider_place_of_birth, get_rider_image_url
-from pcs_scraper.rider_points_scraper import get_points_per_speciality, get_points_per_season
-from pcs_scraper.rider_season_scraper import get_season_results, get_rider_program
-from pcs_scraper.rider_team_history_scraper import get_rider_team_history
-from pcs_scraper.race_result_scraper import get_rider_result_in_race
-from pcs_scraper.race_info_scraper import get_race_flag
-from helpers.plotter import plot_points_table_style, plot_points_per_speciality_table
-from helpers.format_helper import split_text_preserving_lines, ordinal
+import time
+startup_started = time.perf_counter()  # measured before the imports below, to report the time to READY
+
+from pcs_scraper.data_source import get_data_source, configure_data_source_from_env
+from pcs_scraper.rider_info_scraper import is_rider_info_cached, cached_rider_image_url
+from helpers.plotter import plot_points_table_style, plot_points_per_speciality_table, plot_rider_comparison_table
+from helpers.format_helper import reformat_name, split_text_preserving_lines, split_embed_preserving_lines, ordinal, format_roster_table
 from helpers.country_helper import country_to_emoji
+from helpers.command_tree import PCSCommandTree
+from helpers.profiler import CommandProfiler
+from helpers.response_cache import ResponseCache, mark_incomplete
+from helpers.auto_defer import AutoDefer
+from helpers.command_deadlines import CommandDeadlines
+from helpers.streaming import iterate_in_thread, EmbedStream
+from helpers.metrics import counters, hit_rates
+from pcs_scraper.fetcher import configure_from_env, track_page_ages, get_circuit_breaker, is_page_cached
+from pcs_scraper.circuit_breaker import PCSUnavailableError
+from pcs_scraper.fair_scheduler import configure_fair_scheduler_from_env
+from storage.cache_backend import configure_cache_from_env
+from storage.warehouse import configure_warehouse_from_env
+from storage.thumbnail_store import get_thumbnail_store, configure_thumbnails_from_env
 from services.program_comparison import compare_programs
-from services.result_comparison import compare_results
-from services.past_results import get_past_results
-from constants import MAX_FIELD_LENGTH, MAX_EMBED_DESCRIPTION_LENGTH
+from services.rider_comparison import compare_riders, MIN_COMPARED_RIDERS, MAX_COMPARED_RIDERS
+from services.result_comparison import iter_compare_results
+from services.past_results import iter_past_results
+from services.career import get_career
+from services.warehouse_queries import get_race_podiums, get_top_scorers
+from services.team_roster import stream_roster_rows
+from services.startlist_pipeline import enrich_startlist, render_startlist
+from services.race_watcher import RaceWatchRegistry, WATCH_POLL_INTERVAL, DEFAULT_TOP_N, MAX_TOP_N
+from services.program_watcher import ProgramChangeScheduler, PROGRAM_REFRESH_INTERVAL
+from storage.follow_store import get_follow_store
+from helpers.deadline import Deadline, DeadlineExceeded
+from constants import MAX_FIELD_LENGTH, MAX_EMBED_DESCRIPTION_LENGTH, RESPONSE_CACHE_TTL, COMMAND_DEADLINE, rider_base_url
 from discord import app_commands
 from dotenv import load_dotenv
+from datetime import date, datetime, timezone
+import asyncio
 import discord
 import os
+import sqlite3
 
 load_dotenv()
+configure_from_env()
+configure_fair_scheduler_from_env()
+configure_cache_from_env()
+configure_warehouse_from_env()
+configure_data_source_from_env()
+configure_thumbnails_from_env()
 token = os.getenv('DISCORD_TOKEN')
-GUILD_ID = 709429944354341007  # replace with your server ID
 
-class MyClient(discord.Client):
+# Commands are registered globally, unless GUILD_ID is set (e.g. for development, where
+# guild commands update instantly)
+GUILD_ID = os.getenv('GUILD_ID')
+COMMAND_GUILD = discord.Object(id=int(GUILD_ID)) if GUILD_ID else None
+
+# SHARDED=1 runs an AutoShardedClient. Several processes can split the shards between them with
+# SHARD_COUNT and SHARD_IDS (e.g. "0,1"), sharing warm PCS data through CACHE_BACKEND.
+SHARDED = os.getenv('SHARDED', '').lower() in ('1', 'true', 'yes')
+SHARD_COUNT = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+SHARD_IDS = [int(i) for i in os.getenv('SHARD_IDS').split(',')] if os.getenv('SHARD_IDS') else None
+
+def describe_error(error: Exception) -> str:
+    """Explain a failed scrape to users without showing them the raw exception."""
+    if isinstance(error, PCSUnavailableError):
+        return str(error)
+    if isinstance(error, DeadlineExceeded):
+        return "it took too long, or was replaced by a newer command."
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 404:
+        return "ProCyclingStats has no such page, check the spelling."
+    return "an unexpected error occurred."
+
+async def rider_field(name: str, field: str):
+    """Read one field of a rider's info (see `DataSource.rider_info`) off the event loop."""
+    return (await asyncio.to_thread(get_data_source().rider_info, name)).get(field)
+
+def command_deadline(interaction: discord.Interaction) -> Deadline:
+    """
+    Start the time budget of a command, by shortening the deadline `CommandDeadlines` gave it.
+    It is kept in `interaction.extras`, so the response cache can tell a partial answer from a
+    complete one.
+    """
+    deadline = interaction.extras.get("deadline") or Deadline(None)
+    deadline.shorten(COMMAND_DEADLINE)
+    interaction.extras["deadline"] = deadline
+    return deadline
+
+def as_of(page_ages: list[float]):
+    """
+    Time of the oldest PCS page behind a reply, set as the embed timestamp so users can see
+    when a (possibly stale) cached copy was downloaded.
+    """
+    return datetime.fromtimestamp(min(page_ages), timezone.utc) if page_ages else None
+
+# Commands whose response is replayed when the same command and arguments are used again within
+# RESPONSE_CACHE_TTL seconds
+MEMOIZED_COMMANDS = [
+    "rider-image", "team-history", "points-per-season", "points-per-speciality", "season-results",
+    "rider-program", "compare-rider-programs", "compare-rider-season-results", "rider-past-results",
+    "startlist", "compare-riders", "career",
+]
+
+# Commands answered from local state (follow store, warehouse, race pollers, metrics), never deferred
+LOCAL_COMMANDS = {
+    "unfollow-rider", "followed-riders", "watch-race", "unwatch-race", "race-podiums", "top-scorers",
+    "bot-stats",
+}
+# Commands answered from a rider's parsed profile info, or else their profile page
+RIDER_INFO_COMMANDS = {"birthdate", "age", "place-of-birth", "weight", "height", "nationality"}
+# Commands that only need a rider's profile page
+RIDER_PAGE_COMMANDS = {"rider-image", "team-history", "points-per-season", "points-per-speciality", "rider-program"}
+
+class MyClient(discord.AutoShardedClient if SHARDED else discord.Client):
     def __init__(self):
-        super().__init__(intents=discord.Intents.default())
-        self.tree = app_commands.CommandTree(self)
+        if SHARDED:
+            super().__init__(intents=discord.Intents.default(), shard_count=SHARD_COUNT, shard_ids=SHARD_IDS)
+        else:
+            super().__init__(intents=discord.Intents.default())
+        self.profiler = CommandProfiler.from_env()
+        self.response_cache = ResponseCache(MEMOIZED_COMMANDS, RESPONSE_CACHE_TTL)
+        self.auto_defer = AutoDefer(self.is_cached)
+        self.command_deadlines = CommandDeadlines()
+        self.tree = PCSCommandTree(self, middlewares=[self.profiler.wrap, self.response_cache.wrap, self.auto_defer.wrap, self.command_deadlines.wrap])
+        self.race_watches = RaceWatchRegistry(self.post_update, float(os.getenv('WATCH_POLL_INTERVAL', WATCH_POLL_INTERVAL)))
+        self.ready_after = None
+
+    def is_cached(self, command_name: str, kwargs: dict) -> bool:
+        """
+        Whether a command can answer from cached data, and thus inline, see `AutoDefer`. Runs in
+        a worker thread. Replayable responses need no check: `ResponseCache` runs in front of
+        `AutoDefer` and answers those before it is asked.
+        """
+        if command_name in LOCAL_COMMANDS:
+            return True
+        if command_name in RIDER_INFO_COMMANDS and is_rider_info_cached(kwargs["name"]):
+            return True
+        if command_name == "rider-image":
+            image_url = cached_rider_image_url(kwargs["name"])
+            thumbnails = get_thumbnail_store()
+            if thumbnails is not None:  # answers inline only if the thumbnail need not be made
+                return image_url is not None and thumbnails.contains(image_url)
+            if image_url is not None:
+                return True
+        if command_name in RIDER_INFO_COMMANDS | RIDER_PAGE_COMMANDS:
+            return is_page_cached(rider_base_url + reformat_name(kwargs["name"]))
+        return False
+
+    async def post_update(self, channel_id: int, title: str, description: str, content: str = None):
+        """Post an unsolicited update (e.g. a watched race's standings) to a channel."""
+        channel = self.get_channel(channel_id) or await self.fetch_channel(channel_id)
+        await channel.send(content=content, embed=discord.Embed(title=title, description=description, color=0xFFFFFF))
+
+    async def notify_program_change(self, channel_id: int, user_ids: list[int], name: str, change: str, race: dict):
+        verb = "added to" if change == "added" else "dropped from"
+        await self.post_update(
+            channel_id,
+            f"{name} - Program Change",
+            f"{race['date']} - {race['flag']} {race['title']} was {verb} the program.",
+            content=" ".join(f"<@{user_id}>" for user_id in user_ids)
+        )
+
+    async def setup_hook(self):
+        self.profiler.install(asyncio.get_running_loop())
+
+        # Runs once per process, unlike on_ready which also fires on every reconnect.
+        # With several shard processes only the one running shard 0 syncs the commands and
+        # refreshes the followed riders' programs.
+        if SHARD_IDS is not None and 0 not in SHARD_IDS:
+            return
+
+        interval = float(os.getenv('PROGRAM_REFRESH_INTERVAL', PROGRAM_REFRESH_INTERVAL))
+        self.program_scheduler = ProgramChangeScheduler(get_follow_store(), self.notify_program_change, interval)
+        self.program_task = asyncio.create_task(self.program_scheduler.run())
+
+        if await self.tree.sync_if_changed(guild=COMMAND_GUILD):
+            print("Command tree changed, synced with Discord")
+        else:
+            print("Command tree unchanged, skipped sync")
 
     async def on_ready(self):
-        print(f"Logged in as {self.user}")
-        await self.tree.sync(guild=discord.Object(id=GUILD_ID))
+        if self.ready_after is None:
+            self.ready_after = time.perf_counter() - startup_started
+            print(f"Logged in as {self.user}, ready in {self.ready_after:.2f}s")
+        else:
+            print(f"Reconnected as {self.user}")
 
 client = MyClient()
 
@@ -35,11 +191,11 @@ client = MyClient()
 @client.tree.command(
     name="birthdate",
     description="Get the birthdate of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def birthdate(interaction: discord.Interaction, name: str):
-    rider_birthdate = get_rider_birthdate(name)
+    rider_birthdate = await rider_field(name, "date_of_birth")
     if rider_birthdate is None:
         await interaction.response.send_message(f"No birthdate found for '{name}'")
     else:
@@ -49,11 +205,11 @@ async def birthdate(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="age",
     description="Get the age of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def birthdate(interaction: discord.Interaction, name: str):
-    rider_age = get_rider_age(name)
+    rider_age = await rider_field(name, "age")
     if rider_age is None:
         await interaction.response.send_message(f"No age found for '{name}'")
     else:
@@ -63,11 +219,11 @@ async def birthdate(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="place-of-birth",
     description="Get the place of birth of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def place_of_birth(interaction: discord.Interaction, name: str):
-    rider_place_of_birth = get_rider_place_of_birth(name)
+    rider_place_of_birth = await rider_field(name, "place_of_birth")
     if rider_place_of_birth is None:
         await interaction.response.send_message(f"No birth place found for '{name}'")
     else:
@@ -77,11 +233,11 @@ async def place_of_birth(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="weight",
     description="Get the weight of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def weight(interaction: discord.Interaction, name: str):
-    rider_weight = get_rider_weight(name)
+    rider_weight = await rider_field(name, "weight")
     if rider_weight is None:
         await interaction.response.send_message(f"No weight found for '{name}'")
     else:
@@ -91,11 +247,11 @@ async def weight(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="height",
     description="Get the height of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def height(interaction: discord.Interaction, name: str):
-    rider_height = get_rider_height(name)
+    rider_height = await rider_field(name, "height")
     if rider_height is None:
         await interaction.response.send_message(f"No height found for '{name}'")
     else:
@@ -105,11 +261,11 @@ async def height(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="nationality",
     description="Get the nationality of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def nationality(interaction: discord.Interaction, name: str):
-    rider_nationality = get_rider_nationality(name)
+    rider_nationality = await rider_field(name, "nationality")
     flag_nationality = country_to_emoji(rider_nationality)
     if rider_nationality is None:
         await interaction.response.send_message(f"No nationality found for '{name}'")
@@ -120,11 +276,11 @@ async def nationality(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="rider-image",
     description="Get the image of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def rider_image_command(interaction: discord.Interaction, name: str):
-    image_url = get_rider_image_url(name)
+    image_url = await asyncio.to_thread(get_data_source().rider_image_url, name)
 
     if image_url is None:
         await interaction.response.send_message(f"No image found for '{name}'")
@@ -134,23 +290,32 @@ async def rider_image_command(interaction: discord.Interaction, name: str):
             title=f"{name} - Rider Image",
             color=(255 << 16) + (255 << 8) + 255
         )
-        # Set the image
-        embed.set_image(url=image_url)
+        # Set the image, as a small attachment if thumbnails are stored locally
+        kwargs = {}
+        thumbnails = get_thumbnail_store()
+        if thumbnails is not None:
+            try:
+                path = await asyncio.to_thread(thumbnails.get, image_url)
+                kwargs["file"] = discord.File(path, filename="rider.jpg")
+            except Exception as e:
+                print(f"Could not make a thumbnail of {image_url}: {e}")
+        embed.set_image(url="attachment://rider.jpg" if kwargs else image_url)
 
         # Add a footer or description
         embed.set_footer(text="Image from ProCyclingStats")
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.response.send_message(embed=embed, **kwargs)
 
 # team history command
 @client.tree.command(
     name="team-history",
     description="Get the team history of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def team_history_command(interaction: discord.Interaction, name: str):
-    team_history_list = get_rider_team_history(name)  # list of dicts
+    with track_page_ages() as page_ages:
+        team_history_list = await asyncio.to_thread(get_data_source().team_history, name)  # list of dicts
     if not team_history_list:
         await interaction.response.send_message(f"No team history found for '{name}'")
         return
@@ -158,7 +323,8 @@ async def team_history_command(interaction: discord.Interaction, name: str):
     # Create an embed
     embed = discord.Embed(
         title=f"{name} - Team History",
-        color=(255 << 16) + (255 << 8) + 255
+        color=(255 << 16) + (255 << 8) + 255,
+        timestamp=as_of(page_ages)
     )
 
     # Add each season as a field
@@ -184,21 +350,23 @@ async def team_history_command(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="points-per-season",
     description="Get the PCS points scored per season of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def points_per_season_command(interaction: discord.Interaction, name: str):
     try:
-        points_per_season_history = get_points_per_season(name)
+        with track_page_ages() as page_ages:
+            points_per_season_history = await asyncio.to_thread(get_data_source().points_per_season, name)
         if not points_per_season_history:
             await interaction.response.send_message(f"No points history found for '{name}'")
             return
 
-        image_buffer = plot_points_table_style(points_per_season_history, rider_name=name)
+        image_buffer = await asyncio.to_thread(plot_points_table_style, points_per_season_history, rider_name=name)
         file = discord.File(fp=image_buffer, filename="points.png")
         embed = discord.Embed(
             title=f"{name} - PCS Points per Season",
-            color=(255 << 16) + (255 << 8) + 255
+            color=(255 << 16) + (255 << 8) + 255,
+            timestamp=as_of(page_ages)
         )
         embed.set_image(url="attachment://points.png")
         await interaction.response.send_message(embed=embed, file=file)
@@ -211,21 +379,23 @@ async def points_per_season_command(interaction: discord.Interaction, name: str)
 @client.tree.command(
     name="points-per-speciality",
     description="Get the PCS points per speciality of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def points_per_speciality_command(interaction: discord.Interaction, name: str):
     try:
-        points_data = get_points_per_speciality(name)
+        with track_page_ages() as page_ages:
+            points_data = await asyncio.to_thread(get_data_source().points_per_speciality, name)
         if not points_data:
             await interaction.response.send_message(f"No points per speciality found for '{name}'")
             return
 
-        image_buffer = plot_points_per_speciality_table(points_data, rider_name=name)
+        image_buffer = await asyncio.to_thread(plot_points_per_speciality_table, points_data, rider_name=name)
         file = discord.File(fp=image_buffer, filename="speciality_points.png")
         embed = discord.Embed(
             title=f"{name} - PCS Points per Speciality",
-            color=(255 << 16) + (255 << 8) + 255
+            color=(255 << 16) + (255 << 8) + 255,
+            timestamp=as_of(page_ages)
         )
         embed.set_image(url="attachment://speciality_points.png")
         await interaction.response.send_message(embed=embed, file=file)
@@ -235,10 +405,70 @@ async def points_per_speciality_command(interaction: discord.Interaction, name:
         await interaction.response.send_message("An unexpected error occurred while fetching points per speciality.")
 
 # season results command
+SEASON_RESULTS_CHUNK = 5  # races parsed before the first embed is sent and between two updates
+
+def add_race_fields(embed: discord.Embed, race: str, info: dict):
+    """Add the fields describing one race of a rider's season to `embed`."""
+    if "stages" in info:  # Stage race
+        race_line = f"**{race} {info['flag']}**\n{info['date_range']}"
+        stage_lines = []
+        classification_lines = []
+
+        # Handle stages
+        for stage in reversed(info.get("stages", [])):
+            stage_desc = stage.get("description", "")
+            stage_line = (
+                f"{stage_desc}\n"
+                f"• {stage['date']} - {stage['result']} - {stage['distance']} km - "
+                f"{stage['pcs_points']} PCS - {stage['uci_points']} UCI"
+            )
+            stage_lines.append(stage_line)
+
+        # Handle classifications (no date/distance)
+        seen_classes = set()
+        for c in info.get("classifications", []):
+            cname = c['name']
+            if cname.lower() in seen_classes:
+                continue
+            seen_classes.add(cname.lower())
+
+            class_line = (
+                f"{cname}\n"
+                f"• {c['result']} - {c['pcs_points']} PCS - {c['uci_points']} UCI"
+            )
+            classification_lines.append(class_line)
+
+        # Combine into one block
+        value_parts = [race_line]
+        if stage_lines:
+            value_parts.extend(stage_lines)
+        if classification_lines:
+            value_parts.append("\n**Classifications:**")  # Visual header for clarity
+            value_parts.extend(classification_lines)
+
+        value = "\n".join(value_parts)
+
+        # Split into chunks if needed
+        for chunk in split_text_preserving_lines(value):
+            embed.add_field(name="\u200b", value=chunk, inline=False)
+
+    else:  # One-day race
+        value = (
+            f"**{race} {info['flag']}**\n"
+            f"{info['date']} - {info['result']} - {info['distance']} km - "
+            f"{info['pcs_points']} PCS - {info['uci_points']} UCI"
+        )
+
+        if len(value) > MAX_FIELD_LENGTH:
+            for chunk in split_text_preserving_lines(value):
+                embed.add_field(name="\u200b", value=chunk, inline=False)
+        else:
+            embed.add_field(name="\u200b", value=value, inline=False)
+
 @client.tree.command(
     name="season-results",
     description="Get season results of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     name="Full name of the rider",
@@ -247,104 +477,55 @@ async def points_per_speciality_command(interaction: discord.Interaction, name:
 async def season_results_cmd(interaction: discord.Interaction, name: str, season: int):
     await interaction.response.defer()  # defer in case scraping takes time
 
+    def new_embed(title):
+        return discord.Embed(
+            title=title,
+            color=discord.Color.from_rgb(255, 255, 255)
+        )
+
+    # The first embed is sent as soon as a few races are parsed, and grows while the rest arrives
+    stream = EmbedStream(interaction)
+    embeds = [new_embed(f"{name} - {season} Season Results")]
+    current_embed = embeds[0]
+    race_count = 0
+
     try:
-        races = get_season_results(name, season)
+        with track_page_ages() as page_ages:
+            async for race, info in iterate_in_thread(get_data_source().iter_season_results, name, season):
+                add_race_fields(current_embed, race, info)
+                race_count += 1
+                embeds[0].timestamp = as_of(page_ages)
+
+                # Start a new embed before this one hits Discord's limits (6000 characters, 25 fields),
+                # keeping room for the next race
+                if sum(len(f.value) for f in current_embed.fields) >= 5000 or len(current_embed.fields) >= 20:
+                    current_embed = new_embed(f"{name} - Season Results")
+                    embeds.append(current_embed)
+
+                if race_count % SEASON_RESULTS_CHUNK == 0:
+                    await stream.update([embed for embed in embeds if embed.fields])
     except Exception as e:
-        await interaction.followup.send(f"Failed to fetch season results for '{name}': {e}")
+        await interaction.followup.send(f"Failed to fetch season results for '{name}': {describe_error(e)}")
         return
 
-    if not races:
+    if not race_count:
         await interaction.followup.send(f"No season results found for '{name}'.")
         return
 
-    embeds = []
-    current_embed = discord.Embed(
-        title=f"{name} - {season} Season Results",
-        color=discord.Color.from_rgb(255, 255, 255)
-    )
-
-    for race, info in races.items():
-        if "stages" in info:  # Stage race
-            race_line = f"**{race} {info['flag']}**\n{info['date_range']}"
-            stage_lines = []
-            classification_lines = []
-
-            # Handle stages
-            for stage in reversed(info.get("stages", [])):
-                stage_desc = stage.get("description", "")
-                stage_line = (
-                    f"{stage_desc}\n"
-                    f"• {stage['date']} - {stage['result']} - {stage['distance']} km - "
-                    f"{stage['pcs_points']} PCS - {stage['uci_points']} UCI"
-                )
-                stage_lines.append(stage_line)
-
-            # Handle classifications (no date/distance)
-            seen_classes = set()
-            for c in info.get("classifications", []):
-                cname = c['name']
-                if cname.lower() in seen_classes:
-                    continue
-                seen_classes.add(cname.lower())
-
-                class_line = (
-                    f"{cname}\n"
-                    f"• {c['result']} - {c['pcs_points']} PCS - {c['uci_points']} UCI"
-                )
-                classification_lines.append(class_line)
-
-            # Combine into one block
-            value_parts = [race_line]
-            if stage_lines:
-                value_parts.extend(stage_lines)
-            if classification_lines:
-                value_parts.append("\n**Classifications:**")  # Visual header for clarity
-                value_parts.extend(classification_lines)
-
-            value = "\n".join(value_parts)
-
-            # Split into chunks if needed
-            for chunk in split_text_preserving_lines(value):
-                current_embed.add_field(name="\u200b", value=chunk, inline=False)
-
-        else:  # One-day race
-            value = (
-                f"**{race} {info['flag']}**\n"
-                f"{info['date']} - {info['result']} - {info['distance']} km - "
-                f"{info['pcs_points']} PCS - {info['uci_points']} UCI"
-            )
-
-            if len(value) > MAX_FIELD_LENGTH:
-                for chunk in split_text_preserving_lines(value):
-                    current_embed.add_field(name="\u200b", value=chunk, inline=False)
-            else:
-                current_embed.add_field(name="\u200b", value=value, inline=False)
-
-        # If embed is full, push and start new
-        if sum(len(f.value) for f in current_embed.fields) >= 6000:  # embed total limit
-            embeds.append(current_embed)
-            current_embed = discord.Embed(
-                title=f"{name} - Season Results",
-                color=discord.Color.from_rgb(255, 255, 255)
-            )
-
-    embeds.append(current_embed)
-
-    # Send all embeds
-    for embed in embeds:
-        await interaction.followup.send(embed=embed)
+    await stream.finish([embed for embed in embeds if embed.fields])
 
 # rider program command
 @client.tree.command(
     name="rider-program",
     description="Get upcoming program of a rider",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(name="Full name of the rider")
 async def rider_program(interaction: discord.Interaction, name: str):
     await interaction.response.defer()
 
-    races = get_rider_program(name)
+    with track_page_ages() as page_ages:
+        races = await asyncio.to_thread(get_data_source().rider_program, name)
     if not races:
         await interaction.followup.send(f"No race program found for {name}.")
         return
@@ -352,7 +533,8 @@ async def rider_program(interaction: discord.Interaction, name: str):
     # Create a white embed
     embed = discord.Embed(
         title=f"{name} - Race Program",
-        color=(255 << 16) + (255 << 8) + 255  # white
+        color=(255 << 16) + (255 << 8) + 255,  # white
+        timestamp=as_of(page_ages)
     )
 
     # Build the description: "date - flag title"
@@ -368,7 +550,7 @@ async def rider_program(interaction: discord.Interaction, name: str):
 @client.tree.command(
     name="compare-rider-programs",
     description="Compare the upcoming program of 2 riders",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     name1="Full name of the first rider",
@@ -377,7 +559,8 @@ async def rider_program(interaction: discord.Interaction, name: str):
 async def rider_program(interaction: discord.Interaction, name1: str, name2: str):
     await interaction.response.defer()
 
-    comparison = compare_programs(name1, name2)
+    deadline = command_deadline(interaction)
+    comparison = await asyncio.to_thread(compare_programs, name1, name2, deadline)
     if not comparison:
         await interaction.followup.send(f"Comparison between program of {name1} and program of {name2} failed.")
         return
@@ -394,76 +577,209 @@ async def rider_program(interaction: discord.Interaction, name1: str, name2: str
         description += f"**{race['date']} - {race['flag']} {race['title']}**\n"
 
         # Participation line using monospaced text for alignment
-        r1 = "✅" if race["name1_participating"] else "❌"
-        r2 = "✅" if race["name2_participating"] else "❌"
+        r1, r2 = (
+            "❔" if participating is None else "✅" if participating else "❌"
+            for participating in (race["name1_participating"], race["name2_participating"])
+        )
         description += f"`{r1:<2} {name1:<20}`  `{r2:<2} {name2:<20}`\n\n"
 
     embed.description = description.strip()
+    if deadline.partial:
+        embed.set_footer(text="Partial comparison: a program could not be loaded in time (❔).")
 
     await interaction.followup.send(embed=embed)
 
+# rider profile comparison command
+@client.tree.command(
+    name="compare-riders",
+    description="Compare the profiles and speciality points of 2 to 10 riders",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(riders="Full names of the riders, separated by commas")
+async def compare_riders_command(interaction: discord.Interaction, riders: str):
+    names = list(dict.fromkeys(name.strip() for name in riders.split(",") if name.strip()))
+    if not MIN_COMPARED_RIDERS <= len(names) <= MAX_COMPARED_RIDERS:
+        await interaction.response.send_message(
+            f"Give between {MIN_COMPARED_RIDERS} and {MAX_COMPARED_RIDERS} different riders, separated by commas."
+        )
+        return
+
+    await interaction.response.defer()
+
+    deadline = command_deadline(interaction)
+    with track_page_ages() as page_ages:
+        rows = await asyncio.to_thread(compare_riders, names, deadline)
+    if all(not row["info"] for row in rows):
+        await interaction.followup.send(f"No profiles found for {', '.join(names)}.")
+        return
+
+    image_buffer = await asyncio.to_thread(plot_rider_comparison_table, rows)
+    file = discord.File(fp=image_buffer, filename="rider_comparison.png")
+    embed = discord.Embed(
+        title=" vs ".join(names),
+        color=(255 << 16) + (255 << 8) + 255,
+        timestamp=as_of(page_ages)
+    )
+    embed.set_image(url="attachment://rider_comparison.png")
+
+    missing = [row for row in rows if not row["info"]]
+    if deadline.partial:
+        embed.set_footer(text="Partial comparison: some profiles could not be loaded in time.")
+    elif missing:
+        if any(row["error"] for row in missing):
+            mark_incomplete(interaction)
+        embed.set_footer(text="; ".join(
+            f"{row['name']}: {describe_error(row['error']) if row['error'] else 'no profile found'}" for row in missing
+        ))
+
+    await interaction.followup.send(embed=embed, file=file)
+
 # rider season results comparison command
+COMPARISON_CHUNK = 10  # comparison entries built before the first embed is sent and between two updates
+
 @client.tree.command(
     name="compare-rider-season-results",
     description="Compare the season results of 2 riders",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     name1="Full name of the first rider",
     name2="Full name of the second rider",
     season="The year of the season"
 )
-async def compare_results(interaction: discord.Interaction, name1: str, name2: str, season: int):
+async def compare_results_cmd(interaction: discord.Interaction, name1: str, name2: str, season: int):
     await interaction.response.defer()
 
-    comparison = compare_results(name1, name2, season)
-    if not comparison:
-        await interaction.followup.send(f"Comparison between season results of {name1} and {name2} failed.")
-        return
+    def build_embeds(entries, done):
+        # Count wins
+        wins_name1 = sum(1 for entry in entries if entry['winner'] == 'name1')
+        wins_name2 = sum(1 for entry in entries if entry['winner'] == 'name2')
 
-    # Count wins
-    wins_name1 = sum(1 for entry in comparison if entry['winner'] == 'name1')
-    wins_name2 = sum(1 for entry in comparison if entry['winner'] == 'name2')
+        # Start description with head-to-head summary
+        description = f"🏆 **Head-to-Head:** {name1} {wins_name1} - {wins_name2} {name2}\n\n"
 
-    # Start description with head-to-head summary
-    description = f"🏆 **Head-to-Head:** {name1} {wins_name1} - {wins_name2} {name2}\n\n"
+        for entry in entries:
+            race_line = f"**{entry['date']} - {entry['flag']} {entry['race']}**"
+            stage = f" - {entry['stage_or_class']}" if entry['stage_or_class'] else ""
+            description += f"{race_line}{stage}\n"
 
-    for entry in comparison:
-        race_line = f"**{entry['date']} - {entry['flag']} {entry['race']}**"
-        stage = f" - {entry['stage_or_class']}" if entry['stage_or_class'] else ""
-        description += f"{race_line}{stage}\n"
+            n1_res = entry['name1_result']
+            n2_res = entry['name2_result']
 
-        n1_res = entry['name1_result']
-        n2_res = entry['name2_result']
+            if entry['winner'] == 'name1':
+                n1_res = f"{n1_res} 🏆"
+            elif entry['winner'] == 'name2':
+                n2_res = f"{n2_res} 🏆"
 
-        if entry['winner'] == 'name1':
-            n1_res = f"{n1_res} 🏆"
-        elif entry['winner'] == 'name2':
-            n2_res = f"{n2_res} 🏆"
+            description += f"`{name1:<15}: {n1_res:<5}`  `{name2:<15}: {n2_res:<5}`\n\n"
 
-        description += f"`{name1:<15}: {n1_res:<5}`  `{name2:<15}: {n2_res:<5}`\n\n"
+        # Split description if too long
+        description_chunks = split_text_preserving_lines(description, MAX_EMBED_DESCRIPTION_LENGTH)
 
-    # Split description if too long
-    description_chunks = split_text_preserving_lines(description, MAX_EMBED_DESCRIPTION_LENGTH)
+        embeds = []
+        for i, chunk in enumerate(description_chunks):
+            embed = discord.Embed(
+                title=f"{name1} vs {name2} - {season} Season Results Comparison",
+                description=chunk,
+                color=0xFFFFFF
+            )
+            embeds.append(embed)
+
+        if not done:
+            embeds[-1].set_footer(text="Loading more races...")
+        elif deadline.partial:
+            embeds[-1].set_footer(text="Partial results: the remaining races could not be loaded in time.")
+        elif failed:
+            embeds[-1].set_footer(text="Partial results: the remaining races could not be loaded.")
+        return embeds
+
+    # Send the first races while the rest of the comparison is still being built
+    stream = EmbedStream(interaction)
+    comparison = []
+    failed = False
+    deadline = command_deadline(interaction)
+    try:
+        async for entry in iterate_in_thread(iter_compare_results, name1, name2, season, deadline):
+            comparison.append(entry)
+            if len(comparison) % COMPARISON_CHUNK == 0:
+                await stream.update(build_embeds(comparison, done=False))
+    except Exception as e:
+        print(f"Comparing {name1} and {name2} failed: {e}")
+        failed = True
+        mark_incomplete(interaction)
 
-    embeds = []
-    for i, chunk in enumerate(description_chunks):
-        embed = discord.Embed(
-            title=f"{name1} vs {name2} - {season} Season Results Comparison",
-            description=chunk,
-            color=0xFFFFFF
+    if not comparison:
+        if deadline.partial:
+            await interaction.followup.send(f"The season results of {name1} and {name2} could not be loaded in time, please try again.")
+            return
+        await interaction.followup.send(f"Comparison between season results of {name1} and {name2} failed.")
+        return
+
+    await stream.finish(build_embeds(comparison, done=True))
+
+# Rider career command
+def format_totals(totals: dict) -> str:
+    return (
+        f"{totals['wins']} wins, {totals['podiums']} podiums, {totals['top_10s']} top 10s\n"
+        f"{totals['race_days']} race days, {totals['km']:,.0f} km\n"
+        f"{totals['pcs_points']} PCS points, {totals['uci_points']} UCI points"
+    )
+
+@client.tree.command(
+    name="career",
+    description="Show the career totals of a rider over all their seasons",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(name="Full name of the rider")
+async def career_command(interaction: discord.Interaction, name: str):
+    await interaction.response.defer()
+
+    deadline = command_deadline(interaction)
+    try:
+        career = await asyncio.to_thread(get_career, name, deadline)
+    except Exception as e:
+        await interaction.followup.send(f"Failed to fetch the career of '{name}': {describe_error(e)}")
+        return
+    if career is None or not career["seasons"]:
+        if deadline.partial:
+            await interaction.followup.send(f"The career of {name} could not be loaded in time, please try again.")
+        else:
+            await interaction.followup.send(f"No career results found for '{name}'")
+        return
+
+    # One monospaced line per season, newest first
+    lines = [f"{'Season':<6} {'Wins':>4} {'Pod':>4} {'Top10':>5} {'Days':>4} {'km':>6} {'PCS':>5} {'UCI':>5}"]
+    for season in reversed(career["seasons"]):
+        lines.append(
+            f"{season['season']:<6} {season['wins']:>4} {season['podiums']:>4} {season['top_10s']:>5} "
+            f"{season['race_days']:>4} {season['km']:>6.0f} {season['pcs_points']:>5} {season['uci_points']:>5}"
         )
-        embeds.append(embed)
 
-    # Send all embeds
-    for embed in embeds:
-        await interaction.followup.send(embed=embed)
+    embed = discord.Embed(
+        title=f"{name} - Career",
+        description=format_totals(career["total"]) + "\n```\n" + "\n".join(lines) + "\n```",
+        color=(255 << 16) + (255 << 8) + 255
+    )
+    for race_type in career["race_types"]:
+        if race_type["race_days"] or race_type["pcs_points"] or race_type["top_10s"]:
+            embed.add_field(name=race_type["race_type"], value=format_totals(race_type), inline=True)
+
+    notes = []
+    if deadline.partial:
+        notes.append("Partial results: some seasons could not be loaded in time.")
+    if career["missing_seasons"]:
+        mark_incomplete(interaction)
+        notes.append(f"Seasons that could not be loaded: {', '.join(map(str, career['missing_seasons']))}.")
+    if notes:
+        embed.set_footer(text=" ".join(notes))
+
+    await interaction.followup.send(embed=embed)
 
 # Rider past results command
 @client.tree.command(
     name="rider-past-results",
     description="Show the past results of a rider in a given race across seasons",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     name="Full name of the rider",
@@ -472,59 +788,80 @@ async def compare_results(interaction: discord.Interaction, name1: str, name2: s
 async def rider_past_results(interaction: discord.Interaction, name: str, race: str):
     await interaction.response.defer()
 
-    results = get_past_results(name, race)
-    race_flag = get_race_flag(race)
-    rider_nationality = get_rider_nationality(name)
+    deadline = command_deadline(interaction)
+    race_flag, rider_nationality = await asyncio.gather(
+        asyncio.to_thread(get_data_source().race_flag, race),
+        rider_field(name, "nationality")
+    )
     rider_flag = country_to_emoji(rider_nationality)
 
-    if not results:
-        await interaction.followup.send(f"Could not retrieve past results for {name} in {race}.")
-        return
-
     # Embed title with flags
     title = f"{rider_flag} {name} – {race_flag} {race} Past Results"
 
+    def build_embeds(description_lines, done):
+        description = "\n".join(description_lines)
+
+        # Split description if too long
+        description_chunks = split_text_preserving_lines(description, MAX_EMBED_DESCRIPTION_LENGTH)
+
+        embeds = []
+        for chunk in description_chunks:
+            embed = discord.Embed(
+                title=title,
+                description=chunk,
+                color=0xFFFFFF
+            )
+            embeds.append(embed)
+
+        if not done:
+            embeds[-1].set_footer(text="Loading older seasons...")
+        return embeds
+
+    # Seasons arrive newest first; every season with a result is shown right away
+    stream = EmbedStream(interaction)
     description_lines = []
-    for season in sorted(results.keys(), reverse=True):
-        res = results[season]
-        if res:  # Only include seasons where rider had a result
-            # Add medal for top 3
-            medal = ""
-            if res == "1":
-                medal = " 🥇"
-            elif res == "2":
-                medal = " 🥈"
-            elif res == "3":
-                medal = " 🥉"
-
-            description_lines.append(f"**{season}:** {res}{medal}")
+    incomplete = False
+    try:
+        async for season, res in iterate_in_thread(iter_past_results, name, race, deadline):
+            if res:  # Only include seasons where rider had a result
+                # Add medal for top 3
+                medal = ""
+                if res == "1":
+                    medal = " 🥇"
+                elif res == "2":
+                    medal = " 🥈"
+                elif res == "3":
+                    medal = " 🥉"
+
+                description_lines.append(f"**{season}:** {res}{medal}")
+                await stream.update(build_embeds(description_lines, done=False))
+    except Exception as e:
+        print(f"Fetching past results of {name} in {race} failed: {e}")
+        if not stream.started:
+            await interaction.followup.send(f"Could not retrieve past results for {name} in {race}.")
+            return
+        incomplete = True
+        mark_incomplete(interaction)
 
     if not description_lines:
+        if deadline.partial:
+            await interaction.followup.send(f"The past results of {name} in {race} could not be loaded in time, please try again.")
+            return
         await interaction.followup.send(f"No past results available for {name} in {race}.")
         return
 
-    description = "\n".join(description_lines)
-
-    # Split description if too long
-    description_chunks = split_text_preserving_lines(description, MAX_EMBED_DESCRIPTION_LENGTH)
-
-    embeds = []
-    for chunk in description_chunks:
-        embed = discord.Embed(
-            title=title,
-            description=chunk,
-            color=0xFFFFFF
-        )
-        embeds.append(embed)
-
-    for embed in embeds:
-        await interaction.followup.send(embed=embed)
+    embeds = build_embeds(description_lines, done=True)
+    if deadline.partial:
+        embeds[-1].set_footer(text="Partial results: older seasons could not be loaded in time.")
+    elif incomplete:
+        embeds[-1].set_footer(text="Older seasons could not be loaded.")
+    await stream.finish(embeds)
 
 # Rider single race result command
 @client.tree.command(
     name="rider-race-result",
     description="Show the result of a rider in a specific race and season",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     name="Full name of the rider",
@@ -534,7 +871,7 @@ async def rider_past_results(interaction: discord.Interaction, name: str, race:
 async def rider_race_result(interaction: discord.Interaction, name: str, race: str, season: int):
     await interaction.response.defer()
 
-    result = get_rider_result_in_race(name, race, season)
+    result = await asyncio.to_thread(get_data_source().rider_result_in_race, name, race, season)
     if not result:
         await interaction.followup.send(f"{name} did not participate in {race} during {season}.")
         return
@@ -560,7 +897,7 @@ async def rider_race_result(interaction: discord.Interaction, name: str, race: s
 @client.tree.command(
     name="race-flag",
     description="Get the flag emoji of a race",
-    guild=discord.Object(id=GUILD_ID)
+    guild=COMMAND_GUILD
 )
 @app_commands.describe(
     race="Race name (e.g., 'Ronde Van Vlaanderen')"
@@ -569,13 +906,325 @@ async def race_flag_command(interaction: discord.Interaction, race: str):
     await interaction.response.defer()
 
     try:
-        emoji = get_race_flag(race)
+        emoji = await asyncio.to_thread(get_data_source().race_flag, race)
         if not emoji:
             await interaction.followup.send(f"Could not find the flag for {race}.")
             return
 
         await interaction.followup.send(f"The flag for **{race}** is {emoji}")
     except Exception as e:
-        await interaction.followup.send(f"An error occurred while fetching the flag for {race}: {e}")
+        await interaction.followup.send(f"Failed to fetch the flag for {race}: {describe_error(e)}")
+
+# Race podiums command (answered from the local warehouse)
+@client.tree.command(
+    name="race-podiums",
+    description="Show every known podium of a race",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    race="Race name (e.g., 'Ronde Van Vlaanderen')",
+    season="Only show this season (optional)"
+)
+async def race_podiums_command(interaction: discord.Interaction, race: str, season: int = None):
+    try:
+        podiums = await asyncio.to_thread(get_race_podiums, race, season)
+    except sqlite3.Error as e:
+        print(f"Reading the podiums of {race} from the warehouse failed: {e}")
+        await interaction.response.send_message("The results warehouse could not be read, try again later.")
+        return
+    if podiums is None:
+        await interaction.response.send_message("The results warehouse is not enabled on this bot.")
+        return
+    if not podiums:
+        await interaction.response.send_message(f"No podiums of {race} are known yet.")
+        return
+
+    medals = {1: "🥇", 2: "🥈", 3: "🥉"}
+    description = ""
+    for podium in podiums:
+        description += f"**{podium['season']}** {medals[podium['rank']]} {podium['name']}\n"
+
+    embeds = []
+    for chunk in split_text_preserving_lines(description.strip(), MAX_EMBED_DESCRIPTION_LENGTH):
+        embeds.append(discord.Embed(title=f"{race} - Podiums", description=chunk, color=0xFFFFFF))
+
+    await interaction.response.send_message(embeds=embeds[:10])
+
+# Top scorers command (answered from the local warehouse)
+@client.tree.command(
+    name="top-scorers",
+    description="Rank riders by the PCS points they scored in a season",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    names="Comma separated full names of the riders",
+    season="The year of the season"
+)
+async def top_scorers_command(interaction: discord.Interaction, names: str, season: int):
+    rider_names = [name.strip() for name in names.split(",") if name.strip()]
+    try:
+        scorers = await asyncio.to_thread(get_top_scorers, rider_names, season, 25)
+    except sqlite3.Error as e:
+        print(f"Reading the {season} top scorers from the warehouse failed: {e}")
+        await interaction.response.send_message("The results warehouse could not be read, try again later.")
+        return
+    if scorers is None:
+        await interaction.response.send_message("The results warehouse is not enabled on this bot.")
+        return
+    if not scorers:
+        await interaction.response.send_message(f"No {season} PCS points are known yet for these riders.")
+        return
+
+    description = ""
+    for position, scorer in enumerate(scorers, start=1):
+        description += f"**{position}.** {scorer['name']} - {scorer['points']} pts (#{scorer['rank']})\n"
+
+    embed = discord.Embed(
+        title=f"Top PCS Scorers - {season}",
+        description=description.strip(),
+        color=0xFFFFFF
+    )
+    await interaction.response.send_message(embed=embed)
+
+# team roster command
+TEAM_PARTIAL_AFTER = 5  # rows shown in the first, partial embed
+TEAM_EDIT_INTERVAL = 2  # seconds between edits while the remaining rows stream in
+
+@client.tree.command(
+    name="team",
+    description="Get the age, nationality and PCS points of every rider of a team",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    name="Name of the team (e.g., UAE Team Emirates XRG)",
+    season="The year of the season (defaults to the current season)"
+)
+async def team_command(interaction: discord.Interaction, name: str, season: int = None):
+    await interaction.response.defer()
+    season = season or date.today().year
+
+    try:
+        team_name, roster = await asyncio.to_thread(get_data_source().team_roster, name, season)
+    except Exception as e:
+        await interaction.followup.send(f"Failed to fetch the roster of '{name}': {describe_error(e)}")
+        return
+
+    if not roster:
+        await interaction.followup.send(f"No riders found for '{name}' in {season}.")
+        return
+
+    def build_embed(rows, done, stopped=False):
+        embed = discord.Embed(
+            title=f"{team_name} - {season} Roster",
+            description=format_roster_table(roster, rows),
+            color=0xFFFFFF
+        )
+        if stopped:
+            embed.set_footer(text=f"Partial roster: only {done}/{len(roster)} riders could be loaded in time.")
+        elif done < len(roster):
+            embed.set_footer(text=f"Loading riders... {done}/{len(roster)}")
+        return embed
+
+    rows = [None] * len(roster)
+    message = None
+    last_edit = 0
+    done = 0
+    async for index, row in stream_roster_rows(roster, season):
+        rows[index] = row
+        done += 1
+        if done == len(roster):
+            break
+        if message is None and done >= min(TEAM_PARTIAL_AFTER, len(roster)):
+            message = await interaction.followup.send(embed=build_embed(rows, done), wait=True)
+            last_edit = time.monotonic()
+        elif message is not None and time.monotonic() - last_edit >= TEAM_EDIT_INTERVAL:
+            await message.edit(embed=build_embed(rows, done))
+            last_edit = time.monotonic()
+
+    # The stream stops early when the deadline of the command expires
+    stopped = done < len(roster)
+    if message is None:
+        await interaction.followup.send(embed=build_embed(rows, done, stopped))
+    else:
+        await message.edit(embed=build_embed(rows, done, stopped))
+
+# startlist command
+@client.tree.command(
+    name="startlist",
+    description="Get the startlist of a race with each rider's nationality and points per speciality",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    race="Name of the race",
+    season="The year of the race (defaults to the current season)"
+)
+async def startlist_command(interaction: discord.Interaction, race: str, season: int = None):
+    await interaction.response.defer()
+    season = season or date.today().year
+
+    try:
+        startlist = await asyncio.to_thread(get_data_source().startlist, race, season)
+    except Exception as e:
+        await interaction.followup.send(f"Failed to fetch the startlist of '{race}': {describe_error(e)}")
+        return
+
+    if not startlist:
+        await interaction.followup.send(f"No startlist found for '{race}' in {season}.")
+        return
+
+    rows = await enrich_startlist(startlist)
+    chunks = split_embed_preserving_lines(render_startlist(rows))
+    for i, chunk in enumerate(chunks):
+        embed = discord.Embed(
+            title=f"{race} {season} - Startlist ({len(startlist)} riders)" if i == 0 else None,
+            description=chunk,
+            color=0xFFFFFF
+        )
+        await interaction.followup.send(embed=embed)
+
+# rider follow commands
+@client.tree.command(
+    name="follow-rider",
+    description="Get notified in this channel when a rider's race program changes",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(name="Full name of the rider")
+async def follow_rider_command(interaction: discord.Interaction, name: str):
+    await interaction.response.defer()
+
+    def follow():
+        if not get_data_source().rider_info(name).get("nationality"):
+            return False
+        store = get_follow_store()
+        store.follow(interaction.user.id, interaction.channel_id, name)
+        # Store the current program right away, so the first refresh can already report changes
+        if store.program(reformat_name(name)) is None:
+            store.save_program(reformat_name(name), get_data_source().rider_program(name))
+        return True
+
+    if not await asyncio.to_thread(follow):
+        await interaction.followup.send(f"No rider found for '{name}'.")
+        return
+
+    await interaction.followup.send(f"You now follow {name}, changes in their program will be posted here.")
+
+@client.tree.command(
+    name="unfollow-rider",
+    description="Stop the program notifications of a rider",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(name="Full name of the rider")
+async def unfollow_rider_command(interaction: discord.Interaction, name: str):
+    if await asyncio.to_thread(get_follow_store().unfollow, interaction.user.id, name):
+        await interaction.response.send_message(f"You no longer follow {name}.")
+    else:
+        await interaction.response.send_message(f"You do not follow {name}.")
+
+@client.tree.command(
+    name="followed-riders",
+    description="List the riders you follow",
+    guild=COMMAND_GUILD
+)
+async def followed_riders_command(interaction: discord.Interaction):
+    names = await asyncio.to_thread(get_follow_store().user_follows, interaction.user.id)
+    if not names:
+        await interaction.response.send_message("You do not follow any riders, use /follow-rider to start.")
+        return
+
+    embed = discord.Embed(
+        title="Followed Riders",
+        description="\n".join(names),
+        color=0xFFFFFF
+    )
+    await interaction.response.send_message(embed=embed)
+
+# live race watch commands
+@client.tree.command(
+    name="watch-race",
+    description="Post changes in the standings of a running race to this channel",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    race="Name of the race",
+    season="The year of the race (defaults to the current season)",
+    top=f"Number of positions to follow (default {DEFAULT_TOP_N}, max {MAX_TOP_N})"
+)
+async def watch_race_command(interaction: discord.Interaction, race: str, season: int = None, top: int = DEFAULT_TOP_N):
+    season = season or date.today().year
+    poller = client.race_watches.subscribe(race, season, interaction.channel_id, top)
+
+    top = poller.subscribers[interaction.channel_id]
+    description = f"Changes in the top {top} will be posted in this channel."
+    if poller.standings:
+        description += "\n\n" + "\n".join(f"**{rank}.** {name}" for rank, _, name in poller.standings[:top])
+
+    embed = discord.Embed(
+        title=f"Watching {poller.title}",
+        description=description,
+        color=0xFFFFFF
+    )
+    await interaction.response.send_message(embed=embed)
+
+@client.tree.command(
+    name="unwatch-race",
+    description="Stop posting the standings of a race in this channel",
+    guild=COMMAND_GUILD
+)
+@app_commands.describe(
+    race="Name of the race",
+    season="The year of the race (defaults to the current season)"
+)
+async def unwatch_race_command(interaction: discord.Interaction, race: str, season: int = None):
+    season = season or date.today().year
+    if client.race_watches.unsubscribe(race, season, interaction.channel_id):
+        await interaction.response.send_message(f"Stopped watching {race} {season} in this channel.")
+    else:
+        await interaction.response.send_message(f"This channel is not watching {race} {season}.")
+
+@client.tree.command(
+    name="bot-stats",
+    description="Show cache statistics of the bot",
+    guild=COMMAND_GUILD
+)
+async def bot_stats_command(interaction: discord.Interaction):
+    lines = []
+    page_counters = counters("page_cache.")
+    for page_class, (hits, misses) in sorted(hit_rates("page_cache").items()):
+        rate = hits / (hits + misses) * 100 if hits + misses else 0
+        stale = page_counters.get(f"page_cache.{page_class}.stale", 0)
+        lines.append(f"**{page_class.replace('_', ' ')}**: {rate:.0f}% ({hits} hits of which {stale} stale, {misses} misses)")
+
+    embed = discord.Embed(
+        title="Bot Statistics",
+        color=0xFFFFFF
+    )
+    embed.add_field(name="Page cache hit rate", value="\n".join(lines) or "No pages fetched yet.", inline=False)
+
+    lines = []
+    for command_name, (hits, misses) in sorted(hit_rates("response_cache").items()):
+        lines.append(f"**/{command_name}**: {hits / (hits + misses) * 100:.0f}% ({hits} hits, {misses} misses)")
+    embed.add_field(name="Response cache hit rate", value="\n".join(lines) or "No commands used yet.", inline=False)
+
+    paths = {}
+    for counter, value in counters("auto_defer.").items():
+        command_name, _, path = counter[len("auto_defer."):].rpartition(".")
+        paths.setdefault(command_name, {})[path] = value
+    lines = [
+        f"**/{command_name}**: {counts.get('inline', 0)} inline, {counts.get('deferred', 0)} deferred"
+        for command_name, counts in sorted(paths.items(), key=lambda item: -sum(item[1].values()))[:10]
+    ]
+    embed.add_field(name="Inline answers (most used commands)", value="\n".join(lines) or "No commands used yet.", inline=False)
+
+    breaker = get_circuit_breaker()
+    if breaker is not None:
+        circuit = counters("circuit.")
+        embed.add_field(
+            name="PCS connection",
+            value=f"Circuit {breaker.state}, {breaker.failures} consecutive failures\n"
+                  f"Opened {circuit.get('circuit.open', 0)} times, {circuit.get('circuit.rejected', 0)} downloads refused",
+            inline=False
+        )
+    await interaction.response.send_message(embed=embed)
 
-client.run(token)
+if __name__ == "__main__":
+    client.run(token)
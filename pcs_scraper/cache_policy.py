@@ -0,0 +1,119 @@
+from constants import PAGE_CACHE_TTL, CURRENT_SEASON_CACHE_TTL, LIVE_RACE_CACHE_TTL, PAGE_STALE_GRACE, pcs_base_url
+from datetime import date, datetime, timedelta
+import re
+
+# Page classes, used for the cache TTL and for the hit rate metrics
+COMPLETED_SEASON = "completed_season"
+CURRENT_SEASON = "current_season"
+FINISHED_RACE = "finished_race"
+CURRENT_RACE = "current_race"
+RIDER_PROFILE = "rider_profile"
+OTHER = "other"
+
+_SEASON_PAGE = re.compile(r"^rider/[^/]+/(\d{4})$")
+_RACE_RESULT_PAGE = re.compile(r"^race/[^/]+/(\d{4})(/.*)?$")
+# The result of a one-day race or of a single stage: final once its day is over
+_SINGLE_DAY_PAGE = re.compile(r"^race/[^/]+/\d{4}/(result|stage-\d+[a-z]?)(/result)?$")
+_RIDER_PAGE = re.compile(r"^rider/[^/]+$")
+_RACE_DATE = re.compile(r"Date:(?:\s|<[^>]*>)*(\d{1,2} [A-Za-z]+ \d{4})")
+# Only filled in once the winner has crossed the line
+_WINNER_SPEED = re.compile(r"Avg\. speed winner:(?:\s|<[^>]*>)*\d+(?:\.\d+)?\s*km/h")
+_WON_HOW = re.compile(r"Won how:(?:\s|<[^>]*>)*[A-Za-z]")
+
+STAGE_RACE_MAX_DAYS = 24  # a Grand Tour, rest days included, ends within this many days of its first stage
+
+
+def classify_url(url: str) -> str:
+    """
+    Classify a PCS page by what its URL says about the freshness of its content.
+
+    Args:
+        url (str): Absolute PCS URL.
+
+    Returns:
+        str: One of COMPLETED_SEASON, CURRENT_SEASON, FINISHED_RACE, CURRENT_RACE, RIDER_PROFILE or OTHER.
+    """
+    path = url.removeprefix(pcs_base_url).strip("/")
+    current_year = date.today().year
+
+    match = _SEASON_PAGE.match(path)
+    if match:
+        return COMPLETED_SEASON if int(match.group(1)) < current_year else CURRENT_SEASON
+
+    match = _RACE_RESULT_PAGE.match(path)
+    if match:
+        return FINISHED_RACE if int(match.group(1)) < current_year else CURRENT_RACE
+
+    if _RIDER_PAGE.match(path):
+        return RIDER_PROFILE
+
+    return OTHER
+
+
+def race_date(html: str) -> date | None:
+    """Return the date shown in the info list of a PCS race page (e.g. "Date: 6 April 2025"), if any."""
+    match = _RACE_DATE.search(html)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%d %B %Y").date()
+    except ValueError:
+        return None
+
+
+def race_finished(html: str) -> bool:
+    """
+    Tell from its content whether a PCS race result page shows the final result.
+
+    The info list only gets the winner's average speed and how the race was won once the
+    race is over; pages without them count as finished once their date has passed.
+    """
+    if _WINNER_SPEED.search(html) or _WON_HOW.search(html):
+        return True
+    day = race_date(html)
+    return day is not None and day < date.today()
+
+
+def page_ttl(url: str, html: str) -> float | None:
+    """
+    Compute how long a fetched page may be cached.
+
+    Completed seasons and races from earlier years never change again and are cached
+    permanently (None). Of a race of the current season, the result of a one-day race or
+    of a single stage is permanent once its date has passed; any other page (GC, other
+    classifications, startlist) only once the date on it is more than `STAGE_RACE_MAX_DAYS`
+    ago, because a stage race is still running after its first day. Until then the page
+    is refreshed every `LIVE_RACE_CACHE_TTL` seconds. The current season of a rider uses
+    `CURRENT_SEASON_CACHE_TTL`, everything else `PAGE_CACHE_TTL`.
+
+    Args:
+        url (str): Absolute PCS URL of the page.
+        html (str): The fetched page.
+
+    Returns:
+        float | None: TTL in seconds, None for pages that are cached permanently.
+    """
+    page_class = classify_url(url)
+
+    if page_class in (COMPLETED_SEASON, FINISHED_RACE):
+        return None
+    if page_class == CURRENT_SEASON:
+        return CURRENT_SEASON_CACHE_TTL
+    if page_class == CURRENT_RACE:
+        day = race_date(html)
+        if day is None:
+            return LIVE_RACE_CACHE_TTL
+        path = url.removeprefix(pcs_base_url).strip("/")
+        final_after = timedelta(days=0 if _SINGLE_DAY_PAGE.match(path) else STAGE_RACE_MAX_DAYS)
+        return None if day + final_after < date.today() else LIVE_RACE_CACHE_TTL
+    return PAGE_CACHE_TTL
+
+
+def stale_grace(url: str) -> float:
+    """
+    How long after its TTL a page may still be served while it is refreshed in the background.
+
+    Results of races that may be running are never served stale, an old standing is worse
+    than waiting for the new one.
+    """
+    return 0 if classify_url(url) == CURRENT_RACE else PAGE_STALE_GRACE
@@ -0,0 +1,90 @@
+from helpers.metrics import increment
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class PCSUnavailableError(ConnectionError):
+    """Raised when ProCyclingStats cannot be reached; the message can be shown to users."""
+
+    def __init__(self, message: str = "ProCyclingStats is not responding right now, please try again in a few minutes."):
+        super().__init__(message)
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker in front of the downloads from PCS.
+
+    While closed every download is let through. `failure_threshold` consecutive failed or slow
+    (at least `slow_call_duration` seconds) downloads open the circuit: downloads are then
+    refused at once instead of waiting for a timeout. After `reset_timeout` seconds the circuit
+    is half-open and lets a single probe through; the circuit closes when the probe succeeds
+    and opens again when it fails.
+
+    State changes are logged and counted as "circuit.<state>" metrics, refused downloads as
+    "circuit.rejected".
+    """
+
+    def __init__(self, failure_threshold: int = 5, slow_call_duration: float = 5.0, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_call_duration = slow_call_duration
+        self.reset_timeout = reset_timeout
+        self.failures = 0  # consecutive failed or slow downloads
+        self.opened_at = None
+        self._state = CLOSED
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._set_state(HALF_OPEN)
+        return self._state
+
+    def _set_state(self, state: str):
+        if state == self._state:
+            return
+        print(f"PCS circuit breaker {self._state} -> {state} ({self.failures} consecutive failures)")
+        increment(f"circuit.{state}")
+        self._state = state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+
+    def allow(self) -> bool:
+        """Return whether a download may be sent now; a half-open circuit allows one probe at a time."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            increment("circuit.rejected")
+            return False
+
+    def record(self, duration: float, failed: bool = False):
+        """
+        Record the outcome of a download that was allowed.
+
+        Args:
+            duration (float): Seconds the download took.
+            failed (bool): True if PCS could not be reached or answered with a server error.
+        """
+        with self._lock:
+            self._probing = False
+            if failed or duration >= self.slow_call_duration:
+                increment("circuit.failure" if failed else "circuit.slow")
+                self.failures += 1
+                if self._current_state() == HALF_OPEN or self.failures >= self.failure_threshold:
+                    self._set_state(OPEN)
+                    self.opened_at = time.monotonic()
+            else:
+                self.failures = 0
+                self._set_state(CLOSED)
@@ -0,0 +1,186 @@
+from pcs_scraper import rider_info_scraper, rider_points_scraper, rider_season_scraper, rider_team_history_scraper
+from pcs_scraper.race_result_scraper import get_rider_result_in_race
+from pcs_scraper.race_info_scraper import get_race_flag
+from pcs_scraper.team_scraper import get_team_roster
+from pcs_scraper.startlist_scraper import get_startlist
+import os
+
+
+class DataSource:
+    """
+    Where the commands and services get their rider and race data from.
+
+    Implementations must return the same shapes, so commands never depend on how a page is
+    parsed. Every method may download pages and should be called off the event loop.
+    """
+
+    name = None
+
+    def rider_info(self, name: str) -> dict:
+        """
+        Return the rider's personal details.
+
+        Returns:
+            dict: Any of "date_of_birth" (e.g. "21st September 1998"), "age" (e.g. "26"),
+                "weight" (e.g. "66 kg"), "height" (e.g. "1.76 m"), "nationality" (e.g.
+                "Slovenia") and "place_of_birth"; empty if the rider is unknown.
+        """
+        raise NotImplementedError
+
+    def rider_image_url(self, name: str) -> str | None:
+        """Return the absolute URL of the rider's PCS picture."""
+        raise NotImplementedError
+
+    def rider_profile(self, name: str) -> dict:
+        """
+        Return the rider's personal details and points, from one parse of their profile page
+        where the source can.
+
+        Returns:
+            dict: "info" (see `rider_info`), "points_per_speciality" (see `points_per_speciality`)
+                and "points_per_season" (see `points_per_season`).
+        """
+        return {
+            "info": self.rider_info(name),
+            "points_per_speciality": self.points_per_speciality(name),
+            "points_per_season": self.points_per_season(name),
+        }
+
+    def team_history(self, name: str) -> list[dict]:
+        """Return the rider's teams, see `rider_team_history_scraper.get_rider_team_history`."""
+        raise NotImplementedError
+
+    def points_per_season(self, name: str) -> list[dict]:
+        """Return the rider's PCS points and rank per season, see `rider_points_scraper.get_points_per_season`."""
+        raise NotImplementedError
+
+    def points_per_speciality(self, name: str) -> dict[str, int]:
+        """Return the rider's PCS points per speciality (e.g. {"gc": 5210, "sprint": 640})."""
+        raise NotImplementedError
+
+    def iter_season_results(self, name: str, season: int):
+        """
+        Yield the rider's results of a season per race, see `rider_season_scraper.iter_season_results`.
+
+        Yields:
+            tuple[str, dict]: (race title, race data).
+        """
+        raise NotImplementedError
+
+    def season_results(self, name: str, season: int) -> dict:
+        return dict(self.iter_season_results(name, season))
+
+    def rider_program(self, name: str) -> list[dict]:
+        """Return the rider's upcoming races as {"date", "title", "flag"} dicts."""
+        raise NotImplementedError
+
+    def active_seasons(self, name: str) -> list[int]:
+        """Return the seasons in which the rider was active."""
+        raise NotImplementedError
+
+    def rider_result_in_race(self, name: str, race: str, season: int) -> str | None:
+        """Return the rider's rank (e.g. "3" or "DNF") in a race, None if they did not ride it."""
+        raise NotImplementedError
+
+    def race_flag(self, race: str) -> str | None:
+        """Return the flag emoji of the country a race is held in."""
+        raise NotImplementedError
+
+    def team_roster(self, team: str, season: int) -> tuple[str, list[dict[str, str]]]:
+        """Return the team's name and riders in a season, see `team_scraper.get_team_roster`."""
+        raise NotImplementedError
+
+    def startlist(self, race: str, season: int) -> list[dict[str, str]]:
+        """Return the riders starting a race, see `startlist_scraper.get_startlist`."""
+        raise NotImplementedError
+
+
+class ScraperDataSource(DataSource):
+    """Data source backed by the BeautifulSoup scrapers in this package."""
+
+    name = "scrapers"
+
+    def rider_info(self, name):
+        return rider_info_scraper._fetch_rider_info(name)
+
+    def rider_image_url(self, name):
+        return rider_info_scraper.get_rider_image_url(name)
+
+    def rider_profile(self, name):
+        return rider_info_scraper.get_rider_profile(name)
+
+    def team_history(self, name):
+        return rider_team_history_scraper.get_rider_team_history(name)
+
+    def points_per_season(self, name):
+        return rider_points_scraper.get_points_per_season(name)
+
+    def points_per_speciality(self, name):
+        return rider_points_scraper.get_points_per_speciality(name)
+
+    def iter_season_results(self, name, season):
+        return rider_season_scraper.iter_season_results(name, season)
+
+    def rider_program(self, name):
+        return rider_season_scraper.get_rider_program(name)
+
+    def active_seasons(self, name):
+        return rider_info_scraper.get_active_seasons(name)
+
+    def rider_result_in_race(self, name, race, season):
+        return get_rider_result_in_race(name, race, season)
+
+    def race_flag(self, race):
+        return get_race_flag(race)
+
+    def team_roster(self, team, season):
+        return get_team_roster(team, season)
+
+    def startlist(self, race, season):
+        return get_startlist(race, season)
+
+
+_data_source: DataSource = ScraperDataSource()
+
+
+def get_data_source() -> DataSource:
+    """Return the data source used by the commands and services."""
+    return _data_source
+
+
+def set_data_source(data_source: DataSource) -> DataSource:
+    """
+    Replace the data source.
+
+    Returns:
+        DataSource: The previous data source.
+    """
+    global _data_source
+    previous = _data_source
+    _data_source = data_source
+    return previous
+
+
+def configure_data_source_from_env() -> DataSource:
+    """
+    Install the data source selected by the DATA_SOURCE environment variable.
+
+    Sources:
+        - "scrapers" (default): the BeautifulSoup scrapers of this package.
+        - "procyclingstats": the parsers of the `procyclingstats` library, see
+          `procyclingstats_source.ProcyclingstatsDataSource`.
+
+    Returns:
+        DataSource: The installed data source.
+    """
+    source = os.getenv("DATA_SOURCE", "scrapers").lower()
+    if source == "scrapers":
+        data_source = ScraperDataSource()
+    elif source == "procyclingstats":
+        from pcs_scraper.procyclingstats_source import ProcyclingstatsDataSource
+        data_source = ProcyclingstatsDataSource()
+    else:
+        raise ValueError(f"Unknown DATA_SOURCE '{source}', expected scrapers or procyclingstats")
+
+    set_data_source(data_source)
+    return data_source
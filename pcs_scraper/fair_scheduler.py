@@ -0,0 +1,174 @@
+from pcs_scraper.fetcher import get_rate_limiter, set_rate_limiter
+from helpers.deadline import current_deadline
+from helpers.metrics import increment
+from collections import deque
+import os
+import threading
+import time
+
+DEFAULT_USER_QUOTA = 60  # requests a user's commands send to PCS per minute before others go first
+DEFAULT_GUILD_QUOTA = 150  # requests one guild's commands send to PCS per minute before others go first
+QUOTA_WINDOW = 60  # seconds
+POLL_INTERVAL = 1.0  # seconds between deadline checks of a queued download
+
+BACKGROUND = "background"  # flow of downloads not made for a command, e.g. background refreshes
+
+
+class _Ticket:
+    __slots__ = ("tag", "user", "guild")
+
+    def __init__(self, tag: float, user, guild):
+        self.tag = tag
+        self.user = user
+        self.guild = guild
+
+
+class FairScheduler:
+    """
+    Rate limiter handing out PCS request tokens to the waiting downloads in weighted fair order.
+
+    Tokens are refilled like in `RateLimiter`. Every download is queued under the user and
+    guild of the command it is made for, the `owner` of the current `Deadline`; downloads
+    made outside a command share one background flow. A free token goes to the queued
+    download with the smallest virtual finish tag (self-clocked fair queueing). A user's
+    downloads get tags `1 / weight` apart, the weight being 1 divided by the number of users
+    of that guild with queued downloads, so guilds get equal shares that are split equally
+    between their users. A user whose command fans out into many downloads therefore only
+    delays their own downloads.
+
+    On top of that a user that sent `user_quota` or a guild that sent `guild_quota` requests
+    in the last minute (0 for no quota) is over quota: its downloads only get a token when no
+    download within quota is waiting. The quotas are a share of the rate limit that is
+    guaranteed to everyone else, not a cap, so a lone user's cold /startlist of 150 riders
+    still runs at the full rate. Cached pages never reach the scheduler. A queued download
+    whose deadline expires or is cancelled leaves the queue and raises `DeadlineExceeded`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, user_quota: int = DEFAULT_USER_QUOTA, guild_quota: int = DEFAULT_GUILD_QUOTA):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.user_quota = user_quota
+        self.guild_quota = guild_quota
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+        self._queue: list[_Ticket] = []
+        self._virtual_time = 0.0
+        self._last_tags = {}  # user -> finish tag of their last queued download
+        self._sent = {}  # ("user" | "guild", id) -> deque of send times within the quota window
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def _enqueue(self, owner) -> _Ticket:
+        if owner is None:
+            user = guild = BACKGROUND
+        else:
+            user, guild = owner
+            guild = guild if guild is not None else f"dm:{user}"
+
+        users_in_guild = {ticket.user for ticket in self._queue if ticket.guild == guild} | {user}
+        tag = max(self._virtual_time, self._last_tags.get(user, 0.0)) + len(users_in_guild)
+        self._last_tags[user] = tag
+        ticket = _Ticket(tag, user, guild)
+        self._queue.append(ticket)
+        return ticket
+
+    def _quota_wait(self, ticket: _Ticket, now: float) -> float:
+        """Seconds until `ticket` is within the quotas of its user and guild, 0 if it is now."""
+        wait = 0.0
+        for key, quota in ((("user", ticket.user), self.user_quota), (("guild", ticket.guild), self.guild_quota)):
+            sent = self._sent.get(key)
+            if not quota or ticket.user == BACKGROUND or not sent:
+                continue
+            while sent and sent[0] <= now - QUOTA_WINDOW:
+                sent.popleft()
+            if len(sent) >= quota:
+                wait = max(wait, sent[0] + QUOTA_WINDOW - now)
+        return wait
+
+    def _dispatch(self, ticket: _Ticket, now: float):
+        self._tokens -= 1
+        self._virtual_time = ticket.tag
+        self._queue.remove(ticket)
+        if ticket.user != BACKGROUND:
+            self._sent.setdefault(("user", ticket.user), deque()).append(now)
+            self._sent.setdefault(("guild", ticket.guild), deque()).append(now)
+
+    def _forget_idle(self, user, guild):
+        """Drop the bookkeeping of a user and guild without queued downloads."""
+        if any(ticket.user == user for ticket in self._queue):
+            return
+        if self._last_tags.get(user, 0.0) <= self._virtual_time:
+            self._last_tags.pop(user, None)
+        for key in (("user", user), ("guild", guild)):
+            sent = self._sent.get(key)
+            if sent is not None and (not sent or sent[-1] <= time.monotonic() - QUOTA_WINDOW):
+                del self._sent[key]
+
+    def acquire(self):
+        """
+        Take one token for the current command, blocking until it is this download's turn.
+
+        Raises:
+            DeadlineExceeded: If the command's deadline passed while the download was queued.
+        """
+        deadline = current_deadline()
+        with self._condition:
+            ticket = self._enqueue(deadline.owner if deadline is not None else None)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+
+                    # Downloads over quota only go when no download within quota is waiting
+                    own_wait = self._quota_wait(ticket, now)
+                    within_quota = [queued for queued in self._queue if self._quota_wait(queued, now) == 0]
+                    is_next = min(within_quota or self._queue, key=lambda queued: queued.tag) is ticket
+                    if is_next and self._tokens >= 1:
+                        self._dispatch(ticket, now)
+                        return
+
+                    if deadline is not None and deadline.expired:
+                        increment("scheduler.cancelled")
+                        deadline.check()
+
+                    timeout = POLL_INTERVAL  # woken earlier when another download leaves the queue
+                    if is_next:
+                        timeout = min(timeout, (1 - self._tokens) / self.rate)
+                    elif own_wait:
+                        timeout = min(timeout, own_wait)
+                    if deadline is not None and deadline.remaining() is not None:
+                        timeout = min(timeout, deadline.remaining())
+                    self._condition.wait(timeout)
+            finally:
+                if ticket in self._queue:
+                    self._queue.remove(ticket)
+                self._forget_idle(ticket.user, ticket.guild)
+                self._condition.notify_all()
+
+
+def configure_fair_scheduler_from_env() -> FairScheduler | None:
+    """
+    Replace the installed rate limiter by a `FairScheduler` with the same rate and burst.
+
+    PCS_USER_QUOTA and PCS_GUILD_QUOTA set the requests per minute of one user and one guild
+    after which the downloads of others go first (0 for no quota). Nothing is installed when downloads are not rate limited, e.g. in replay mode.
+
+    Returns:
+        FairScheduler | None: The installed scheduler.
+    """
+    limiter = get_rate_limiter()
+    if limiter is None:
+        return None
+
+    scheduler = FairScheduler(
+        limiter.rate,
+        limiter.burst,
+        int(os.getenv("PCS_USER_QUOTA", DEFAULT_USER_QUOTA)),
+        int(os.getenv("PCS_GUILD_QUOTA", DEFAULT_GUILD_QUOTA)),
+    )
+    set_rate_limiter(scheduler)
+    return scheduler
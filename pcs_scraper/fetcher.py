@@ -0,0 +1,417 @@
+from pcs_scraper.cache_policy import classify_url, page_ttl, stale_grace
+from pcs_scraper.rate_limiter import RateLimiter
+from pcs_scraper.circuit_breaker import OPEN, CircuitBreaker, PCSUnavailableError
+from storage.cache_backend import get_cache
+from helpers.metrics import increment
+from helpers.deadline import check_deadline
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+import atexit
+import os
+import threading
+import time
+
+DEFAULT_ARCHIVE_PATH = "recordings/pcs_archive.json.gz"
+DEFAULT_RATE_LIMIT = 5  # requests per second
+DEFAULT_RATE_BURST = 10
+DEFAULT_TIMEOUT = 10  # seconds to wait for PCS to connect and to send data
+DEFAULT_BREAKER_FAILURES = 5
+DEFAULT_BREAKER_SLOW_CALL = 5  # seconds
+DEFAULT_BREAKER_RESET = 30  # seconds
+
+
+def requests_transport(url: str) -> str:
+    """
+    Download a page from ProCyclingStats over HTTP.
+
+    Args:
+        url (str): Absolute URL of the page.
+
+    Returns:
+        str: The page's HTML.
+
+    Raises:
+        requests.HTTPError: If PCS answers with an error status.
+        requests.Timeout: If PCS does not answer within the configured timeout.
+    """
+    import requests
+
+    result = requests.get(url, timeout=_timeout)
+    result.raise_for_status()
+    return result.text
+
+
+def requests_bytes_transport(url: str) -> bytes:
+    """Download a binary file from ProCyclingStats over HTTP, see `requests_transport`."""
+    import requests
+
+    result = requests.get(url, timeout=_timeout)
+    result.raise_for_status()
+    return result.content
+
+
+_transport = requests_transport
+_bytes_transport = requests_bytes_transport
+_timeout = DEFAULT_TIMEOUT
+_rate_limiter = RateLimiter(DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST)
+_circuit_breaker = CircuitBreaker(DEFAULT_BREAKER_FAILURES, DEFAULT_BREAKER_SLOW_CALL, DEFAULT_BREAKER_RESET)
+
+# Background refreshes of stale pages, at most one per URL at a time
+_refresh_executor = ThreadPoolExecutor(2, thread_name_prefix="pcs-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+# Fetch times of the pages served in the current context, see `track_page_ages`
+_page_ages = ContextVar("page_ages", default=None)
+
+
+def set_transport(transport):
+    """
+    Replace the function used by every scraper to download pages.
+
+    Args:
+        transport (callable): Function taking an absolute URL and returning the page's HTML.
+
+    Returns:
+        callable: The previously installed transport, so callers can restore it.
+    """
+    global _transport
+    previous = _transport
+    _transport = transport
+    return previous
+
+
+def set_bytes_transport(transport):
+    """
+    Replace the function `fetch_bytes` downloads binary files (e.g. pictures) with.
+
+    Returns:
+        callable: The previously installed transport.
+    """
+    global _bytes_transport
+    previous = _bytes_transport
+    _bytes_transport = transport
+    return previous
+
+
+def set_rate_limiter(rate_limiter):
+    """
+    Replace the rate limiter every page download waits for.
+
+    Args:
+        rate_limiter (RateLimiter | None): The new limiter, None to disable rate limiting.
+
+    Returns:
+        RateLimiter | None: The previous limiter.
+    """
+    global _rate_limiter
+    previous = _rate_limiter
+    _rate_limiter = rate_limiter
+    return previous
+
+
+def get_rate_limiter():
+    """Return the installed rate limiter, None if downloads are not rate limited."""
+    return _rate_limiter
+
+
+def set_circuit_breaker(circuit_breaker):
+    """
+    Replace the circuit breaker guarding the downloads.
+
+    Args:
+        circuit_breaker (CircuitBreaker | None): The new breaker, None to disable it.
+
+    Returns:
+        CircuitBreaker | None: The previous breaker.
+    """
+    global _circuit_breaker
+    previous = _circuit_breaker
+    _circuit_breaker = circuit_breaker
+    return previous
+
+
+def get_circuit_breaker():
+    """Return the installed circuit breaker, None if it is disabled."""
+    return _circuit_breaker
+
+
+def configure_from_env():
+    """
+    Install the transport selected by the PCS_HTTP_MODE environment variable, and the rate
+    limiter configured by PCS_RATE_LIMIT (requests per second, 0 to disable) and PCS_RATE_BURST.
+
+    PCS_TIMEOUT sets the seconds a download may wait for PCS. The circuit breaker opens after
+    PCS_BREAKER_FAILURES consecutive failed downloads or downloads slower than
+    PCS_BREAKER_SLOW_CALL seconds, and probes PCS again after PCS_BREAKER_RESET seconds.
+
+    Modes:
+        - "live" (default): keep the installed transport, which downloads from procyclingstats.com.
+        - "record": download pages and store every response in the PCS_HTTP_ARCHIVE file,
+          written when the process exits (or `HttpArchive.close` is called).
+        - "replay": answer only from the PCS_HTTP_ARCHIVE file, without network access.
+          URLs missing from the archive fail with `ArchiveMissError` and are listed at exit.
+
+    Returns:
+        HttpArchive | None: The archive in use, or None in live mode.
+    """
+    rate = float(os.getenv("PCS_RATE_LIMIT", DEFAULT_RATE_LIMIT))
+    burst = int(os.getenv("PCS_RATE_BURST", DEFAULT_RATE_BURST))
+    set_rate_limiter(RateLimiter(rate, burst) if rate > 0 else None)
+
+    global _timeout
+    _timeout = float(os.getenv("PCS_TIMEOUT", DEFAULT_TIMEOUT))
+    set_circuit_breaker(CircuitBreaker(
+        int(os.getenv("PCS_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURES)),
+        float(os.getenv("PCS_BREAKER_SLOW_CALL", DEFAULT_BREAKER_SLOW_CALL)),
+        float(os.getenv("PCS_BREAKER_RESET", DEFAULT_BREAKER_RESET)),
+    ))
+
+    mode = os.getenv("PCS_HTTP_MODE", "live").lower()
+    if mode == "live":
+        return None
+
+    if mode not in ("record", "replay"):
+        raise ValueError(f"Unknown PCS_HTTP_MODE '{mode}', expected live, record or replay")
+
+    from pcs_scraper.http_archive import HttpArchive, recording_transport, replay_transport
+
+    archive = HttpArchive(os.getenv("PCS_HTTP_ARCHIVE", DEFAULT_ARCHIVE_PATH))
+    if mode == "record":
+        set_transport(recording_transport(archive, _timeout))
+        set_bytes_transport(recording_transport(archive, _timeout, binary=True))
+        atexit.register(archive.close)
+        print(f"Recording PCS responses to {archive.path}")
+    else:
+        set_transport(replay_transport(archive))
+        set_bytes_transport(replay_transport(archive, binary=True))
+        set_rate_limiter(None)  # nothing is downloaded
+        set_circuit_breaker(None)
+        atexit.register(archive.report_missing)
+        print(f"Replaying PCS responses from {archive.path} ({len(archive.entries)} recorded pages)")
+    return archive
+
+
+@contextmanager
+def track_page_ages():
+    """
+    Collect the fetch time of every page served inside the `with` block.
+
+    The list is shared with worker threads started from the block with a copy of the
+    context (e.g. `asyncio.to_thread`), so commands can tell how old the data they show is.
+
+    Yields:
+        list[float]: UNIX timestamps at which the served pages were downloaded.
+    """
+    ages = []
+    token = _page_ages.set(ages)
+    try:
+        yield ages
+    finally:
+        _page_ages.reset(token)
+
+
+def _note_age(fetched_at: float):
+    ages = _page_ages.get()
+    if ages is not None:
+        ages.append(fetched_at)
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a download failed because PCS is unreachable or broken, rather than e.g. a 404."""
+    import requests
+
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status >= 500 or status == 429
+    return isinstance(error, OSError)
+
+
+def _call_pcs(request, *args):
+    """
+    Send a request to PCS through the rate limiter and the circuit breaker.
+
+    Raises:
+        DeadlineExceeded: If the deadline of the current command passed before the request
+            could be sent.
+        PCSUnavailableError: If the circuit is open, or PCS could not be reached.
+    """
+    check_deadline()
+    if _rate_limiter is not None:
+        _rate_limiter.acquire()
+        check_deadline()
+    breaker = _circuit_breaker
+    if breaker is not None and not breaker.allow():
+        raise PCSUnavailableError()
+
+    start = time.monotonic()
+    try:
+        result = request(*args)
+    except Exception as e:
+        outage = _is_outage(e)
+        if breaker is not None:
+            breaker.record(time.monotonic() - start, failed=outage)
+        if outage:
+            raise PCSUnavailableError() from e
+        raise
+    if breaker is not None:
+        breaker.record(time.monotonic() - start)
+    return result
+
+
+def _download(url: str) -> str:
+    return _call_pcs(_transport, url)
+
+
+def fetch_bytes(url: str) -> bytes:
+    """
+    Download a binary file from PCS (e.g. a rider's picture) through the rate limiter and the
+    circuit breaker. Unlike pages, files are not cached; they are recorded and replayed like
+    pages in the record and replay modes.
+
+    Raises:
+        requests.HTTPError: If PCS answers with an error status.
+        PCSUnavailableError: If PCS could not be reached.
+    """
+    return _call_pcs(_bytes_transport, url)
+
+
+def _store_page(url: str, html: str) -> dict:
+    """Store a downloaded page, kept for its TTL plus the stale grace period."""
+    now = time.time()
+    ttl = page_ttl(url, html)
+    entry = {"html": html, "fetched_at": now, "fresh_until": now + ttl if ttl is not None else None}
+    get_cache().set(f"page:{url}", entry, ttl + stale_grace(url) if ttl is not None else None)
+    return entry
+
+
+def _refresh(url: str):
+    try:
+        _store_page(url, _download(url))
+    except Exception as e:
+        print(f"Background refresh of {url} failed: {e}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(url)
+
+
+def _refresh_in_background(url: str):
+    with _refreshing_lock:
+        if url in _refreshing:
+            return
+        _refreshing.add(url)
+    _refresh_executor.submit(_refresh, url)
+
+
+def fetch_html(url: str) -> str:
+    """
+    Fetch the HTML of a ProCyclingStats page through the installed transport.
+
+    Pages are kept in the shared cache backend, so every scraper (and every shard using the
+    same backend) reuses a page fetched by another. How long depends on the page's content,
+    see `cache_policy.page_ttl`; hits and misses are counted per page class. Downloads wait
+    for the rate limiter, cache hits do not.
+
+    A page whose TTL has passed is still served during `cache_policy.stale_grace`, while a
+    single background download per URL refreshes it (stale-while-revalidate). While the
+    circuit breaker is open, stale pages are served without trying to refresh them.
+
+    Args:
+        url (str): Absolute URL of the page.
+
+    Returns:
+        str: The page's HTML.
+
+    Raises:
+        PCSUnavailableError: If the page is not cached and PCS cannot be reached.
+    """
+    page_class = classify_url(url)
+
+    entry = get_cache().get(f"page:{url}")
+    if isinstance(entry, dict):
+        increment(f"page_cache.{page_class}.hit")
+        if entry["fresh_until"] is not None and entry["fresh_until"] <= time.time():
+            increment(f"page_cache.{page_class}.stale")
+            # While PCS is down the stale copy is all there is, a refresh would be refused
+            if _circuit_breaker is None or _circuit_breaker.state != OPEN:
+                _refresh_in_background(url)
+        _note_age(entry["fetched_at"])
+        return entry["html"]
+
+    increment(f"page_cache.{page_class}.miss")
+    entry = _store_page(url, _download(url))
+    _note_age(entry["fetched_at"])
+    return entry["html"]
+
+
+def is_page_cached(url: str) -> bool:
+    """Return whether `fetch_html(url)` can answer from the cache, possibly with a stale copy."""
+    return get_cache().contains(f"page:{url}")
+
+
+def fetch_if_changed(url: str, validators: dict | None = None) -> tuple[str | None, dict]:
+    """
+    Download a page that is polled for changes, skipping the page cache lookup.
+
+    With the live transport the ETag / Last-Modified validators of the previous response are
+    sent along, so PCS can answer "304 Not Modified" without a body when nothing changed.
+    Other transports (record/replay, benchmarks) have no validators and download as usual.
+    A changed page is stored in the page cache, so other commands see it too.
+
+    Args:
+        url (str): Absolute URL of the page.
+        validators (dict | None): Validators returned by the previous call for this URL.
+
+    Returns:
+        tuple[str | None, dict]: The page's HTML, or None if it did not change, and the
+            validators to pass on the next call.
+
+    Raises:
+        PCSUnavailableError: If the circuit breaker is open or PCS cannot be reached.
+    """
+    validators = validators or {}
+    if _transport is requests_transport:
+        import requests
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        def conditional_get():
+            result = requests.get(url, headers=headers, timeout=_timeout)
+            if result.status_code != 304:
+                result.raise_for_status()
+            return result
+
+        result = _call_pcs(conditional_get)
+        if result.status_code == 304:
+            increment("conditional_fetch.not_modified")
+            return None, validators
+        html = result.text
+        validators = {"etag": result.headers.get("ETag"), "last_modified": result.headers.get("Last-Modified")}
+    else:
+        html = _download(url)
+
+    increment("conditional_fetch.modified")
+    _store_page(url, html)
+    return html, validators
+
+
+def fetch_document(url: str):
+    """
+    Fetch a ProCyclingStats page and parse it.
+
+    BeautifulSoup is imported on first use, so importing the scrapers stays cheap at startup.
+
+    Args:
+        url (str): Absolute URL of the page.
+
+    Returns:
+        bs4.BeautifulSoup: The parsed document.
+    """
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(fetch_html(url), "html.parser")
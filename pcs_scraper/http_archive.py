@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+from pathlib import Path
+import base64
+import gzip
+import json
+import os
+import threading
+import requests
+
+
+class ArchiveMissError(LookupError):
+    """Raised in replay mode when a requested URL was never recorded."""
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Hold an exclusive lock on `path` + ".lock" against other processes, where the OS supports it."""
+    try:
+        import fcntl
+    except ImportError:  # Windows: no lock, the atomic replace still prevents torn files
+        yield
+        return
+
+    with open(path.with_name(path.name + ".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class HttpArchive:
+    """
+    Gzip-compressed JSON archive of recorded PCS responses, keyed by URL.
+
+    Each entry stores the HTTP status, reason and the response body (base64 encoded for binary
+    files such as pictures), so error pages (e.g. a 404 for an unknown rider) replay exactly
+    like they were recorded.
+
+    Recorded responses are kept in memory and written by `close`, which merges them into the
+    archive on disk under a file lock, so several recording processes (e.g. the workers of
+    `tools.batch`) can share one archive without overwriting each other's responses.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries = self._load()
+        self.missing = set()
+        self._recorded = {}  # entries added since the last `close`
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def add(self, url: str, status: int, reason: str, body: str | bytes):
+        """Store a response; it is written to disk by `close`."""
+        entry = {"status": status, "reason": reason}
+        if isinstance(body, bytes):
+            entry["body_base64"] = base64.b64encode(body).decode("ascii")
+        else:
+            entry["body"] = body
+        with self._lock:
+            self.entries[url] = entry
+            self._recorded[url] = entry
+
+    def close(self):
+        """Merge the responses recorded by this process into the archive on disk."""
+        with self._lock:
+            if not self._recorded:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _file_lock(self.path):
+                entries = self._load()  # may have been extended by another process
+                entries.update(self._recorded)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            print(f"Recorded {len(self._recorded)} PCS responses to {self.path}")
+            self._recorded.clear()
+
+    def response(self, url: str) -> requests.Response:
+        """
+        Rebuild the recorded response for `url`.
+
+        Raises:
+            ArchiveMissError: If `url` is not in the archive. The URL is remembered in `missing`.
+        """
+        entry = self.entries.get(url)
+        if entry is None:
+            with self._lock:
+                self.missing.add(url)
+            raise ArchiveMissError(f"No recorded response for {url} in {self.path}")
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason")
+        if "body_base64" in entry:
+            response._content = base64.b64decode(entry["body_base64"])
+        else:
+            response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        return response
+
+    def report_missing(self):
+        """Print every URL that was requested in replay mode but is not in the archive."""
+        if not self.missing:
+            return
+        print(f"{len(self.missing)} URL(s) missing from {self.path}:")
+        for url in sorted(self.missing):
+            print(f"  {url}")
+
+
+def recording_transport(archive: HttpArchive, timeout: float = 10, binary: bool = False):
+    """
+    Build a transport that fetches pages live and stores every response in `archive`.
+
+    With `binary`, the transport returns (and records) the raw bytes instead of the text.
+    """
+    def transport(url: str) -> str | bytes:
+        result = requests.get(url, timeout=timeout)
+        archive.add(url, result.status_code, result.reason, result.content if binary else result.text)
+        result.raise_for_status()
+        return result.content if binary else result.text
+    return transport
+
+
+def replay_transport(archive: HttpArchive, binary: bool = False):
+    """Build a transport that answers exclusively from `archive`, without any network access."""
+    def transport(url: str) -> str | bytes:
+        result = archive.response(url)
+        result.raise_for_status()
+        return result.content if binary else result.text
+    return transport
@@ -0,0 +1,143 @@
+from pcs_scraper.data_source import ScraperDataSource
+from pcs_scraper.fetcher import fetch_html
+from helpers.format_helper import reformat_name, ordinal
+from helpers.country_helper import country_code_to_emoji, country_code_to_name
+from helpers.url_formatter import race_result_url, race_url
+from storage.warehouse import get_warehouse
+from constants import rider_base_url, pcs_base_url
+from datetime import date
+import calendar
+
+
+def _parse(parser, *args):
+    """
+    Call a `procyclingstats` parser, returning None when it fails.
+
+    The library raises IndexError, AttributeError, ValueError... when the markup differs from
+    what it expects; a field it cannot parse is left out instead of failing the command.
+    """
+    try:
+        return parser(*args)
+    except Exception:
+        return None
+
+
+class ProcyclingstatsDataSource(ScraperDataSource):
+    """
+    Data source parsing PCS pages with the `procyclingstats` library (selectolax based) instead
+    of the BeautifulSoup scrapers.
+
+    Pages are still downloaded with `fetcher.fetch_html`, so the page cache, rate limiter and
+    circuit breaker apply to both sources. The library's results are converted to the shapes
+    of `DataSource`. Data the library has no parser for (season results grouped per race, race
+    programs, active seasons) comes from the inherited scrapers, as do team rosters and
+    startlists, whose rider slugs and display names the scrapers already return in the shape
+    the commands need.
+    """
+
+    name = "procyclingstats"
+
+    def _page(self, scraper_class, url: str):
+        """Parse `url` with a `procyclingstats` scraper class, None if the library rejects the page."""
+        return _parse(scraper_class, url, fetch_html(url), False)
+
+    def _rider(self, name: str):
+        from procyclingstats import Rider
+
+        return self._page(Rider, rider_base_url + reformat_name(name))
+
+    def rider_info(self, name):
+        return self._rider_info(self._rider(name))
+
+    def _rider_info(self, rider) -> dict:
+        if rider is None:
+            return {}
+
+        info = {}
+        birthdate = _parse(rider.birthdate)  # "1998-9-21"
+        if birthdate:
+            year, month, day = (int(part) for part in birthdate.split("-"))
+            info["date_of_birth"] = f"{ordinal(day)} {calendar.month_name[month]} {year}"
+            today = date.today()
+            info["age"] = str(today.year - year - ((today.month, today.day) < (month, day)))
+
+        weight = _parse(rider.weight)
+        if weight:
+            info["weight"] = f"{weight:g} kg"
+        height = _parse(rider.height)
+        if height:
+            info["height"] = f"{height:g} m"
+
+        nationality = country_code_to_name(_parse(rider.nationality))
+        if nationality:
+            info["nationality"] = nationality
+        place_of_birth = _parse(rider.place_of_birth)
+        if place_of_birth:
+            info["place_of_birth"] = place_of_birth
+        return info
+
+    def rider_profile(self, name):
+        rider = self._rider(name)
+        return {
+            "info": self._rider_info(rider),
+            "points_per_speciality": self._points_per_speciality(rider),
+            "points_per_season": self._points_per_season(rider),
+        }
+
+    def rider_image_url(self, name):
+        rider = self._rider(name)
+        image_url = _parse(rider.image_url) if rider else None
+        return pcs_base_url + image_url if image_url else None
+
+    def team_history(self, name):
+        rider = self._rider(name)
+        history = (_parse(rider.teams_history) if rider else None) or []
+
+        warehouse = get_warehouse()
+        if warehouse and history:
+            warehouse.upsert_team_history(name, history)
+        return history
+
+    def points_per_season(self, name):
+        ranking = self._points_per_season(self._rider(name))
+
+        warehouse = get_warehouse()
+        if warehouse and ranking:
+            warehouse.upsert_season_points(name, ranking)
+        return ranking
+
+    def _points_per_season(self, rider) -> list[dict]:
+        ranking = (_parse(rider.points_per_season_history) if rider else None) or []
+        return [{"season": row["season"], "points": int(row["points"] or 0), "rank": int(row["rank"] or 0)} for row in ranking]
+
+    def points_per_speciality(self, name):
+        return self._points_per_speciality(self._rider(name))
+
+    def _points_per_speciality(self, rider) -> dict:
+        return (_parse(rider.points_per_speciality) if rider else None) or {}
+
+    def rider_result_in_race(self, name, race, season):
+        from procyclingstats import Stage
+
+        stage = self._page(Stage, race_result_url(race, season))
+        results = (_parse(stage.results, "rider_url", "rider_name", "rank", "status") if stage else None) or []
+
+        all_results = []  # (rider slug, rider name, rank), as stored by the scraper
+        for row in results:
+            slug = row["rider_url"].lower().split("rider/")[-1].split("/")[0]
+            rank = str(row["rank"]) if row["rank"] is not None else row["status"]
+            all_results.append((slug, row["rider_name"], rank))
+
+        warehouse = get_warehouse()
+        if warehouse and all_results:
+            warehouse.upsert_race_results(race, season, all_results)
+
+        normalized_input = name.lower().replace(" ", "-")
+        return next((rank for slug, _, rank in all_results if normalized_input in slug), None)
+
+    def race_flag(self, race):
+        from procyclingstats import Race
+
+        page = self._page(Race, race_url(race))
+        code = _parse(page.nationality) if page else None
+        return country_code_to_emoji(code) if code else None
@@ -1,13 +1,10 @@
 from helpers.country_helper import get_flag_emoji_from_html
 from helpers.url_formatter import race_url
-from bs4 import BeautifulSoup
-import requests
+from pcs_scraper.fetcher import fetch_document
 
 def get_race_flag(race: str):
     url = race_url(race)
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
 
     container = doc.find("div", class_="page-title")
     emoji = get_flag_emoji_from_html(container)
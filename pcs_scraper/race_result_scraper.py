@@ -1,33 +1,25 @@
 from helpers.url_formatter import race_result_url
-from bs4 import BeautifulSoup
-import requests
+from pcs_scraper.fetcher import fetch_document
+from storage.warehouse import get_warehouse
 
-def get_rider_result_in_race(name: str, race: str, season: int) -> str | None:
+def result_rows(doc):
     """
-    Retrieve the finish position of a given rider in a specific race & season.
+    Iterate over the rows of the results table of a parsed PCS race result page.
 
     Args:
-        name (str): Rider's full name in natural order (e.g. "Mathieu van der Poel").
-        race (str): Race name (will be formatted for PCS).
-        season (int): The year of the race.
+        doc (bs4.BeautifulSoup): The race result page.
 
-    Returns:
-        str | None: The rider's finish position (rank) as text, or None if not found.
+    Yields:
+        tuple[str, str, str]: (rider slug, rider name as shown on PCS, rank) per rider, in
+            the order of the table. Nothing is yielded if the page has no results table.
     """
-    normalized_input = name.lower().replace(" ", "-")
-
-    url = race_result_url(race, season)
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
-
     container = doc.find("div", class_="borderbox w68 left mb_w100")
     if not container:
-        return None
+        return
 
     table = container.find("table", class_="results")
     if not table:
-        return None
+        return
 
     for row in table.find("tbody").find_all("tr"):
         rider_cell = row.find("td", class_="ridername")
@@ -39,7 +31,43 @@ def get_rider_result_in_race(name: str, race: str, season: int) -> str | None:
             continue
 
         href = rider_link.get("href", "").lower()  # e.g. "rider/mathieu-van-der-poel"
-        if normalized_input in href:
-            return row.find("td").get_text(strip=True)  # rank column
+        slug = href.split("rider/")[-1].split("/")[0]
+        rank = row.find("td").get_text(strip=True)  # rank column
+        yield slug, rider_link.get_text(" ", strip=True), rank
+
+def get_rider_result_in_race(name: str, race: str, season: int) -> str | None:
+    """
+    Retrieve the finish position of a given rider in a specific race & season.
+
+    When a warehouse is configured, the results of every rider on the page are stored in it.
+
+    Args:
+        name (str): Rider's full name in natural order (e.g. "Mathieu van der Poel").
+        race (str): Race name (will be formatted for PCS).
+        season (int): The year of the race.
+
+    Returns:
+        str | None: The rider's finish position (rank) as text, or None if not found.
+    """
+    normalized_input = name.lower().replace(" ", "-")
+
+    url = race_result_url(race, season)
+    doc = fetch_document(url)
+
+    warehouse = get_warehouse()
+    all_results = []  # (rider slug, rider name, rank), only collected for the warehouse
+    rider_result = None
+
+    for slug, rider_name, rank in result_rows(doc):
+        if warehouse:
+            all_results.append((slug, rider_name, rank))
+
+        if rider_result is None and normalized_input in slug:
+            rider_result = rank
+            if not warehouse:
+                break
+
+    if warehouse and all_results:
+        warehouse.upsert_race_results(race, season, all_results)
 
-    return None
\ No newline at end of file
+    return rider_result
\ No newline at end of file
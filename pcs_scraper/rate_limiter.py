@@ -0,0 +1,65 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests are sent to PCS.
+
+    Up to `burst` requests may be sent at once, after which requests are spread out at
+    `rate` per second. `acquire` blocks the calling thread until a token is available, so
+    scrapers running concurrently in worker threads share one request budget.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedRateLimiter:
+    """
+    Token bucket like `RateLimiter`, shared by several processes.
+
+    The bucket lives in shared memory, so the workers of a process pool draw from one request
+    budget. Create it in the parent process and hand it to the workers when they start, e.g.
+    through the `initializer` of a `ProcessPoolExecutor`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        import multiprocessing
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = multiprocessing.Value("d", float(self.burst), lock=False)
+        self._updated = multiprocessing.Value("d", time.monotonic(), lock=False)
+        self._lock = multiprocessing.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens = min(self.burst, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if tokens >= 1:
+                    self._tokens.value = tokens - 1
+                    return
+                self._tokens.value = tokens
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
@@ -1,48 +1,24 @@
 from helpers.format_helper import reformat_name
-from constants import rider_base_url, pcs_base_url
-from bs4 import BeautifulSoup
-import requests
+from constants import rider_base_url, pcs_base_url, RIDER_INFO_CACHE_TTL, RIDER_IMAGE_CACHE_TTL
+from pcs_scraper.fetcher import fetch_document
+from pcs_scraper.rider_points_scraper import parse_points_per_speciality, parse_points_per_season
+from storage.cache_backend import get_cache
 
-_rider_cache = {}  # in-memory cache
-
-def _fetch_rider_info(name: str):
+def parse_rider_info(doc) -> dict | None:
     """
-    Fetch and parse rider information from ProCyclingStats (PCS).
+    Extract the personal details from a parsed PCS rider page.
 
-    This function scrapes the rider's PCS page for personal details such as
-    date of birth, age, weight, height, nationality, and place of birth.
-    Results are cached in `_rider_cache` to avoid repeated network requests.
-
-    Parameters:
-    name : str
-        Full name of the rider (e.g., "Tadej Pogačar").
+    Args:
+        doc (bs4.BeautifulSoup): The rider's PCS page.
 
     Returns:
-    dict
-        Dictionary containing rider information with keys:
-            - "date_of_birth" : str, e.g., "21st September 1998"
-            - "age"           : str, e.g., "26"
-            - "weight"        : str, e.g., "66 kg"
-            - "height"        : str, e.g., "1.76 m"
-            - "nationality"   : str, e.g., "Slovenia"
-            - "place_of_birth": str, e.g., "Klanec"
-
-        Returns an empty dictionary if the rider's information cannot be found.
+        dict | None: The fields described in `_fetch_rider_info`, or None if the page has
+            no rider information.
     """
-    if name in _rider_cache:
-        return _rider_cache[name]
-
-    pcs_name = reformat_name(name)
-    url = rider_base_url + pcs_name
-
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
     container = doc.find("div", class_="borderbox left w65")
 
     if not container:
-        print(f"No results found for {name} at {url}")
-        return {}
+        return None
 
     rider_info = {}
 
@@ -69,9 +45,91 @@ def _fetch_rider_info(name: str):
             elif label == "place of birth":
                 rider_info["place_of_birth"] = values[-1]
 
-    _rider_cache[name] = rider_info
     return rider_info
 
+def parse_rider_image_url(doc) -> str | None:
+    """Return the absolute URL of the picture on a parsed PCS rider page, None if it has none."""
+    img = doc.find("img")
+    return pcs_base_url + img["src"] if img and img.get("src") else None
+
+def _cache_rider_image_url(pcs_name: str, image_url: str | None):
+    if image_url is not None:
+        get_cache().set(f"rider_image:{pcs_name}", image_url, RIDER_IMAGE_CACHE_TTL)
+
+def _fetch_rider_info(name: str):
+    """
+    Fetch and parse rider information from ProCyclingStats (PCS).
+
+    This function scrapes the rider's PCS page for personal details such as
+    date of birth, age, weight, height, nationality, and place of birth.
+    Results are kept in the shared cache backend for `RIDER_INFO_CACHE_TTL` seconds
+    to avoid repeated network requests.
+
+    Parameters:
+    name : str
+        Full name of the rider (e.g., "Tadej Pogačar").
+
+    Returns:
+    dict
+        Dictionary containing rider information with keys:
+            - "date_of_birth" : str, e.g., "21st September 1998"
+            - "age"           : str, e.g., "26"
+            - "weight"        : str, e.g., "66 kg"
+            - "height"        : str, e.g., "1.76 m"
+            - "nationality"   : str, e.g., "Slovenia"
+            - "place_of_birth": str, e.g., "Klanec"
+
+        Returns an empty dictionary if the rider's information cannot be found.
+    """
+    pcs_name = reformat_name(name)
+    cache_key = f"rider_info:{pcs_name}"
+    cached = get_cache().get(cache_key)
+    if cached is not None:
+        return cached
+
+    url = rider_base_url + pcs_name
+
+    doc = fetch_document(url)
+    rider_info = parse_rider_info(doc)
+    _cache_rider_image_url(pcs_name, parse_rider_image_url(doc))  # same page, saves a parse for /rider-image
+
+    if rider_info is None:
+        print(f"No results found for {name} at {url}")
+        return {}
+
+    get_cache().set(cache_key, rider_info, RIDER_INFO_CACHE_TTL)
+    return rider_info
+
+def get_rider_profile(name: str) -> dict:
+    """
+    Fetch a rider's personal details and points with a single parse of their profile page,
+    e.g. to compare several riders at once.
+
+    The personal details and image URL are cached like in `_fetch_rider_info`. Unlike
+    `get_points_per_season`, the points are not stored in the warehouse.
+
+    Returns:
+        dict: "info" (see `_fetch_rider_info`, empty if the rider is unknown),
+            "points_per_speciality" (see `rider_points_scraper.get_points_per_speciality`) and
+            "points_per_season" (see `rider_points_scraper.get_points_per_season`).
+    """
+    pcs_name = reformat_name(name)
+    doc = fetch_document(rider_base_url + pcs_name)
+
+    rider_info = parse_rider_info(doc)
+    if rider_info is not None:
+        get_cache().set(f"rider_info:{pcs_name}", rider_info, RIDER_INFO_CACHE_TTL)
+    _cache_rider_image_url(pcs_name, parse_rider_image_url(doc))
+    return {
+        "info": rider_info or {},
+        "points_per_speciality": parse_points_per_speciality(doc),
+        "points_per_season": parse_points_per_season(doc),
+    }
+
+def is_rider_info_cached(name: str) -> bool:
+    """Return whether the rider's information can be answered without fetching their page."""
+    return get_cache().contains(f"rider_info:{reformat_name(name)}")
+
 # single-field getters
 def get_rider_birthdate(name: str):
     """Return the rider's date of birth as a string (e.g., '21st September 1998')."""
@@ -101,33 +159,41 @@ def get_rider_image_url(name: str):
     """
     Fetch the profile image URL for a rider from ProCyclingStats (PCS).
 
+    The URL is kept in the shared cache backend for `RIDER_IMAGE_CACHE_TTL` seconds, so the
+    rider page is only downloaded and parsed again when it expires.
+
     Args:
         name (str): Rider's full name in plain text (e.g., "Tadej Pogacar").
                     This will be reformatted with `reformat_name()` to match PCS URL conventions.
 
     Returns:
-        str: The full absolute URL to the rider's profile image.
+        str | None: The full absolute URL to the rider's profile image, or None if the
+            rider's profile page has no image.
 
     Raises:
         requests.HTTPError: If the request to the rider page fails (e.g., 404 or 500).
-        AttributeError: If no <img> tag is found on the rider's profile page.
     """
     pcs_name = reformat_name(name)
+    cached = cached_rider_image_url(name)
+    if cached is not None:
+        return cached
+
     url = rider_base_url + pcs_name
 
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
-    img_src = doc.find("img")["src"]
-    return pcs_base_url + img_src
+    doc = fetch_document(url)
+    image_url = parse_rider_image_url(doc)
+    _cache_rider_image_url(pcs_name, image_url)
+    return image_url
+
+def cached_rider_image_url(name: str) -> str | None:
+    """Return the rider's image URL if it is cached, without fetching their page."""
+    return get_cache().get(f"rider_image:{reformat_name(name)}")
 
 def get_active_seasons(name: str):
     pcs_name = reformat_name(name)
     url = rider_base_url + pcs_name
 
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
 
     container = doc.find("ul", class_="rdrSeasonNav")
     if not container:
@@ -1,7 +1,7 @@
 from helpers.format_helper import reformat_name
 from constants import rider_base_url
-from bs4 import BeautifulSoup
-import requests
+from pcs_scraper.fetcher import fetch_document
+from storage.warehouse import get_warehouse
 import re
 
 def normalize_key(text: str) -> str:
@@ -37,10 +37,19 @@ def get_points_per_speciality(name: str) -> dict[str, int]:
     url = rider_base_url + pcs_name
 
     # Fetch and parse rider page
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
+    return parse_points_per_speciality(doc)
 
+def parse_points_per_speciality(doc) -> dict[str, int]:
+    """
+    Extract the points per speciality from a parsed PCS rider page.
+
+    Args:
+        doc (bs4.BeautifulSoup): The rider's PCS page.
+
+    Returns:
+        dict[str, int]: Dictionary mapping speciality -> points, empty if the page has none.
+    """
     container = doc.find("ul", class_="pps list")
     data = {}
 
@@ -69,10 +78,24 @@ def get_points_per_season(name: str) -> list[dict[str, int]]:
     pcs_name = reformat_name(name)
     url = rider_base_url + pcs_name
 
-    resp = requests.get(url)
-    resp.raise_for_status()
-    doc = BeautifulSoup(resp.text, "html.parser")
+    ranking_list = parse_points_per_season(fetch_document(url))
+
+    warehouse = get_warehouse()
+    if warehouse:
+        warehouse.upsert_season_points(name, ranking_list)
 
+    return ranking_list
+
+def parse_points_per_season(doc) -> list[dict[str, int]]:
+    """
+    Extract the ranking points per season from a parsed PCS rider page.
+
+    Args:
+        doc (bs4.BeautifulSoup): The rider's PCS page.
+
+    Returns:
+        list[dict[str, int]]: One dictionary per season, see `get_points_per_season`.
+    """
     # Find the section header (be flexible on exact casing/text)
     header = doc.find("h4", string=re.compile(r"PCS Ranking position per season", re.I))
     if not header:
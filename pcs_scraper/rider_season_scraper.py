@@ -1,8 +1,8 @@
 from helpers.format_helper import reformat_name
 from helpers.country_helper import country_code_to_emoji
 from constants import rider_base_url
-from bs4 import BeautifulSoup
-import requests
+from pcs_scraper.fetcher import fetch_document
+from storage.warehouse import get_warehouse
 import re
 
 def parse_races(container):
@@ -52,11 +52,23 @@ def parse_races(container):
         Dictionary of race results keyed by race name. Stage races include
         both `stages` and `classifications`.
     """
+    return dict(iter_races(container))
+
+def iter_races(container):
+    """
+    Parse race results like `parse_races`, yielding every race as soon as it is complete.
+
+    A stage race is complete once the row of the next race (or the end of the table) is
+    reached, so callers can start formatting the first races while the rest is parsed.
+
+    Yields:
+        tuple[str, dict]: (race name, race info) in table order.
+    """
     tbody = container.find("tbody")
     if not tbody:
-        return {}
+        return
 
-    races = {}
+    pending = None  # (race name, info) of the race whose rows are being parsed
     current_race = None
 
     for row in tbody.find_all("tr", recursive=False):
@@ -80,9 +92,12 @@ def parse_races(container):
                 country_code = flag_classes[1] if len(flag_classes) > 1 else ""
                 flag = country_code_to_emoji(country_code)
 
+            if pending:
+                yield pending
+
             if "›" in date_text:  # stage race
                 current_race = {"date_range": date_text, "flag": flag, "stages": [], "classifications": []}
-                races[race_name] = current_race
+                pending = (race_name, current_race)
             else:  # one-day race
                 result = cols[1].get_text(strip=True)
                 distance = cols[5].get_text(strip=True)
@@ -91,14 +106,14 @@ def parse_races(container):
                 pcs_points = pcs_points if pcs_points else "0"
                 uci_points = uci_points if uci_points else "0"
 
-                races[race_name] = {
+                pending = (race_name, {
                     "date": date_text,
                     "result": result,
                     "flag": flag,
                     "distance": distance,
                     "pcs_points": pcs_points,
                     "uci_points": uci_points
-                }
+                })
                 current_race = None
 
         elif "stage" in classes and current_race:
@@ -148,7 +163,8 @@ def parse_races(container):
 
             current_race["stages"].append(stage_info)
 
-    return races
+    if pending:
+        yield pending
 
 def get_season_results(name: str, season: int):
     """
@@ -164,18 +180,33 @@ def get_season_results(name: str, season: int):
     dict
         Race results as parsed by `parse_races`.
     """
+    return dict(iter_season_results(name, season))
+
+def iter_season_results(name: str, season: int):
+    """
+    Scrape a rider's race results for a season like `get_season_results`, yielding every
+    race as soon as it is parsed.
+
+    Yields:
+        tuple[str, dict]: (race name, race info) as described in `parse_races`.
+    """
     pcs_name = reformat_name(name)
     url = f"{rider_base_url}{pcs_name}/{season}"
 
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
 
     container = doc.find("div", id="rdrResultCont")
     if not container:
-        return {}
+        return
 
-    return parse_races(container)
+    races = {}
+    for race_name, info in iter_races(container):
+        races[race_name] = info
+        yield race_name, info
+
+    warehouse = get_warehouse()
+    if warehouse:
+        warehouse.upsert_season_results(name, season, races)
 
 def get_rider_program(name: str):
     """
@@ -194,10 +225,19 @@ def get_rider_program(name: str):
     pcs_name = reformat_name(name)
     url = rider_base_url + pcs_name
 
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
+    return parse_rider_program(doc)
+
+def parse_rider_program(doc):
+    """
+    Extract the race program from a parsed PCS rider page.
+
+    Args:
+        doc (bs4.BeautifulSoup): The rider's PCS page.
 
+    Returns:
+        list[dict[str, str]]: The races as described in `get_rider_program`.
+    """
     container = doc.find("ul", class_="list dashed flex pad2")
     if not container:
         return []
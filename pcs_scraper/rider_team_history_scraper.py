@@ -1,7 +1,7 @@
 from helpers.format_helper import reformat_name
 from constants import rider_base_url
-from bs4 import BeautifulSoup
-import requests
+from pcs_scraper.fetcher import fetch_document
+from storage.warehouse import get_warehouse
 import re
 
 def get_rider_team_history(name: str):
@@ -24,9 +24,7 @@ def get_rider_team_history(name: str):
     url = rider_base_url + pcs_name
 
     # Fetch and parse rider page
-    result = requests.get(url)
-    result.raise_for_status()
-    doc = BeautifulSoup(result.text, "html.parser")
+    doc = fetch_document(url)
 
     container = doc.find("ul", class_="rdr-teams2")
     if not container:
@@ -60,4 +58,8 @@ def get_rider_team_history(name: str):
             "until": "12-31"
         })
 
+    warehouse = get_warehouse()
+    if warehouse:
+        warehouse.upsert_team_history(name, history)
+
     return history
\ No newline at end of file
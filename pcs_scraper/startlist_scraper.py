@@ -0,0 +1,47 @@
+from helpers.url_formatter import race_startlist_url
+from pcs_scraper.team_scraper import display_name
+from pcs_scraper.fetcher import fetch_document
+import re
+
+_RIDER_HREF = re.compile(r"^/?rider/([^/?#]+)$")
+
+
+def get_startlist(race: str, season: int) -> list[dict[str, str]]:
+    """
+    Scrape the startlist of a race from PCS.
+
+    Args:
+        race (str): Race name (e.g., "Ronde van Vlaanderen").
+        season (int): The season year.
+
+    Returns:
+        list[dict[str, str]]: One dictionary per rider, in startlist order, with keys:
+            - "name" (str): Rider's full name (e.g., "Tadej Pogačar").
+            - "slug" (str): PCS rider slug (e.g., "tadej-pogacar").
+            - "team" (str): Team the rider starts for, "" if unknown.
+        Riders listed more than once are only returned the first time.
+    """
+    url = race_startlist_url(race, season)
+    doc = fetch_document(url)
+
+    container = doc.find("ul", class_="startlist_v4")
+    # Every team is a block with the team link followed by the list of its riders
+    blocks = container.find_all("div", class_="ridersCont") if container else [doc]
+
+    startlist = []
+    seen = set()
+    for block in blocks:
+        team_link = block.find("a", class_="team")
+        team = team_link.get_text(strip=True) if team_link else ""
+        for a in block.find_all("a", href=_RIDER_HREF):
+            slug = _RIDER_HREF.match(a["href"]).group(1)
+            name = a.get_text(" ", strip=True)
+            if slug in seen or not name:
+                continue
+            seen.add(slug)
+            startlist.append({"name": display_name(name), "slug": slug, "team": team})
+
+    if not startlist:
+        print(f"No startlist found for {race} {season} at {url}")
+
+    return startlist
@@ -0,0 +1,59 @@
+from helpers.url_formatter import team_url
+from pcs_scraper.fetcher import fetch_document
+import re
+
+_RIDER_HREF = re.compile(r"^/?rider/([^/?#]+)$")
+
+
+def display_name(pcs_name: str) -> str:
+    """
+    Turn a name as listed by PCS ("POGAČAR Tadej") into "Tadej Pogačar".
+
+    PCS writes the last name in capitals, followed by the first name(s).
+    """
+    parts = pcs_name.split()
+    last = [p for p in parts if p.isupper() and any(c.isalpha() for c in p)]
+    first = [p for p in parts if p not in last]
+    if not last or not first:
+        return pcs_name
+    return " ".join(first + [p.title() for p in last])
+
+
+def get_team_roster(team: str, season: int) -> tuple[str, list[dict[str, str]]]:
+    """
+    Scrape a team's PCS page for its riders.
+
+    Args:
+        team (str): Team name without the season (e.g., "UAE Team Emirates XRG").
+        season (int): The season year.
+
+    Returns:
+        tuple[str, list[dict[str, str]]]: The team name as shown on PCS and one dictionary
+            per rider, in roster order, with keys:
+                - "name" (str): Rider's full name (e.g., "Tadej Pogačar").
+                - "slug" (str): PCS rider slug (e.g., "tadej-pogacar").
+            The list is empty if the team page has no roster.
+    """
+    url = team_url(team, season)
+    doc = fetch_document(url)
+
+    title = doc.find("div", class_="page-title")
+    heading = title.find("h1") if title else None
+    team_name = heading.get_text(strip=True) if heading else team
+
+    # The roster lists every rider once, other rider links (e.g. in the news) may follow it
+    container = doc.find("div", class_="ttabs") or doc.find("ul", class_="teamlist") or doc
+    roster = []
+    seen = set()
+    for a in container.find_all("a", href=_RIDER_HREF):
+        slug = _RIDER_HREF.match(a["href"]).group(1)
+        name = a.get_text(" ", strip=True)
+        if slug in seen or not name:
+            continue
+        seen.add(slug)
+        roster.append({"name": display_name(name), "slug": slug})
+
+    if not roster:
+        print(f"No riders found for {team} at {url}")
+
+    return team_name, roster
@@ -0,0 +1,158 @@
+from pcs_scraper.data_source import get_data_source
+from helpers.format_helper import reformat_name
+from helpers.deadline import Deadline, DeadlineExceeded
+from helpers.profiler import ProfiledThreadPoolExecutor
+from storage.cache_backend import get_cache
+from constants import CURRENT_SEASON_CACHE_TTL
+from datetime import date
+
+CAREER_CONCURRENCY = 4  # season pages downloaded at the same time
+
+# Kinds of result rows, the race types of the career totals
+ONE_DAY_RACE = 0
+STAGE = 1
+GENERAL_CLASSIFICATION = 2
+CLASSIFICATION = 3  # points, mountains, youth... classifications of a stage race
+RACE_TYPES = {
+    ONE_DAY_RACE: "One-day races",
+    STAGE: "Stages",
+    GENERAL_CLASSIFICATION: "General classifications",
+    CLASSIFICATION: "Other classifications",
+}
+ROWS_VERSION = 2  # part of the cache key of the rows, changed with their format
+
+TOTALS = ("wins", "podiums", "top_10s", "race_days", "km", "pcs_points", "uci_points")
+
+
+def _number(text: str) -> float:
+    try:
+        return float(text)
+    except (TypeError, ValueError):  # e.g. "" for a missing distance
+        return 0.0
+
+
+def _rank(result: str) -> int:
+    """Finishing position of a result, 0 if the rider did not finish (e.g. "DNF", "-")."""
+    return int(result) if result and result.isdigit() else 0
+
+
+def season_rows(season: int, races: dict) -> list[list[float]]:
+    """
+    Flatten season results (see `rider_season_scraper.parse_races`) into numeric rows of
+    [season, kind, rank, distance, PCS points, UCI points], one per one-day race, stage and
+    classification. The general classification of a stage race gets its own kind.
+    """
+    rows = []
+    for info in races.values():
+        if "stages" not in info:
+            rows.append([season, ONE_DAY_RACE, _rank(info["result"]), _number(info["distance"]), _number(info["pcs_points"]), _number(info["uci_points"])])
+            continue
+        for stage in info["stages"]:
+            rows.append([season, STAGE, _rank(stage["result"]), _number(stage["distance"]), _number(stage["pcs_points"]), _number(stage["uci_points"])])
+        for classification in info["classifications"]:
+            kind = GENERAL_CLASSIFICATION if classification["name"].lower().startswith("general") else CLASSIFICATION
+            rows.append([season, kind, _rank(classification["result"]), 0.0, _number(classification["pcs_points"]), _number(classification["uci_points"])])
+    return rows
+
+
+def get_season_rows(name: str, season: int) -> list[list[float]]:
+    """
+    Return the result rows of one season of a rider (see `season_rows`).
+
+    The rows are kept in the shared cache backend: permanently for completed seasons, whose
+    results no longer change, and for `CURRENT_SEASON_CACHE_TTL` seconds for the running one.
+    """
+    key = f"career_rows:v{ROWS_VERSION}:{reformat_name(name)}:{season}"
+    cached = get_cache().get(key)
+    if cached is not None:
+        return cached
+
+    rows = season_rows(season, get_data_source().season_results(name, season))
+    get_cache().set(key, rows, None if season < date.today().year else CURRENT_SEASON_CACHE_TTL)
+    return rows
+
+
+def aggregate(rows: list[list[float]]) -> dict:
+    """
+    Sum result rows into career totals per season and per race type, with array operations.
+
+    Returns:
+        dict: "seasons" (one dict per season with "season" and `TOTALS`, oldest first),
+            "race_types" (one dict per race type with "race_type" and `TOTALS`) and "total"
+            (`TOTALS` over the whole career). Wins, podiums and top 10s of the seasons and
+            the whole career count one-day races, stages and general classifications; other
+            classifications only count in their own race type. Race days and km only count
+            one-day races and stages.
+    """
+    import numpy as np  # imported on first use, like matplotlib, to keep the bot's startup fast
+
+    table = np.asarray(rows, dtype=float).reshape(-1, 6)
+    season, kind, rank, distance, pcs_points, uci_points = table.T
+    finished = rank > 0
+    raced = (kind == ONE_DAY_RACE) | (kind == STAGE)
+    columns = {
+        "wins": rank == 1,
+        "podiums": finished & (rank <= 3),
+        "top_10s": finished & (rank <= 10),
+        "race_days": raced,
+        "km": distance * raced,
+        "pcs_points": pcs_points,
+        "uci_points": uci_points,
+    }
+    # A win of e.g. the points classification is not counted as a win of the rider's career
+    counted = kind != CLASSIFICATION
+    career_columns = {total: values & counted if total in ("wins", "podiums", "top_10s") else values for total, values in columns.items()}
+
+    def group_totals(groups: np.ndarray, size: int, columns: dict) -> dict:
+        return {total: np.bincount(groups, weights=values, minlength=size) for total, values in columns.items()}
+
+    seasons, season_index = np.unique(season, return_inverse=True)
+    per_season = group_totals(season_index, len(seasons), career_columns)
+    per_type = group_totals(kind.astype(int), len(RACE_TYPES), columns)
+
+    def as_dict(totals: dict, index: int) -> dict:
+        return {total: round(float(values[index]), 1) if total == "km" else int(round(values[index])) for total, values in totals.items()}
+
+    return {
+        "seasons": [{"season": int(year), **as_dict(per_season, i)} for i, year in enumerate(seasons)],
+        "race_types": [{"race_type": RACE_TYPES[i], **as_dict(per_type, i)} for i in RACE_TYPES],
+        "total": {total: round(float(values.sum()), 1) if total == "km" else int(round(values.sum())) for total, values in per_season.items()},
+    }
+
+
+def get_career(name: str, deadline: Deadline | None = None) -> dict | None:
+    """
+    Combine a rider's results over all their active seasons into career totals.
+
+    The seasons are loaded concurrently (within the PCS rate limit). Seasons that are not
+    loaded when `deadline` expires are left out and set `deadline.partial`; seasons whose
+    page cannot be loaded are left out and listed.
+
+    Returns:
+        dict | None: The totals described in `aggregate`, plus "missing_seasons" (seasons
+            left out because of an error), or None if the rider has no active seasons.
+    """
+    deadline = deadline or Deadline(None)
+    try:
+        active_seasons = sorted(deadline.run(get_data_source().active_seasons, name))
+    except DeadlineExceeded:
+        return None
+    if not active_seasons:
+        return None
+
+    rows, missing_seasons = [], []
+    executor = ProfiledThreadPoolExecutor(CAREER_CONCURRENCY)
+    try:
+        futures = [executor.submit(deadline.run, get_season_rows, name, season) for season in active_seasons]
+        for season, future in zip(active_seasons, futures):
+            try:
+                rows.extend(future.result(timeout=deadline.remaining()))
+            except TimeoutError:  # the deadline passed while waiting, or before the download started
+                deadline.partial = True
+            except Exception as e:
+                print(f"Could not load the {season} season of {name}: {e}")
+                missing_seasons.append(season)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return {**aggregate(rows), "missing_seasons": missing_seasons}
@@ -1,14 +1,43 @@
-from pcs_scraper.race_result_scraper import get_rider_result_in_race
-from pcs_scraper.rider_info_scraper import get_active_seasons
+from pcs_scraper.data_source import get_data_source
+from helpers.deadline import Deadline, DeadlineExceeded
+from helpers.profiler import ProfiledThreadPoolExecutor
+
+PAST_RESULTS_CONCURRENCY = 4  # result pages downloaded at the same time
 
 def get_past_results(name: str, race: str):
     """
     Retrieve past race results (finish positions) for a rider across all seasons.
     """
-    active_seasons = get_active_seasons(name)
-    results = {}
+    return dict(iter_past_results(name, race))
+
+def iter_past_results(name: str, race: str, deadline: Deadline | None = None):
+    """
+    Retrieve past race results like `get_past_results`, yielding each season as soon as
+    its result is known, newest season first.
 
-    for season in active_seasons:
-        results[season] = get_rider_result_in_race(name, race, season)
+    The result pages of several seasons are downloaded concurrently (within the PCS rate
+    limit), but the seasons are always yielded in order. When `deadline` expires the
+    remaining downloads are cancelled, iteration stops and `deadline.partial` is set.
+
+    Yields:
+        tuple[int, str | None]: (season, finish position or None).
+    """
+    deadline = deadline or Deadline(None)
+    source = get_data_source()
+    try:
+        active_seasons = sorted(deadline.run(source.active_seasons, name), reverse=True)
+    except DeadlineExceeded:
+        return
 
-    return results
\ No newline at end of file
+    executor = ProfiledThreadPoolExecutor(PAST_RESULTS_CONCURRENCY)
+    try:
+        futures = [executor.submit(deadline.run, source.rider_result_in_race, name, race, season) for season in active_seasons]
+        for season, future in zip(active_seasons, futures):
+            try:
+                result = future.result(timeout=deadline.remaining())
+            except TimeoutError:  # the deadline passed while waiting, or before the download started
+                deadline.partial = True
+                return
+            yield season, result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,40 +1,60 @@
-from pcs_scraper.rider_season_scraper import get_rider_program
+from pcs_scraper.data_source import get_data_source
+from helpers.deadline import Deadline
+from helpers.profiler import ProfiledThreadPoolExecutor
 from typing import List, Dict
 
-def compare_programs(name1: str, name2: str) -> List[Dict]:
+def compare_programs(name1: str, name2: str, deadline: Deadline | None = None) -> List[Dict]:
     """
     Compare the upcoming programs of two riders.
 
+    Both programs are downloaded concurrently. A program that is not known when `deadline`
+    expires is left out: its rider's participation is None (unknown) for every race, and
+    `deadline.partial` is set.
+
     Args:
         name1 (str): Full name of the first rider.
         name2 (str): Full name of the second rider.
+        deadline (Deadline | None): Time budget of the comparison.
 
     Returns:
         list[dict]: List of races with participation info. Each dict contains:
             - "date" (str): Race date (from PCS, e.g., "12.09").
             - "title" (str): Race title.
             - "flag" (str): Race flag emoji.
-            - "name1_participating" (bool): True if name1 is racing.
-            - "name2_participating" (bool): True if name2 is racing.
+            - "name1_participating" (bool | None): True if name1 is racing.
+            - "name2_participating" (bool | None): True if name2 is racing.
     """
+    deadline = deadline or Deadline(None)
+
     # Get race programs for both riders
-    program1 = get_rider_program(name1)
-    program2 = get_rider_program(name2)
+    executor = ProfiledThreadPoolExecutor(2)
+    try:
+        futures = [executor.submit(deadline.run, get_data_source().rider_program, name) for name in (name1, name2)]
+        programs = []
+        for future in futures:
+            try:
+                programs.append(future.result(timeout=deadline.remaining()))
+            except TimeoutError:  # the deadline passed while waiting, or before the download started
+                deadline.partial = True
+                programs.append(None)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    program1, program2 = programs
 
     # Map races by title + date to combine them
     combined = {}
 
-    for race in program1:
+    for race in program1 or []:
         key = (race["title"], race["date"])
         combined[key] = {
             "date": race["date"],
             "title": race["title"],
             "flag": race["flag"],
             "name1_participating": True,
-            "name2_participating": False
+            "name2_participating": False if program2 is not None else None
         }
 
-    for race in program2:
+    for race in program2 or []:
         key = (race["title"], race["date"])
         if key in combined:
             combined[key]["name2_participating"] = True
@@ -43,7 +63,7 @@ def compare_programs(name1: str, name2: str) -> List[Dict]:
                 "date": race["date"],
                 "title": race["title"],
                 "flag": race["flag"],
-                "name1_participating": False,
+                "name1_participating": False if program1 is not None else None,
                 "name2_participating": True
             }
 
@@ -0,0 +1,130 @@
+from pcs_scraper.fetcher import fetch_if_changed
+from pcs_scraper.rider_season_scraper import parse_rider_program
+from helpers.metrics import increment
+from constants import rider_base_url
+from datetime import date
+import asyncio
+import re
+
+PROGRAM_REFRESH_INTERVAL = 6 * 60 * 60  # seconds between two refreshes of all followed riders
+PROGRAM_BATCH_SIZE = 8  # riders refreshed concurrently
+
+
+def program_key(race: dict) -> tuple[str, str]:
+    return race["title"], race["date"]
+
+
+def race_day(race: dict, today: date) -> date | None:
+    """
+    Return the (first) day of a program race, from its "dd.mm" date and the season in its URL
+    (e.g. "race/il-lombardia/2024"), or None if the date cannot be read.
+    """
+    match = re.match(r"(\d{1,2})\.(\d{1,2})", race.get("date", ""))
+    if not match:
+        return None
+    season = re.search(r"/(\d{4})(?:/|$)", race.get("url", ""))
+    try:
+        return date(int(season.group(1)) if season else today.year, int(match.group(2)), int(match.group(1)))
+    except ValueError:
+        return None
+
+
+def diff_programs(old: list[dict], new: list[dict], today: date | None = None) -> tuple[list[dict], list[dict]]:
+    """
+    Compare two programs by their (title, date) keys.
+
+    PCS only lists upcoming races, so a race whose day has come drops off the program without
+    being cancelled; such races are not reported as dropped.
+
+    Returns:
+        tuple[list[dict], list[dict]]: The races added to and dropped from the program, in
+            program order.
+    """
+    today = today or date.today()
+    old_keys = {program_key(race) for race in old}
+    new_keys = {program_key(race) for race in new}
+    added = [race for race in new if program_key(race) not in old_keys]
+    dropped = [
+        race for race in old
+        if program_key(race) not in new_keys and (race_day(race, today) or date.max) > today
+    ]
+    return added, dropped
+
+
+class ProgramChangeScheduler:
+    """
+    Periodically refreshes the program of every followed rider and announces the changes.
+
+    One scheduler serves all users: every followed rider is checked once per refresh, however
+    many users follow them. Riders are refreshed in batches of `batch_size` concurrent
+    downloads, which also wait for the fetcher's rate limiter, and conditional requests make
+    an unchanged rider page cost a "304 Not Modified".
+
+    Args:
+        store (FollowStore): Store with the follows and the last seen programs.
+        notify (callable): Coroutine function `notify(channel_id, user_ids, name, change, race)`
+            called once per changed race and channel, `change` being "added" or "dropped".
+        interval (float): Seconds between two refreshes.
+        batch_size (int): Riders refreshed concurrently.
+    """
+
+    def __init__(self, store, notify, interval: float = PROGRAM_REFRESH_INTERVAL, batch_size: int = PROGRAM_BATCH_SIZE):
+        self.store = store
+        self.notify = notify
+        self.interval = interval
+        self.batch_size = batch_size
+        self._validators = {}  # slug -> conditional request validators of the rider page
+
+    def _check(self, slug: str) -> tuple[list[dict], list[dict]] | None:
+        """Refresh one rider's program, returning (added, dropped) or None if nothing changed."""
+        html, self._validators[slug] = fetch_if_changed(rider_base_url + slug, self._validators.get(slug))
+        if html is None:
+            return None
+
+        from bs4 import BeautifulSoup
+
+        program = parse_rider_program(BeautifulSoup(html, "html.parser"))
+        previous = self.store.program(slug)
+        self.store.save_program(slug, program)
+        if previous is None:  # first check, nothing to compare with yet
+            return None
+
+        added, dropped = diff_programs(previous, program)
+        return (added, dropped) if added or dropped else None
+
+    async def refresh(self):
+        """Refresh every followed rider once and send the notifications."""
+        riders = await asyncio.to_thread(self.store.followed_riders)
+        for start in range(0, len(riders), self.batch_size):
+            batch = riders[start:start + self.batch_size]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._check, slug) for slug, _ in batch),
+                return_exceptions=True,
+            )
+
+            for (slug, name), result in zip(batch, results):
+                increment("program_watch.checked")
+                if isinstance(result, Exception):
+                    print(f"Failed to refresh the program of {slug}: {result}")
+                    continue
+                if result is None:
+                    continue
+
+                followers = await asyncio.to_thread(self.store.followers, slug)
+                added, dropped = result
+                for change, races in (("added", added), ("dropped", dropped)):
+                    for race in races:
+                        increment("program_watch.changes")
+                        for channel_id, user_ids in followers.items():
+                            try:
+                                await self.notify(channel_id, user_ids, name, change, race)
+                            except Exception as e:
+                                print(f"Failed to notify channel {channel_id} of {name}'s program: {e}")
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Program refresh failed: {e}")
+            await asyncio.sleep(self.interval)
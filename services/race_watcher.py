@@ -0,0 +1,203 @@
+from pcs_scraper.fetcher import fetch_if_changed
+from pcs_scraper.race_result_scraper import result_rows
+from pcs_scraper.cache_policy import race_finished
+from helpers.url_formatter import race_result_url
+from helpers.metrics import increment
+import asyncio
+import contextvars
+import hashlib
+import time
+
+WATCH_POLL_INTERVAL = 60  # seconds between two polls of a race result page
+WATCH_MAX_DURATION = 8 * 60 * 60  # a poller never runs longer than this
+DEFAULT_TOP_N = 10
+MAX_TOP_N = 25
+
+
+def parse_standings(html: str, top_n: int) -> list[tuple[str, str, str]]:
+    """Return the first `top_n` (rank, rider slug, rider name) rows of a race result page."""
+    from bs4 import BeautifulSoup
+
+    standings = []
+    for slug, name, rank in result_rows(BeautifulSoup(html, "html.parser")):
+        if len(standings) == top_n:
+            break
+        standings.append((rank, slug, name))
+    return standings
+
+
+def standings_hash(standings: list[tuple[str, str, str]]) -> str:
+    """Compact hash of the order of the riders, which changes whenever a position changes."""
+    return hashlib.sha1("\n".join(f"{rank}:{slug}" for rank, slug, _ in standings).encode("utf-8")).hexdigest()[:16]
+
+
+def diff_standings(old: list[tuple[str, str, str]], new: list[tuple[str, str, str]]) -> list[tuple[int, str, str, str | None]]:
+    """
+    Compare two standings position by position.
+
+    Returns:
+        list[tuple[int, str, str, str | None]]: (position, rank, rider name, previous rider name
+            at that position or None) for every position whose rider or rank changed.
+    """
+    changes = []
+    for position, (rank, slug, name) in enumerate(new, start=1):
+        previous = old[position - 1] if position <= len(old) else None
+        if previous is None or previous[:2] != (rank, slug):
+            changes.append((position, rank, name, previous[2] if previous else None))
+    return changes
+
+
+def format_changes(changes: list[tuple[int, str, str, str | None]]) -> str:
+    lines = []
+    for _, rank, name, previous_name in changes:
+        line = f"**{rank}.** {name}"
+        if previous_name and previous_name != name:
+            line += f" (was {previous_name})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class RacePoller:
+    """
+    Polls the result page of one race and pushes changed positions to every subscribed channel.
+
+    A page that did not change since the previous poll costs a 304 answer when PCS supports
+    conditional requests, and otherwise a hash comparison; the standings are only parsed when
+    the page body changed, and only channels whose top N changed receive a message.
+    """
+
+    def __init__(self, race: str, season: int, send, interval: float = WATCH_POLL_INTERVAL, max_duration: float = WATCH_MAX_DURATION):
+        self.race = race
+        self.season = season
+        self.url = race_result_url(race, season)
+        self.send = send
+        self.interval = interval
+        self.max_duration = max_duration
+        self.subscribers = {}  # channel id -> top N
+        self.standings = []
+        self.task = None
+        self._validators = {}
+        self._body_hash = None
+        self._standings_hash = None
+
+    @property
+    def title(self) -> str:
+        return f"{self.race} {self.season}"
+
+    async def poll(self) -> bool:
+        """
+        Poll the result page once and push the changes.
+
+        Returns:
+            bool: True when the race is finished and polling can stop.
+        """
+        html, self._validators = await asyncio.to_thread(fetch_if_changed, self.url, self._validators)
+        if html is None:
+            return False
+
+        body_hash = hashlib.sha1(html.encode("utf-8")).hexdigest()
+        finished = race_finished(html)
+        if body_hash == self._body_hash:
+            increment("watch.unchanged_body")
+            return finished
+        self._body_hash = body_hash
+
+        top_n = max(self.subscribers.values(), default=DEFAULT_TOP_N)
+        standings = await asyncio.to_thread(parse_standings, html, top_n)
+        new_hash = standings_hash(standings)
+        if new_hash == self._standings_hash:
+            increment("watch.unchanged_standings")
+            return finished
+
+        changes = diff_standings(self.standings, standings)
+        self.standings = standings
+        self._standings_hash = new_hash
+        increment("watch.changed_standings")
+
+        for channel_id, channel_top_n in list(self.subscribers.items()):
+            channel_changes = [change for change in changes if change[0] <= channel_top_n]
+            if not channel_changes:
+                continue
+            await self._notify(channel_id, f"{self.title} - Standings Update", format_changes(channel_changes))
+        return finished
+
+    async def _notify(self, channel_id: int, title: str, description: str):
+        try:
+            await self.send(channel_id, title, description)
+        except Exception as e:
+            print(f"Failed to post {title} to channel {channel_id}: {e}")
+
+    async def run(self, on_stop=None):
+        deadline = time.monotonic() + self.max_duration
+        try:
+            while self.subscribers and time.monotonic() < deadline:
+                try:
+                    if await self.poll():
+                        for channel_id in list(self.subscribers):
+                            await self._notify(channel_id, f"{self.title} - Final", f"{self.title} is finished, no more updates will be posted.")
+                        break
+                except Exception as e:
+                    print(f"Polling {self.url} failed: {e}")
+                await asyncio.sleep(self.interval)
+            else:
+                if self.subscribers:
+                    hours = self.max_duration / 3600
+                    for channel_id in list(self.subscribers):
+                        await self._notify(channel_id, f"{self.title} - Stopped", f"Stopped watching {self.title} after {hours:g} hours, use /watch-race again to keep following it.")
+        finally:
+            if on_stop:
+                on_stop(self)
+
+
+class RaceWatchRegistry:
+    """
+    Keeps one shared `RacePoller` per race, however many channels and guilds watch it.
+
+    Args:
+        send (callable): Coroutine function `send(channel_id, title, description)` posting an update.
+        interval (float): Seconds between two polls of the same race.
+    """
+
+    def __init__(self, send, interval: float = WATCH_POLL_INTERVAL):
+        self.send = send
+        self.interval = interval
+        self.pollers = {}  # race result URL -> RacePoller
+
+    def subscribe(self, race: str, season: int, channel_id: int, top_n: int = DEFAULT_TOP_N) -> RacePoller:
+        """
+        Post the changes in the top `top_n` of a race to a channel, starting its poller if needed.
+
+        Returns:
+            RacePoller: The race's poller; its `standings` are empty until the first poll.
+        """
+        url = race_result_url(race, season)
+        poller = self.pollers.get(url)
+        if poller is None:
+            poller = RacePoller(race, season, self.send, self.interval)
+            self.pollers[url] = poller
+
+        poller.subscribers[channel_id] = max(1, min(top_n, MAX_TOP_N))
+        if poller.task is None:
+            # Run in an empty context: the poller outlives the command that started it and must
+            # not inherit its deadline, nor be scheduled as that user's downloads
+            poller.task = asyncio.create_task(poller.run(on_stop=self._remove), context=contextvars.Context())
+        return poller
+
+    def unsubscribe(self, race: str, season: int, channel_id: int) -> bool:
+        """
+        Stop posting a race's updates to a channel; the poller stops after its last subscriber.
+
+        Returns:
+            bool: False if the channel was not watching the race.
+        """
+        poller = self.pollers.get(race_result_url(race, season))
+        if poller is None or channel_id not in poller.subscribers:
+            return False
+        del poller.subscribers[channel_id]
+        if not poller.subscribers and poller.task is not None:
+            poller.task.cancel()
+        return True
+
+    def _remove(self, poller: RacePoller):
+        if self.pollers.get(poller.url) is poller:
+            del self.pollers[poller.url]
@@ -1,11 +1,36 @@
-from pcs_scraper.rider_season_scraper import get_season_results
+from pcs_scraper.data_source import get_data_source
+from helpers.deadline import Deadline
+from helpers.profiler import ProfiledThreadPoolExecutor
 import re
 
-def compare_results(name1: str, name2: str, season: int):
-    results1 = get_season_results(name1, season)
-    results2 = get_season_results(name2, season)
-
-    comparison = []
+def compare_results(name1: str, name2: str, season: int, deadline: Deadline | None = None):
+    return list(iter_compare_results(name1, name2, season, deadline))
+
+def iter_compare_results(name1: str, name2: str, season: int, deadline: Deadline | None = None):
+    """
+    Compare the season results of two riders race by race, yielding every comparison entry
+    as soon as it is built.
+
+    Both riders' seasons are downloaded concurrently. If they are not both known when
+    `deadline` expires, nothing can be compared: nothing is yielded and `deadline.partial`
+    is set.
+
+    Yields:
+        dict: {"race", "flag", "date", "stage_or_class", "name1_result", "name2_result", "winner"}
+    """
+    deadline = deadline or Deadline(None)
+    executor = ProfiledThreadPoolExecutor(2)
+    try:
+        source = get_data_source()
+        future1 = executor.submit(deadline.run, source.season_results, name1, season)
+        future2 = executor.submit(deadline.run, source.season_results, name2, season)
+        results1 = future1.result(timeout=deadline.remaining())
+        results2 = future2.result(timeout=deadline.remaining())
+    except TimeoutError:  # the deadline passed while waiting, or before a download started
+        deadline.partial = True
+        return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     for race_name, data1 in results1.items():
         data2 = results2.get(race_name)
@@ -58,7 +83,7 @@ def compare_results(name1: str, name2: str, season: int):
                 except ValueError:
                     winner = None
 
-                comparison.append({
+                yield {
                     "race": race_name,
                     "flag": flag,
                     "date": stage_date,
@@ -66,7 +91,7 @@ def compare_results(name1: str, name2: str, season: int):
                     "name1_result": r1,
                     "name2_result": r2,
                     "winner": winner
-                })
+                }
 
         else:  # One-day race
             r1 = data1.get("result")
@@ -88,7 +113,7 @@ def compare_results(name1: str, name2: str, season: int):
             except ValueError:
                 winner = None
 
-            comparison.append({
+            yield {
                 "race": race_name,
                 "flag": flag,
                 "date": date,
@@ -96,6 +121,4 @@ def compare_results(name1: str, name2: str, season: int):
                 "name1_result": r1,
                 "name2_result": r2,
                 "winner": winner
-            })
-
-    return comparison
\ No newline at end of file
+            }
\ No newline at end of file
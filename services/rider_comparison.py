@@ -0,0 +1,46 @@
+from pcs_scraper.data_source import get_data_source
+from helpers.deadline import Deadline
+from helpers.profiler import ProfiledThreadPoolExecutor
+
+MIN_COMPARED_RIDERS = 2
+MAX_COMPARED_RIDERS = 10
+COMPARISON_CONCURRENCY = 5  # profile pages downloaded at the same time
+
+
+def compare_riders(names: list[str], deadline: Deadline | None = None) -> list[dict]:
+    """
+    Collect the profiles of several riders side by side.
+
+    The profile pages are downloaded concurrently (within the PCS rate limit), and each is
+    parsed once for both the personal details and the points per speciality. A profile that
+    is not known when `deadline` expires has no "info" and "points_per_speciality", and sets
+    `deadline.partial`.
+
+    Args:
+        names (list[str]): Full names of the riders, in the order of the comparison.
+        deadline (Deadline | None): Time budget of the comparison.
+
+    Returns:
+        list[dict]: One dict per rider with "name", "info" (see `DataSource.rider_info`) and
+            "points_per_speciality" (see `DataSource.points_per_speciality`), both None if the
+            profile could not be loaded, and "error" (the exception, or None).
+    """
+    deadline = deadline or Deadline(None)
+    source = get_data_source()
+
+    executor = ProfiledThreadPoolExecutor(COMPARISON_CONCURRENCY)
+    try:
+        futures = [executor.submit(deadline.run, source.rider_profile, name) for name in names]
+        rows = []
+        for name, future in zip(names, futures):
+            row = {"name": name, "info": None, "points_per_speciality": None, "error": None}
+            try:
+                row.update(future.result(timeout=deadline.remaining()))
+            except TimeoutError:  # the deadline passed while waiting, or before the download started
+                deadline.partial = True
+            except Exception as e:
+                row["error"] = e
+            rows.append(row)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return rows
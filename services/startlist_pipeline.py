@@ -0,0 +1,161 @@
+from pcs_scraper.data_source import get_data_source
+from pcs_scraper.fetcher import fetch_html
+from helpers.country_helper import country_to_emoji
+from storage.cache_backend import get_cache
+from constants import rider_base_url, RIDER_INFO_CACHE_TTL
+import asyncio
+
+FETCH_CONCURRENCY = 4  # rider pages downloaded at the same time
+PARSE_WORKERS = 2
+QUEUE_SIZE = 16
+
+SPECIALITY_LABELS = {
+    "one_day_races": "ODR",
+    "gc": "GC",
+    "time_trial": "TT",
+    "sprint": "SPR",
+    "climber": "CLB",
+    "hills": "HIL",
+}
+
+_DONE = object()  # end-of-stream marker passed between stages
+
+
+def _summary_key(slug: str) -> str:
+    return f"rider_summary:{slug}"
+
+
+def _cached_summaries(slugs: list[str]) -> dict[str, dict]:
+    cache = get_cache()
+    summaries = {}
+    for slug in slugs:
+        summary = cache.get(_summary_key(slug))
+        if summary is not None:
+            summaries[slug] = summary
+    return summaries
+
+
+def _parse_summary(slug: str) -> dict:
+    """
+    Parse a rider page once for everything the startlist shows, with the configured data
+    source, and cache the result. The page was downloaded by the fetch stage, so it is read
+    from the page cache.
+    """
+    profile = get_data_source().rider_profile(slug)
+    summary = {
+        "nationality": profile["info"].get("nationality"),
+        "points": profile["points_per_speciality"],
+    }
+    get_cache().set(_summary_key(slug), summary, RIDER_INFO_CACHE_TTL)
+    return summary
+
+
+async def enrich_startlist(startlist: list[dict[str, str]], fetch_concurrency: int = FETCH_CONCURRENCY) -> list[dict]:
+    """
+    Enrich a startlist with every rider's nationality and points per speciality.
+
+    The work runs as a pipeline of stages connected by bounded queues:
+
+        fetch (`fetch_concurrency` workers) -> parse (`PARSE_WORKERS` workers) -> enrich
+
+    The fetch stage downloads the rider pages into the page cache, and the parse stage reads
+    them with the configured data source (`DataSource.rider_profile`).
+
+    Riders whose summary is already cached skip straight to the enrich stage, so a warm
+    startlist needs no download or parse at all. Downloads and parsing run in worker
+    threads, so the event loop (and with it the Discord gateway) is never blocked.
+
+    Args:
+        startlist (list[dict[str, str]]): Entries as returned by `DataSource.startlist`.
+        fetch_concurrency (int): Maximum number of rider pages downloaded at the same time;
+            the downloads are also spaced out by the fetcher's rate limiter.
+
+    Returns:
+        list[dict]: One row per rider in startlist order, with the startlist keys plus
+            "nationality", "flag" and "points" (speciality -> points, empty if unknown).
+    """
+    fetch_queue = asyncio.Queue(QUEUE_SIZE)
+    parse_queue = asyncio.Queue(QUEUE_SIZE)
+    enrich_queue = asyncio.Queue(QUEUE_SIZE)
+
+    cached = await asyncio.to_thread(_cached_summaries, [entry["slug"] for entry in startlist])
+
+    async def source():
+        for index, entry in enumerate(startlist):
+            if entry["slug"] in cached:
+                await enrich_queue.put((index, cached[entry["slug"]]))
+            else:
+                await fetch_queue.put((index, entry))
+        for _ in range(fetch_concurrency):
+            await fetch_queue.put(_DONE)
+
+    async def fetch_worker():
+        while (item := await fetch_queue.get()) is not _DONE:
+            index, entry = item
+            try:
+                await asyncio.to_thread(fetch_html, rider_base_url + entry["slug"])
+                fetched = True
+            except Exception as e:
+                print(f"Failed to fetch {entry['slug']} for the startlist: {e}")
+                fetched = False
+            await parse_queue.put((index, entry, fetched))
+
+    async def parse_worker():
+        while (item := await parse_queue.get()) is not _DONE:
+            index, entry, fetched = item
+            summary = None
+            if fetched:
+                try:
+                    summary = await asyncio.to_thread(_parse_summary, entry["slug"])
+                except Exception as e:
+                    print(f"Failed to parse {entry['slug']} for the startlist: {e}")
+            await enrich_queue.put((index, summary))
+
+    async def fetch_stage():
+        await asyncio.gather(*(fetch_worker() for _ in range(fetch_concurrency)))
+        for _ in range(PARSE_WORKERS):
+            await parse_queue.put(_DONE)
+
+    async def parse_stage():
+        await asyncio.gather(*(parse_worker() for _ in range(PARSE_WORKERS)))
+        await enrich_queue.put(_DONE)
+
+    rows = [None] * len(startlist)
+
+    async def enrich_stage():
+        while (item := await enrich_queue.get()) is not _DONE:
+            index, summary = item
+            summary = summary or {}
+            nationality = summary.get("nationality")
+            rows[index] = {
+                **startlist[index],
+                "nationality": nationality,
+                "flag": country_to_emoji(nationality),
+                "points": summary.get("points") or {},
+            }
+
+    await asyncio.gather(source(), fetch_stage(), parse_stage(), enrich_stage())
+    return rows
+
+
+def render_startlist(rows: list[dict]) -> str:
+    """
+    Render enriched startlist rows as text, grouped per team in startlist order.
+
+    Returns:
+        str: One bold team line followed by a line per rider with their flag and speciality
+            points, best speciality first.
+    """
+    lines = []
+    team = None
+    for row in rows:
+        if row["team"] != team:
+            team = row["team"]
+            lines.append(f"\n**{team or 'Unknown team'}**")
+
+        points = sorted(row["points"].items(), key=lambda item: item[1], reverse=True)
+        specialities = " · ".join(f"{SPECIALITY_LABELS.get(key, key)} {value}" for key, value in points)
+        line = f"{row['flag']} {row['name']}".strip()
+        lines.append(f"{line} - {specialities}" if specialities else line)
+
+    return "\n".join(lines).strip()
@@ -0,0 +1,76 @@
+from pcs_scraper.data_source import get_data_source
+from storage.warehouse import get_warehouse
+from helpers.deadline import DeadlineExceeded, current_deadline
+import asyncio
+
+MAX_CONCURRENT_PROFILES = 8
+
+
+def get_roster_row(rider: dict[str, str], season: int) -> dict:
+    """
+    Collect the table row of one roster rider.
+
+    The profile fields and the season points come from a single parse of the rider page
+    (`DataSource.rider_profile`). The points are stored in the warehouse under the rider's
+    display name, not their slug.
+
+    Args:
+        rider (dict[str, str]): Roster entry as returned by `DataSource.team_roster`.
+        season (int): Season whose PCS points to show.
+
+    Returns:
+        dict: {"name", "age", "nationality", "points"}; missing values are None.
+    """
+    profile = get_data_source().rider_profile(rider["slug"])
+    warehouse = get_warehouse()
+    if warehouse and profile["points_per_season"]:
+        warehouse.upsert_season_points(rider["name"], profile["points_per_season"], slug=rider["slug"])
+
+    info = profile["info"]
+    points = next((entry["points"] for entry in profile["points_per_season"] if entry["season"] == season), None)
+    return {
+        "name": rider["name"],
+        "age": info.get("age"),
+        "nationality": info.get("nationality"),
+        "points": points,
+    }
+
+
+async def stream_roster_rows(roster: list[dict[str, str]], season: int, max_concurrent: int = MAX_CONCURRENT_PROFILES):
+    """
+    Fetch the rows of a whole roster concurrently, yielding each one as soon as it is ready.
+
+    The scrapers run in worker threads, at most `max_concurrent` at a time; the downloads
+    themselves are spaced out by the fetcher's rate limiter. When the deadline of the command
+    expires, the remaining fetches are cancelled, the stream stops early and the deadline's
+    `partial` is set.
+
+    Yields:
+        tuple[int, dict]: Position of the rider in `roster` and its row. The values of a rider
+            whose profile could not be fetched are None.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch(index, rider):
+        async with semaphore:
+            try:
+                return index, await asyncio.to_thread(get_roster_row, rider, season)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                print(f"Failed to fetch roster row for {rider['slug']}: {e}")
+                return index, {"name": rider["name"], "age": None, "nationality": None, "points": None}
+
+    tasks = [asyncio.ensure_future(fetch(index, rider)) for index, rider in enumerate(roster)]
+    try:
+        for task in asyncio.as_completed(tasks):
+            try:
+                yield await task
+            except DeadlineExceeded:
+                deadline = current_deadline()
+                if deadline is not None:
+                    deadline.partial = True
+                return
+    finally:
+        for task in tasks:
+            task.cancel()
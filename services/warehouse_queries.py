@@ -0,0 +1,42 @@
+from storage.warehouse import get_warehouse
+
+
+def get_race_podiums(race: str, season: int | None = None):
+    """
+    Retrieve every podium of a race stored in the local warehouse.
+
+    Only results scraped earlier (e.g. through `/rider-race-result` or `/season-results`) are known.
+
+    Args:
+        race (str): Race name (e.g., "Ronde van Vlaanderen").
+        season (int | None): Restrict to one season.
+
+    Returns:
+        list[dict] | None: {"season", "rank", "name"} dicts, newest season first,
+            or None if no warehouse is configured.
+    """
+    warehouse = get_warehouse()
+    if warehouse is None:
+        return None
+    return warehouse.race_podiums(race, season)
+
+
+def get_top_scorers(names: list[str], season: int, limit: int = 10):
+    """
+    Rank a list of riders (e.g. a watchlist) by the PCS points they scored in a season.
+
+    Only riders whose points per season were scraped earlier are included.
+
+    Args:
+        names (list[str]): Full names of the riders.
+        season (int): Year of the season.
+        limit (int): Maximum number of riders returned.
+
+    Returns:
+        list[dict] | None: {"name", "points", "rank"} dicts, highest points first,
+            or None if no warehouse is configured.
+    """
+    warehouse = get_warehouse()
+    if warehouse is None:
+        return None
+    return warehouse.top_scorers(names, season, limit)
@@ -0,0 +1,318 @@
+from collections import OrderedDict
+from urllib.parse import urlparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # serialized size of the in-process cache, PCS pages are ~50-300 KB each
+PURGE_INTERVAL = 60 * 60  # seconds between purges of expired entries from the SQLite cache
+DEFAULT_SQLITE_MAX_BYTES = 1024 * 1024 * 1024  # serialized size the SQLite cache is trimmed to when purged
+ACCESS_RESOLUTION = 10 * 60  # seconds a read may be attributed to an earlier access, saves a write per read
+
+
+class CacheBackend:
+    """
+    Key-value store shared by the scraper and render caches.
+
+    Values must be JSON-serializable; they are stored serialized, so callers always get
+    a fresh copy back. A `ttl` of None means the entry never expires.
+    """
+
+    def get(self, key: str):
+        """Return the cached value for `key`, or None if it is missing or expired."""
+        raw = self._get_raw(key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value, ttl: float | None = None):
+        """Store `value` under `key` for `ttl` seconds."""
+        self._set_raw(key, json.dumps(value), ttl)
+
+    def contains(self, key: str) -> bool:
+        """Return whether `key` has an unexpired value, without decoding it."""
+        return self._get_raw(key) is not None
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def _get_raw(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    def _set_raw(self, key: str, raw: str, ttl: float | None):
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache, only shared by the threads of one process.
+
+    The least recently used entries are evicted once there are more than `max_entries` of
+    them or their serialized values take more than `max_bytes` characters (0 for no limit),
+    which bounds the memory whole PCS pages can take.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (raw, expires_at)
+        self._size = 0  # summed length of the stored values
+        self._lock = threading.Lock()
+
+    def _get_raw(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            raw, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def _set_raw(self, key, raw, ttl):
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (raw, time.time() + ttl if ttl is not None else None)
+            self._size += len(raw)
+            while len(self._entries) > self.max_entries or (self.max_bytes and self._size > self.max_bytes and len(self._entries) > 1):
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key):
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache stored in a SQLite file, shared by every process (e.g. shards) on the same machine.
+
+    The database runs in WAL mode so readers never block the writer, and every thread uses
+    its own connection. Expired entries are purged when the cache is opened and then at most
+    every `PURGE_INTERVAL` seconds while entries are written. Each purge also evicts the least
+    recently used entries until the serialized values take at most `max_bytes` characters
+    (0 for no limit), so entries cached permanently cannot grow the file without bound.
+    """
+
+    def __init__(self, path: str = "cache.sqlite3", max_bytes: int = DEFAULT_SQLITE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, last_access REAL)")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+            if "last_access" not in columns:  # cache file created before entries were evicted
+                conn.execute("ALTER TABLE cache ADD COLUMN last_access REAL")
+                conn.execute("UPDATE cache SET last_access = ?", (time.time(),))
+        self._next_purge = 0.0
+        self._purge_lock = threading.Lock()
+        self._purge_if_due()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _get_raw(self, key):
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT value, last_access FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+        value, last_access = row
+        if last_access is None or last_access < now - ACCESS_RESOLUTION:
+            with self._connection() as conn:
+                conn.execute("UPDATE cache SET last_access = ? WHERE key = ?", (now, key))
+        return value
+
+    def _set_raw(self, key, raw, ttl):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, raw, now + ttl if ttl is not None else None, now),
+            )
+        self._purge_if_due()
+
+    def delete(self, key):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def purge_expired(self):
+        """Remove expired entries, they are otherwise only skipped on read."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+    def evict_least_recently_used(self):
+        """Remove the least recently read or written entries beyond `max_bytes`."""
+        if not self.max_bytes:
+            return
+        with self._connection() as conn:
+            conn.execute(
+                """
+                DELETE FROM cache WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(LENGTH(value)) OVER (ORDER BY last_access DESC, key) AS kept_bytes FROM cache
+                    ) WHERE kept_bytes > ?
+                )
+                """,
+                (self.max_bytes,),
+            )
+
+    def _purge_if_due(self):
+        with self._purge_lock:
+            if time.monotonic() < self._next_purge:
+                return
+            self._next_purge = time.monotonic() + PURGE_INTERVAL
+        self.purge_expired()
+        self.evict_least_recently_used()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache stored in a Redis-compatible server (Redis, Valkey, KeyDB, Dragonfly...), shared by
+    every process that can reach it.
+
+    Only GET, SET and DEL are needed, so the RESP protocol is spoken directly over a socket
+    instead of adding a client library dependency.
+    """
+
+    def __init__(self, url: str = "redis://127.0.0.1:6379/0", prefix: str = "pcs-dcbot:"):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.prefix = prefix
+        self._sock = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=5)
+        self._reader = self._sock.makefile("rb")
+        if self.password:
+            self._call("AUTH", self.password)
+        if self.db:
+            self._call("SELECT", str(self.db))
+
+    def _call(self, *args: str):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg.encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+        return self._read_reply()
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection to the cache server was closed")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"-":
+            raise RuntimeError(f"Cache server error: {payload.decode()}")
+        if kind == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)[:-2]
+            return data.decode("utf-8")
+        if kind == b":":
+            return int(payload)
+        return payload.decode()
+
+    def _command(self, *args: str):
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._call(*args)
+                except (ConnectionError, OSError):
+                    self._sock = None  # reconnect once, e.g. after a server restart
+                    if attempt:
+                        raise
+
+    def _get_raw(self, key):
+        return self._command("GET", self.prefix + key)
+
+    def contains(self, key):
+        return self._command("EXISTS", self.prefix + key) == 1
+
+    def _set_raw(self, key, raw, ttl):
+        if ttl is None:
+            self._command("SET", self.prefix + key, raw)
+        else:
+            self._command("SET", self.prefix + key, raw, "PX", str(max(1, int(ttl * 1000))))
+
+    def delete(self, key):
+        self._command("DEL", self.prefix + key)
+
+
+_cache: CacheBackend = MemoryCacheBackend()
+
+
+def get_cache() -> CacheBackend:
+    """Return the cache backend shared by the scrapers and commands."""
+    return _cache
+
+
+def set_cache(cache: CacheBackend) -> CacheBackend:
+    """
+    Replace the shared cache backend.
+
+    Returns:
+        CacheBackend: The previous backend, so callers can restore it.
+    """
+    global _cache
+    previous = _cache
+    _cache = cache
+    return previous
+
+
+def configure_cache_from_env() -> CacheBackend:
+    """
+    Install the cache backend selected by the CACHE_BACKEND environment variable.
+
+    Backends:
+        - "memory" (default): in-process LRU of at most CACHE_MAX_ENTRIES entries (default 1024)
+          and CACHE_MAX_BYTES serialized bytes (default 64 MiB).
+        - "sqlite": SQLite file at CACHE_PATH (default "cache.sqlite3"), shared by local processes,
+          trimmed to CACHE_PATH_MAX_BYTES serialized bytes (default 1 GiB) when it is purged.
+        - "redis": Redis-compatible server at CACHE_URL (default "redis://127.0.0.1:6379/0").
+
+    Returns:
+        CacheBackend: The installed backend.
+    """
+    backend = os.getenv("CACHE_BACKEND", "memory").lower()
+    if backend == "memory":
+        cache = MemoryCacheBackend(
+            int(os.getenv("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+            int(os.getenv("CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        )
+    elif backend == "sqlite":
+        cache = SQLiteCacheBackend(
+            os.getenv("CACHE_PATH", "cache.sqlite3"),
+            int(os.getenv("CACHE_PATH_MAX_BYTES", DEFAULT_SQLITE_MAX_BYTES)),
+        )
+    elif backend == "redis":
+        cache = RedisCacheBackend(os.getenv("CACHE_URL", "redis://127.0.0.1:6379/0"))
+    else:
+        raise ValueError(f"Unknown CACHE_BACKEND '{backend}', expected memory, sqlite or redis")
+
+    set_cache(cache)
+    return cache
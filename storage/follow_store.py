@@ -0,0 +1,119 @@
+from helpers.format_helper import reformat_name
+import json
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS follows (
+    user_id INTEGER NOT NULL,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    channel_id INTEGER NOT NULL,
+    PRIMARY KEY (user_id, slug)
+);
+CREATE INDEX IF NOT EXISTS idx_follows_slug ON follows (slug);
+
+-- Last known program of every followed rider, as returned by `get_rider_program`
+CREATE TABLE IF NOT EXISTS programs (
+    slug TEXT PRIMARY KEY,
+    program TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+
+class FollowStore:
+    """
+    Local SQLite store of the riders users follow and the last program seen for each of them.
+
+    A follow remembers the channel it was made in, program changes are announced there.
+    """
+
+    def __init__(self, path: str = "follows.sqlite3"):
+        self.path = path
+        self._local = threading.local()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def follow(self, user_id: int, channel_id: int, name: str):
+        """Follow a rider, or move an existing follow to `channel_id`."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO follows (user_id, slug, name, channel_id) VALUES (?, ?, ?, ?)",
+                (user_id, reformat_name(name), name, channel_id),
+            )
+
+    def unfollow(self, user_id: int, name: str) -> bool:
+        """
+        Stop following a rider.
+
+        Returns:
+            bool: False if the user did not follow the rider.
+        """
+        slug = reformat_name(name)
+        with self._connection() as conn:
+            deleted = conn.execute("DELETE FROM follows WHERE user_id = ? AND slug = ?", (user_id, slug)).rowcount
+            # Forget the program once nobody follows the rider anymore
+            conn.execute("DELETE FROM programs WHERE slug = ? AND slug NOT IN (SELECT slug FROM follows)", (slug,))
+        return deleted > 0
+
+    def user_follows(self, user_id: int) -> list[str]:
+        """Return the names of the riders a user follows, alphabetically."""
+        rows = self._connection().execute("SELECT name FROM follows WHERE user_id = ? ORDER BY name", (user_id,))
+        return [name for (name,) in rows]
+
+    def followed_riders(self) -> list[tuple[str, str]]:
+        """Return every rider followed by at least one user as (slug, name) pairs."""
+        return self._connection().execute("SELECT slug, MIN(name) FROM follows GROUP BY slug ORDER BY slug").fetchall()
+
+    def followers(self, slug: str) -> dict[int, list[int]]:
+        """Return the users following a rider, grouped per channel (channel id -> user ids)."""
+        followers = {}
+        for user_id, channel_id in self._connection().execute("SELECT user_id, channel_id FROM follows WHERE slug = ?", (slug,)):
+            followers.setdefault(channel_id, []).append(user_id)
+        return followers
+
+    def program(self, slug: str) -> list[dict] | None:
+        """Return the last stored program of a rider, None if it was never checked."""
+        row = self._connection().execute("SELECT program FROM programs WHERE slug = ?", (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_program(self, slug: str, program: list[dict]):
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO programs (slug, program, checked_at) VALUES (?, ?, ?)",
+                (slug, json.dumps(program), time.time()),
+            )
+
+
+_follow_store = None
+
+
+def get_follow_store() -> FollowStore:
+    """Return the follow store, opening FOLLOW_STORE_PATH (default "follows.sqlite3") on first use."""
+    global _follow_store
+    if _follow_store is None:
+        _follow_store = FollowStore(os.getenv("FOLLOW_STORE_PATH", "follows.sqlite3"))
+    return _follow_store
+
+
+def set_follow_store(store: FollowStore | None) -> FollowStore | None:
+    """
+    Replace the follow store.
+
+    Returns:
+        FollowStore | None: The previous store.
+    """
+    global _follow_store
+    previous = _follow_store
+    _follow_store = store
+    return previous
@@ -0,0 +1,95 @@
+from pcs_scraper.fetcher import fetch_bytes
+from helpers.metrics import increment
+from constants import RIDER_THUMBNAIL_SIZE
+from pathlib import Path
+import hashlib
+import io
+import os
+import threading
+
+THUMBNAIL_QUALITY = 80  # JPEG quality of the stored thumbnails
+
+
+class ThumbnailStore:
+    """
+    Local directory of small JPEG copies of PCS pictures, so commands can send a picture as a
+    small attachment instead of making Discord fetch the full-size image from PCS every time.
+
+    A picture is downloaded once, resized to at most `size` pixels on its longest side,
+    recompressed and stored under a name derived from its URL, so a new picture on PCS gets
+    a new file. Hits and misses are counted as "thumbnails.hit|miss".
+
+    Args:
+        directory (str): Directory the thumbnails are stored in, created if needed.
+        size (int): Longest side of a thumbnail in pixels.
+    """
+
+    def __init__(self, directory: str, size: int = RIDER_THUMBNAIL_SIZE):
+        self.directory = Path(directory)
+        self.size = size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, image_url: str) -> Path:
+        return self.directory / (hashlib.sha1(image_url.encode("utf-8")).hexdigest() + ".jpg")
+
+    def contains(self, image_url: str) -> bool:
+        return self.path_for(image_url).exists()
+
+    def make_thumbnail(self, data: bytes) -> bytes:
+        """Resize and recompress an image to a JPEG thumbnail."""
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail((self.size, self.size))
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        return buffer.getvalue()
+
+    def get(self, image_url: str) -> Path:
+        """
+        Return the path of the thumbnail of `image_url`, downloading and storing it if needed.
+
+        Raises:
+            requests.HTTPError: If PCS answers with an error status.
+            PCSUnavailableError: If PCS could not be reached.
+            PIL.UnidentifiedImageError: If the download is not an image.
+        """
+        path = self.path_for(image_url)
+        if path.exists():
+            increment("thumbnails.hit")
+            return path
+
+        increment("thumbnails.miss")
+        thumbnail = self.make_thumbnail(fetch_bytes(image_url))
+        partial_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        partial_path.write_bytes(thumbnail)
+        os.replace(partial_path, path)  # never expose a half-written file to other processes
+        return path
+
+
+_thumbnail_store = None
+
+
+def get_thumbnail_store() -> ThumbnailStore | None:
+    """Return the configured thumbnail store, or None when pictures are linked from PCS."""
+    return _thumbnail_store
+
+
+def set_thumbnail_store(store: ThumbnailStore | None) -> ThumbnailStore | None:
+    """
+    Replace the thumbnail store.
+
+    Returns:
+        ThumbnailStore | None: The previous store.
+    """
+    global _thumbnail_store
+    previous = _thumbnail_store
+    _thumbnail_store = store
+    return previous
+
+
+def configure_thumbnails_from_env() -> ThumbnailStore | None:
+    """Store thumbnails in THUMBNAIL_PATH, if that environment variable is set."""
+    path = os.getenv("THUMBNAIL_PATH")
+    set_thumbnail_store(ThumbnailStore(path) if path else None)
+    return _thumbnail_store
@@ -0,0 +1,300 @@
+from helpers.format_helper import reformat_name
+import functools
+import os
+import re
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS riders (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    category TEXT
+);
+
+-- One row per rider per race result; `stage` is '' for one-day races and the overall result
+-- (the general classification of a stage race), otherwise the stage description or
+-- classification name.
+CREATE TABLE IF NOT EXISTS race_results (
+    rider_id INTEGER NOT NULL REFERENCES riders(id),
+    race_id INTEGER NOT NULL REFERENCES races(id),
+    season INTEGER NOT NULL,
+    stage TEXT NOT NULL DEFAULT '',
+    result TEXT,
+    rank INTEGER,
+    date TEXT,
+    distance REAL,
+    pcs_points INTEGER,
+    uci_points INTEGER,
+    PRIMARY KEY (rider_id, race_id, season, stage)
+);
+CREATE INDEX IF NOT EXISTS idx_results_race ON race_results (race_id, stage, rank);
+CREATE INDEX IF NOT EXISTS idx_results_rider_season ON race_results (rider_id, season);
+
+CREATE TABLE IF NOT EXISTS season_points (
+    rider_id INTEGER NOT NULL REFERENCES riders(id),
+    season INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    rank INTEGER,
+    PRIMARY KEY (rider_id, season)
+);
+CREATE INDEX IF NOT EXISTS idx_season_points_season ON season_points (season, points DESC);
+
+CREATE TABLE IF NOT EXISTS team_history (
+    rider_id INTEGER NOT NULL REFERENCES riders(id),
+    season INTEGER NOT NULL,
+    team_name TEXT NOT NULL,
+    team_url TEXT,
+    class TEXT,
+    PRIMARY KEY (rider_id, season)
+);
+CREATE INDEX IF NOT EXISTS idx_team_history_team ON team_history (team_name, season);
+"""
+
+# Stage of the overall results of a race: the result of a one-day race, the GC of a stage race.
+# The race result page and the rider season page both store the GC, so it gets a single key.
+OVERALL_STAGE = ""
+GENERAL_CLASSIFICATION = "General classification"
+
+
+def _to_int(value):
+    digits = re.sub(r"[^\d]", "", str(value or ""))
+    return int(digits) if digits else None
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def split_race_name(race_name: str) -> tuple[str, str | None]:
+    """
+    Split a PCS race name into its name and category.
+
+    Example: "Ronde van Vlaanderen (1.UWT)" -> ("Ronde van Vlaanderen", "1.UWT")
+    """
+    match = re.match(r"^(.*?)\s*\((\d[^)]*)\)$", race_name)
+    if match:
+        return match.group(1), match.group(2)
+    return race_name, None
+
+
+def _best_effort(method):
+    """Storing in the warehouse is optional, a database error must never fail a command."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except sqlite3.Error as e:
+            print(f"Warehouse error in {method.__name__}: {e}")
+    return wrapper
+
+
+class Warehouse:
+    """
+    Normalized SQLite store of everything the scrapers have seen: riders, races, race results,
+    PCS points per season and team history.
+
+    The scrapers upsert into it while they parse, so questions spanning many riders or
+    seasons can be answered with one indexed SQL query instead of a scrape per data point.
+    """
+
+    def __init__(self, path: str = "warehouse.sqlite3"):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            # Warehouses written before the GC was stored under OVERALL_STAGE hold it twice
+            conn.execute(
+                "UPDATE OR REPLACE race_results SET stage = ? WHERE stage = ?",
+                (OVERALL_STAGE, GENERAL_CLASSIFICATION),
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def _rider_id(self, conn, slug: str, name: str | None = None) -> int:
+        if name:
+            conn.execute(
+                "INSERT INTO riders (slug, name) VALUES (?, ?) ON CONFLICT(slug) DO UPDATE SET name = excluded.name",
+                (slug, name),
+            )
+        else:
+            conn.execute("INSERT OR IGNORE INTO riders (slug, name) VALUES (?, ?)", (slug, slug.replace("-", " ").title()))
+        return conn.execute("SELECT id FROM riders WHERE slug = ?", (slug,)).fetchone()[0]
+
+    def _race_id(self, conn, race_name: str) -> int:
+        name, category = split_race_name(race_name)
+        conn.execute(
+            "INSERT INTO races (slug, name, category) VALUES (?, ?, ?) "
+            "ON CONFLICT(slug) DO UPDATE SET category = COALESCE(excluded.category, races.category)",
+            (reformat_name(name), name, category),
+        )
+        return conn.execute("SELECT id FROM races WHERE slug = ?", (reformat_name(name),)).fetchone()[0]
+
+    def _upsert_result(self, conn, rider_id, race_id, season, stage, entry: dict):
+        conn.execute(
+            """
+            INSERT INTO race_results (rider_id, race_id, season, stage, result, rank, date, distance, pcs_points, uci_points)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(rider_id, race_id, season, stage) DO UPDATE SET
+                result = excluded.result,
+                rank = excluded.rank,
+                date = COALESCE(excluded.date, race_results.date),
+                distance = COALESCE(excluded.distance, race_results.distance),
+                pcs_points = COALESCE(excluded.pcs_points, race_results.pcs_points),
+                uci_points = COALESCE(excluded.uci_points, race_results.uci_points)
+            """,
+            (
+                rider_id, race_id, season, stage,
+                entry.get("result"), _to_int(entry.get("result")), entry.get("date") or None,
+                _to_float(entry.get("distance")), _to_int(entry.get("pcs_points")), _to_int(entry.get("uci_points")),
+            ),
+        )
+
+    @_best_effort
+    def upsert_season_results(self, name: str, season: int, races: dict):
+        """Store a rider's season as returned by `parse_races`."""
+        with self._connection() as conn:
+            rider_id = self._rider_id(conn, reformat_name(name), name)
+            for race_name, info in races.items():
+                race_id = self._race_id(conn, race_name)
+                if "stages" not in info:
+                    self._upsert_result(conn, rider_id, race_id, season, OVERALL_STAGE, info)
+                    continue
+                for stage in info["stages"]:
+                    self._upsert_result(conn, rider_id, race_id, season, stage["description"], stage)
+                for classification in info["classifications"]:
+                    is_gc = classification["name"].lower() == GENERAL_CLASSIFICATION.lower()
+                    stage = OVERALL_STAGE if is_gc else classification["name"]
+                    self._upsert_result(conn, rider_id, race_id, season, stage, classification)
+
+    @_best_effort
+    def upsert_race_results(self, race: str, season: int, rows: list[tuple[str, str, str]]):
+        """
+        Store the full result of a race.
+
+        Args:
+            race (str): Race name.
+            season (int): Year of the race.
+            rows (list[tuple[str, str, str]]): (rider slug, rider name as shown on PCS, result) per rider.
+        """
+        with self._connection() as conn:
+            race_id = self._race_id(conn, race)
+            for slug, name, result in rows:
+                rider_id = self._rider_id(conn, slug, name)
+                self._upsert_result(conn, rider_id, race_id, season, OVERALL_STAGE, {"result": result})
+
+    @_best_effort
+    def upsert_season_points(self, name: str, ranking_list: list[dict], slug: str | None = None):
+        """
+        Store a rider's PCS points per season as returned by `get_points_per_season`.
+
+        `slug` is the rider's PCS slug, when it is not the reformatted `name` (e.g. for
+        roster names like "POGAČAR Tadej").
+        """
+        with self._connection() as conn:
+            rider_id = self._rider_id(conn, slug or reformat_name(name), name)
+            conn.executemany(
+                "INSERT OR REPLACE INTO season_points (rider_id, season, points, rank) VALUES (?, ?, ?, ?)",
+                [(rider_id, entry["season"], entry["points"], entry["rank"]) for entry in ranking_list],
+            )
+
+    @_best_effort
+    def upsert_team_history(self, name: str, history: list[dict]):
+        """Store a rider's teams as returned by `get_rider_team_history`."""
+        with self._connection() as conn:
+            rider_id = self._rider_id(conn, reformat_name(name), name)
+            conn.executemany(
+                "INSERT OR REPLACE INTO team_history (rider_id, season, team_name, team_url, class) VALUES (?, ?, ?, ?, ?)",
+                [(rider_id, entry["season"], entry["team_name"], entry["team_url"], entry["class"]) for entry in history],
+            )
+
+    def race_podiums(self, race: str, season: int | None = None) -> list[dict]:
+        """
+        Every top 3 result in the overall classification of a race.
+
+        Args:
+            race (str): Race name (e.g., "Ronde van Vlaanderen").
+            season (int | None): Restrict to one season.
+
+        Returns:
+            list[dict]: {"season", "rank", "name"} dicts, newest season first.
+        """
+        rows = self._connection().execute(
+            """
+            SELECT res.season, res.rank, r.name
+            FROM race_results res
+            JOIN races ra ON ra.id = res.race_id
+            JOIN riders r ON r.id = res.rider_id
+            WHERE ra.slug = ? AND res.stage = ?
+              AND res.rank BETWEEN 1 AND 3 AND (? IS NULL OR res.season = ?)
+            ORDER BY res.season DESC, res.rank
+            """,
+            (reformat_name(split_race_name(race)[0]), OVERALL_STAGE, season, season),
+        ).fetchall()
+        return [{"season": s, "rank": rank, "name": name} for s, rank, name in rows]
+
+    def top_scorers(self, names: list[str], season: int, limit: int = 10) -> list[dict]:
+        """
+        The riders among `names` with the most PCS points in `season`.
+
+        Returns:
+            list[dict]: {"name", "points", "rank"} dicts, highest points first.
+        """
+        slugs = [reformat_name(name) for name in names]
+        rows = self._connection().execute(
+            f"""
+            SELECT r.name, sp.points, sp.rank
+            FROM season_points sp
+            JOIN riders r ON r.id = sp.rider_id
+            WHERE sp.season = ? AND r.slug IN ({", ".join("?" for _ in slugs)})
+            ORDER BY sp.points DESC
+            LIMIT ?
+            """,
+            (season, *slugs, limit),
+        ).fetchall()
+        return [{"name": name, "points": points, "rank": rank} for name, points, rank in rows]
+
+
+_warehouse = None
+
+
+def get_warehouse() -> Warehouse | None:
+    """Return the configured warehouse, or None when the scrapers should not store anything."""
+    return _warehouse
+
+
+def set_warehouse(warehouse: Warehouse | None) -> Warehouse | None:
+    """
+    Replace the warehouse the scrapers upsert into.
+
+    Returns:
+        Warehouse | None: The previous warehouse.
+    """
+    global _warehouse
+    previous = _warehouse
+    _warehouse = warehouse
+    return previous
+
+
+def configure_warehouse_from_env() -> Warehouse | None:
+    """Open the warehouse at WAREHOUSE_PATH, if that environment variable is set."""
+    path = os.getenv("WAREHOUSE_PATH")
+    set_warehouse(Warehouse(path) if path else None)
+    return _warehouse
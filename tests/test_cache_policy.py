@@ -0,0 +1,92 @@
+"""
+Check how `pcs_scraper/cache_policy.py` classifies PCS pages and picks their cache TTL.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+from constants import CURRENT_SEASON_CACHE_TTL, LIVE_RACE_CACHE_TTL, PAGE_CACHE_TTL, pcs_base_url
+from datetime import date, timedelta
+from pcs_scraper.cache_policy import (
+    COMPLETED_SEASON, CURRENT_RACE, CURRENT_SEASON, FINISHED_RACE, OTHER, RIDER_PROFILE, STAGE_RACE_MAX_DAYS,
+    classify_url, page_ttl, race_date, race_finished, stale_grace
+)
+import pytest
+
+YEAR = date.today().year
+
+
+def url(path: str) -> str:
+    return f"{pcs_base_url}{path}"
+
+
+def info_list(day: date, **values) -> str:
+    """Minimal PCS info list with a date and optional "Avg. speed winner" / "Won how" values."""
+    items = [f'<li><div class="title">Date: </div><div class="value">{day.day} {day:%B %Y}</div></li>']
+    for title, value in values.items():
+        items.append(f'<li><div class="title">{title}:</div><div class="value">{value}</div></li>')
+    return f'<ul class="infolist">{"".join(items)}</ul>'
+
+
+@pytest.mark.parametrize("path, page_class", [
+    (f"rider/tadej-pogacar/{YEAR - 1}", COMPLETED_SEASON),
+    (f"rider/tadej-pogacar/{YEAR}", CURRENT_SEASON),
+    (f"race/tour-de-france/{YEAR - 1}/gc", FINISHED_RACE),
+    (f"race/ronde-van-vlaanderen/{YEAR - 1}/result", FINISHED_RACE),
+    (f"race/ronde-van-vlaanderen/{YEAR}/result", CURRENT_RACE),
+    (f"race/tour-de-france/{YEAR}", CURRENT_RACE),
+    ("rider/tadej-pogacar", RIDER_PROFILE),
+    ("team/uae-team-emirates-2024", OTHER),
+])
+def test_classify_url(path, page_class):
+    assert classify_url(url(path)) == page_class
+    assert classify_url(url(path) + "/") == page_class
+
+
+def test_race_date():
+    assert race_date(info_list(date(2025, 4, 6))) == date(2025, 4, 6)
+    assert race_date("Date: 6 April 2025") == date(2025, 4, 6)
+    assert race_date("<p>No info list</p>") is None
+    assert race_date("Date: 31 Smarch 2025") is None
+
+
+def test_race_finished():
+    today = date.today()
+    assert not race_finished(info_list(today, **{"Avg. speed winner": "", "Won how": ""}))
+    assert race_finished(info_list(today, **{"Avg. speed winner": "43.523 km/h"}))
+    assert race_finished(info_list(today, **{"Won how": "Sprint of small group"}))
+    assert race_finished(info_list(today - timedelta(days=1)))
+    assert not race_finished("")
+
+
+def test_page_ttl_of_fixed_pages():
+    assert page_ttl(url(f"rider/tadej-pogacar/{YEAR - 1}"), "") is None
+    assert page_ttl(url(f"race/tour-de-france/{YEAR - 1}/gc"), "") is None
+    assert page_ttl(url(f"rider/tadej-pogacar/{YEAR}"), "") == CURRENT_SEASON_CACHE_TTL
+    assert page_ttl(url("rider/tadej-pogacar"), "") == PAGE_CACHE_TTL
+
+
+@pytest.mark.parametrize("path", ["result", "stage-4", "stage-4/result", "stage-2a"])
+def test_single_day_page_is_permanent_once_its_day_is_over(path):
+    page = url(f"race/some-race/{YEAR}/{path}")
+    yesterday = date.today() - timedelta(days=1)
+    assert page_ttl(page, info_list(date.today())) == LIVE_RACE_CACHE_TTL
+    assert page_ttl(page, info_list(yesterday)) is None
+
+
+@pytest.mark.parametrize("path", ["gc", "points", "startlist", ""])
+def test_stage_race_page_stays_live_while_the_race_may_be_running(path):
+    page = url(f"race/some-race/{YEAR}/{path}")
+    today = date.today()
+    assert page_ttl(page, info_list(today - timedelta(days=1))) == LIVE_RACE_CACHE_TTL
+    assert page_ttl(page, info_list(today - timedelta(days=STAGE_RACE_MAX_DAYS))) == LIVE_RACE_CACHE_TTL
+    assert page_ttl(page, info_list(today - timedelta(days=STAGE_RACE_MAX_DAYS + 1))) is None
+
+
+def test_current_race_without_a_date_stays_live():
+    assert page_ttl(url(f"race/some-race/{YEAR}/result"), "<table></table>") == LIVE_RACE_CACHE_TTL
+
+
+def test_only_current_races_are_never_served_stale():
+    assert stale_grace(url(f"race/some-race/{YEAR}/result")) == 0
+    assert stale_grace(url(f"race/some-race/{YEAR - 1}/result")) > 0
+    assert stale_grace(url("rider/tadej-pogacar")) > 0
@@ -0,0 +1,56 @@
+"""
+Check how `services/career.py` flattens season results and adds them up.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+from services.career import CLASSIFICATION, GENERAL_CLASSIFICATION, ONE_DAY_RACE, STAGE, aggregate, season_rows
+import pytest
+
+pytest.importorskip("numpy")
+
+# Shaped like `rider_season_scraper.parse_races`
+RACES = {
+    "Strade Bianche (1.UWT)": {"result": "1", "distance": "215", "pcs_points": "275", "uci_points": "800"},
+    "Tirreno-Adriatico (2.UWT)": {
+        "stages": [
+            {"result": "3", "distance": "180.5", "pcs_points": "40", "uci_points": "25"},
+            {"result": "DNF", "distance": "", "pcs_points": "", "uci_points": ""},
+        ],
+        "classifications": [
+            {"name": "General classification", "result": "2", "pcs_points": "200", "uci_points": "400"},
+            {"name": "Points classification", "result": "1", "pcs_points": "30", "uci_points": "0"},
+        ],
+    },
+}
+
+
+def test_season_rows():
+    assert season_rows(2024, RACES) == [
+        [2024, ONE_DAY_RACE, 1, 215.0, 275.0, 800.0],
+        [2024, STAGE, 3, 180.5, 40.0, 25.0],
+        [2024, STAGE, 0, 0.0, 0.0, 0.0],
+        [2024, GENERAL_CLASSIFICATION, 2, 0.0, 200.0, 400.0],
+        [2024, CLASSIFICATION, 1, 0.0, 30.0, 0.0],
+    ]
+
+
+def test_aggregate_counts_only_general_classifications_toward_wins():
+    rows = season_rows(2024, RACES) + [[2023, CLASSIFICATION, 1, 0.0, 10.0, 0.0]]
+    career = aggregate(rows)
+
+    assert career["total"] == {
+        "wins": 1, "podiums": 3, "top_10s": 3, "race_days": 3, "km": 395.5, "pcs_points": 555, "uci_points": 1225,
+    }
+    assert [(season["season"], season["wins"], season["pcs_points"]) for season in career["seasons"]] == [(2023, 0, 10), (2024, 1, 545)]
+
+    race_types = {race_type["race_type"]: race_type for race_type in career["race_types"]}
+    assert race_types["General classifications"]["podiums"] == 1
+    assert race_types["Other classifications"]["wins"] == 2
+    assert race_types["Stages"]["race_days"] == 2
+
+
+def test_aggregate_without_rows():
+    career = aggregate([])
+    assert career["seasons"] == []
+    assert career["total"]["wins"] == 0
@@ -0,0 +1,50 @@
+"""
+Check the frozen country table (`helpers/country_table.py`) against pycountry.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+from helpers.country_helper import country_code_to_emoji, country_code_to_name, country_to_emoji, normalize_country_name
+from helpers.country_table import COUNTRIES, COUNTRY_NAMES
+from tools.build_country_table import NON_ISO_CODES, PCS_NATIONALITIES, build_names, build_table
+import pytest
+
+pycountry = pytest.importorskip("pycountry")
+
+
+def test_table_is_up_to_date():
+    """The committed table is what `python -m tools.build_country_table` generates."""
+    table = build_table()
+    assert {name: code for name, (code, _) in COUNTRIES.items()} == table
+    assert dict(COUNTRY_NAMES) == build_names(table)
+
+
+def test_codes_are_iso_3166():
+    iso_codes = {country.alpha_2 for country in pycountry.countries}
+    codes = {code for code, _ in COUNTRIES.values()}
+    assert codes - iso_codes == NON_ISO_CODES
+
+
+def test_every_iso_country_resolves():
+    for country in pycountry.countries:
+        assert COUNTRIES[normalize_country_name(country.name)][0] == country.alpha_2, country.name
+
+
+def test_flags_match_codes():
+    for name, (code, flag) in COUNTRIES.items():
+        assert flag == country_code_to_emoji(code), name
+
+
+def test_every_pcs_nationality_has_a_flag():
+    for nationality in PCS_NATIONALITIES:
+        assert country_to_emoji(nationality), nationality
+
+
+def test_every_code_has_a_name_that_resolves_back():
+    for code, _ in COUNTRIES.values():
+        assert COUNTRIES[normalize_country_name(country_code_to_name(code))][0] == code, code
+
+
+def test_kosovo_uses_the_user_assigned_code():
+    assert COUNTRIES["kosovo"] == ("XK", "🇽🇰")
+    assert pycountry.countries.get(alpha_2="XK") is None
@@ -0,0 +1,200 @@
+"""
+Run PCS lookups for a list of riders or races without Discord, writing one JSON line per result.
+
+Every lookup in `--lookups` is run for every name in the input file (one name per line, blank
+lines and lines starting with # are skipped, "-" reads stdin). The lookups run in a pool of
+worker processes, so parsing is not limited to one CPU, while all workers share one PCS rate
+limit (PCS_RATE_LIMIT / PCS_RATE_BURST). The workers configure the fetcher, cache, warehouse
+and data source from the environment like the bot does; set CACHE_BACKEND to "sqlite" or
+"redis" to let them share downloaded pages.
+
+Results are written as soon as they are known, in completion order, with the options the
+lookup depends on:
+    {"lookup": "startlist", "input": "Tour de France", "options": {"season": 2025}, "result": [...], "error": null, "elapsed_ms": 812.4}
+
+When `--output` already exists, the lookups it holds a result for with the same options are
+skipped, so an interrupted run (Ctrl+C, crash, ...) continues where it stopped when it is
+started again with the same arguments. Failed lookups are retried.
+
+Usage (from the repository root):
+    python -m tools.batch riders.txt --lookups points-per-season,team-history --output dump.jsonl
+    python -m tools.batch races.txt --lookups startlist --season 2025 --workers 2
+"""
+from pcs_scraper.data_source import get_data_source, configure_data_source_from_env
+from pcs_scraper.fetcher import configure_from_env, get_rate_limiter, set_rate_limiter, DEFAULT_RATE_LIMIT, DEFAULT_RATE_BURST
+from pcs_scraper.rate_limiter import SharedRateLimiter
+from services.past_results import get_past_results
+from storage.cache_backend import configure_cache_from_env
+from storage.warehouse import configure_warehouse_from_env
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dotenv import load_dotenv
+from datetime import date
+from pathlib import Path
+import argparse
+import json
+import multiprocessing.util
+import os
+import signal
+import sys
+import time
+
+DEFAULT_WORKERS = 4
+
+# Lookup name -> function(data source, name, options) returning a JSON-serializable result
+LOOKUPS = {
+    "rider-info": lambda source, name, options: source.rider_info(name),
+    "rider-image": lambda source, name, options: source.rider_image_url(name),
+    "team-history": lambda source, name, options: source.team_history(name),
+    "points-per-season": lambda source, name, options: source.points_per_season(name),
+    "points-per-speciality": lambda source, name, options: source.points_per_speciality(name),
+    "season-results": lambda source, name, options: source.season_results(name, options["season"]),
+    "rider-program": lambda source, name, options: source.rider_program(name),
+    "active-seasons": lambda source, name, options: source.active_seasons(name),
+    "past-results": lambda source, name, options: get_past_results(name, options["race"]),
+    "race-flag": lambda source, race, options: source.race_flag(race),
+    "startlist": lambda source, race, options: source.startlist(race, options["season"]),
+}
+
+# Lookup name -> the options its result depends on, all others ignore them
+LOOKUP_OPTIONS = {
+    "season-results": ("season",),
+    "past-results": ("race",),
+    "startlist": ("season",),
+}
+
+
+def lookup_options(lookup: str, options: dict) -> dict:
+    """Return the options `lookup` depends on, as written to its output line."""
+    return {option: options[option] for option in LOOKUP_OPTIONS.get(lookup, ())}
+
+
+def _resume_key(lookup: str, name: str, options: dict) -> tuple[str, str, str]:
+    return lookup, name, json.dumps(options, sort_keys=True)
+
+
+def _init_worker(rate_limiter: SharedRateLimiter | None):
+    """Configure a worker process like the bot, drawing downloads from the shared rate limit."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent process handles Ctrl+C
+    load_dotenv()
+    archive = configure_from_env()
+    if archive is not None:
+        # Pool workers exit without running atexit handlers, so write the recordings on exit here
+        multiprocessing.util.Finalize(archive, archive.close, exitpriority=10)
+    configure_cache_from_env()
+    configure_warehouse_from_env()
+    configure_data_source_from_env()
+    if get_rate_limiter() is not None:  # None in replay mode, where nothing is downloaded
+        set_rate_limiter(rate_limiter)
+
+
+def run_lookup(lookup: str, name: str, options: dict) -> dict:
+    """Run one lookup in a worker process and return its output line."""
+    started = time.perf_counter()
+    options = lookup_options(lookup, options)
+    line = {"lookup": lookup, "input": name, "options": options, "result": None, "error": None}
+    try:
+        line["result"] = LOOKUPS[lookup](get_data_source(), name, options)
+    except Exception as e:
+        line["error"] = f"{type(e).__name__}: {e}"
+    line["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return line
+
+
+def read_names(path: str) -> list[str]:
+    lines = sys.stdin.read().splitlines() if path == "-" else Path(path).read_text(encoding="utf-8").splitlines()
+    names = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#") and line not in names:
+            names.append(line)
+    return names
+
+
+def completed_lookups(path: Path) -> set[tuple[str, str, str]]:
+    """
+    Return the (lookup, input, options) keys `path` holds a successful result for.
+
+    The options are part of the key, so a lookup is run again with a different --season or
+    --race. A line cut off by an interruption is ignored, so that lookup is run again.
+    """
+    done = set()
+    if not path.exists():
+        return done
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("error") is None:
+                done.add(_resume_key(entry["lookup"], entry["input"], entry.get("options", {})))
+    return done
+
+
+def shared_rate_limiter() -> SharedRateLimiter | None:
+    rate = float(os.getenv("PCS_RATE_LIMIT", DEFAULT_RATE_LIMIT))
+    burst = int(os.getenv("PCS_RATE_BURST", DEFAULT_RATE_BURST))
+    return SharedRateLimiter(rate, burst) if rate > 0 else None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run PCS lookups for a list of riders or races, as JSON lines.")
+    parser.add_argument("names", help="file with one rider or race name per line, - for stdin")
+    parser.add_argument("--lookups", required=True, help=f"comma-separated lookups to run: {', '.join(LOOKUPS)}")
+    parser.add_argument("--output", help="JSON lines file to append to (default: stdout); existing results are skipped")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="worker processes")
+    parser.add_argument("--season", type=int, default=date.today().year, help="season of season-results and startlist")
+    parser.add_argument("--race", help="race of past-results")
+    args = parser.parse_args(argv)
+
+    lookups = [lookup.strip() for lookup in args.lookups.split(",") if lookup.strip()]
+    unknown = [lookup for lookup in lookups if lookup not in LOOKUPS]
+    if unknown:
+        parser.error(f"unknown lookup(s): {', '.join(unknown)}")
+    if "past-results" in lookups and not args.race:
+        parser.error("past-results needs --race")
+
+    load_dotenv()
+    names = read_names(args.names)
+    output_path = Path(args.output) if args.output else None
+    options = {"season": args.season, "race": args.race}
+    done = completed_lookups(output_path) if output_path else set()
+    tasks = [
+        (lookup, name) for name in names for lookup in lookups
+        if _resume_key(lookup, name, lookup_options(lookup, options)) not in done
+    ]
+    if done:
+        print(f"Resuming: {len(names) * len(lookups) - len(tasks)} lookups already done, {len(tasks)} to go", file=sys.stderr)
+
+    output = output_path.open("a", encoding="utf-8") if output_path else sys.stdout
+    if output_path and output.tell() and not output_path.read_bytes().endswith(b"\n"):
+        output.write("\n")  # end a line cut off by an interruption
+    executor = ProcessPoolExecutor(max(1, args.workers), initializer=_init_worker, initargs=(shared_rate_limiter(),))
+    written = failed = 0
+    try:
+        futures = [executor.submit(run_lookup, lookup, name, options) for lookup, name in tasks]
+        for future in as_completed(futures):
+            line = future.result()
+            output.write(json.dumps(line) + "\n")
+            output.flush()
+            written += 1
+            if line["error"] is not None:
+                failed += 1
+                print(f"{line['lookup']} failed for {line['input']}: {line['error']}", file=sys.stderr)
+    except (KeyboardInterrupt, BrokenProcessPool) as e:
+        executor.shutdown(wait=False, cancel_futures=True)
+        reason = "Interrupted" if isinstance(e, KeyboardInterrupt) else "A worker process died"
+        print(f"{reason} after {written} of {len(tasks)} lookups; run again to resume", file=sys.stderr)
+        return 130 if isinstance(e, KeyboardInterrupt) else 1
+    finally:
+        if output_path:
+            output.close()
+    executor.shutdown()
+
+    print(f"Done: {written} lookups, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Build `helpers/country_table.py`, the frozen country name -> (ISO code, flag) lookup table,
+and the reverse ISO code -> country name table.
+
+The table is generated from pycountry (names, official names, common names and the
+"Name, Qualifier" inversions) plus the spellings used on ProCyclingStats, so the bot never
+imports pycountry at runtime. After building, every nationality in `PCS_NATIONALITIES` is
+checked to resolve; the build fails if one does not.
+
+Usage (from the repository root):
+    python -m tools.build_country_table
+"""
+from helpers.country_helper import country_code_to_emoji, normalize_country_name
+from collections import Counter
+from pathlib import Path
+import sys
+
+OUTPUT = Path(__file__).resolve().parent.parent / "helpers" / "country_table.py"
+
+# Codes in the table that are not ISO 3166-1 alpha-2 codes. "XK" is the user-assigned code
+# commonly used for Kosovo (by the European Commission, the UCI and the Unicode flag sequences),
+# which has no ISO 3166-1 code and is therefore missing from pycountry.
+NON_ISO_CODES = {"XK"}
+
+# Spellings used by PCS (or common in race names) that differ from the ISO names
+PCS_ALIASES = {
+    "Great Britain": "GB",
+    "England": "GB",
+    "Scotland": "GB",
+    "Wales": "GB",
+    "Northern Ireland": "GB",
+    "USA": "US",
+    "United States of America": "US",
+    "Czech Republic": "CZ",
+    "Slovak Republic": "SK",
+    "Russia": "RU",
+    "Turkey": "TR",
+    "South Korea": "KR",
+    "Korea": "KR",
+    "North Korea": "KP",
+    "Iran": "IR",
+    "Syria": "SY",
+    "Venezuela": "VE",
+    "Bolivia": "BO",
+    "Moldova": "MD",
+    "Tanzania": "TZ",
+    "Taiwan": "TW",
+    "Chinese Taipei": "TW",
+    "Vietnam": "VN",
+    "Laos": "LA",
+    "Brunei": "BN",
+    "Macedonia": "MK",
+    "North Macedonia": "MK",
+    "Kosovo": "XK",  # not an ISO 3166-1 code, see NON_ISO_CODES
+    "Ivory Coast": "CI",
+    "Cape Verde": "CV",
+    "Swaziland": "SZ",
+    "Palestine": "PS",
+    "Micronesia": "FM",
+    "DR Congo": "CD",
+    "Democratic Republic of the Congo": "CD",
+    "Congo": "CG",
+    "Republic of the Congo": "CG",
+    "The Netherlands": "NL",
+    "Holland": "NL",
+    "UAE": "AE",
+    "Hong Kong, China": "HK",
+    "Macau": "MO",
+    "Vatican": "VA",
+    "St Kitts and Nevis": "KN",
+    "St Lucia": "LC",
+    "St Vincent and the Grenadines": "VC",
+    "Burma": "MM",
+    "East Timor": "TL",
+    "The Gambia": "GM",
+    "The Bahamas": "BS",
+    "Falkland Islands": "FK",
+    "US Virgin Islands": "VI",
+    "British Virgin Islands": "VG",
+}
+
+# Every nationality listed on PCS's nations ranking, as spelled on the site
+PCS_NATIONALITIES = [
+    "Albania", "Algeria", "Andorra", "Angola", "Antigua and Barbuda", "Argentina", "Armenia", "Aruba",
+    "Australia", "Austria", "Azerbaijan", "Bahamas", "Bahrain", "Bangladesh", "Barbados", "Belarus",
+    "Belgium", "Belize", "Benin", "Bermuda", "Bolivia", "Bosnia and Herzegovina", "Bosnia & Herzegovina",
+    "Botswana", "Brazil", "Bulgaria", "Burkina Faso", "Burundi", "Cambodia", "Cameroon", "Canada",
+    "Cape Verde", "Cayman Islands", "Central African Republic", "Chad", "Chile", "China", "Chinese Taipei",
+    "Colombia", "Congo", "Costa Rica", "Croatia", "Cuba", "Curaçao", "Cyprus", "Czech Republic", "Czechia",
+    "Denmark", "Djibouti", "Dominican Republic", "DR Congo", "Ecuador", "Egypt", "El Salvador", "Eritrea",
+    "Estonia", "Ethiopia", "Fiji", "Finland", "France", "Gabon", "Georgia", "Germany", "Ghana",
+    "Great Britain", "Greece", "Guadeloupe", "Guam", "Guatemala", "Guinea", "Guyana", "Haiti", "Honduras",
+    "Hong Kong", "Hungary", "Iceland", "India", "Indonesia", "Iran", "Iraq", "Ireland", "Israel", "Italy",
+    "Ivory Coast", "Jamaica", "Japan", "Jordan", "Kazakhstan", "Kenya", "Kosovo", "Kuwait", "Kyrgyzstan",
+    "Laos", "Latvia", "Lebanon", "Lesotho", "Libya", "Liechtenstein", "Lithuania", "Luxembourg", "Macau",
+    "Madagascar", "Malawi", "Malaysia", "Mali", "Malta", "Martinique", "Mauritius", "Mexico", "Moldova",
+    "Monaco", "Mongolia", "Montenegro", "Morocco", "Mozambique", "Myanmar", "Namibia", "Nepal",
+    "Netherlands", "New Caledonia", "New Zealand", "Nicaragua", "Niger", "Nigeria", "North Macedonia",
+    "Norway", "Oman", "Pakistan", "Palestine", "Panama", "Papua New Guinea", "Paraguay", "Peru",
+    "Philippines", "Poland", "Portugal", "Puerto Rico", "Qatar", "Réunion", "Romania", "Russia", "Rwanda",
+    "San Marino", "Saudi Arabia", "Senegal", "Serbia", "Seychelles", "Singapore", "Slovakia", "Slovenia",
+    "South Africa", "South Korea", "South Sudan", "Spain", "Sri Lanka", "Sudan", "Suriname", "Sweden",
+    "Switzerland", "Syria", "Taiwan", "Tajikistan", "Tanzania", "Thailand", "Togo", "Trinidad and Tobago",
+    "Trinidad & Tobago", "Tunisia", "Turkey", "Turkmenistan", "Uganda", "Ukraine", "United Arab Emirates",
+    "Uruguay", "USA", "United States", "Uzbekistan", "Venezuela", "Vietnam", "Zambia", "Zimbabwe",
+]
+
+
+def build_table() -> dict[str, str]:
+    """
+    Collect every known spelling of every country.
+
+    Returns:
+        dict[str, str]: Normalized country name -> ISO 3166-1 alpha-2 code.
+    """
+    import pycountry
+
+    names = {}
+    for country in pycountry.countries:
+        for attribute in ("name", "official_name", "common_name"):
+            value = getattr(country, attribute, None)
+            if value:
+                names.setdefault(normalize_country_name(value), country.alpha_2)
+
+    # "Korea, Republic of" -> "Republic of Korea", and "Korea" if no other country shares the prefix
+    prefixes = Counter(country.name.split(",")[0] for country in pycountry.countries)
+    for country in pycountry.countries:
+        if "," not in country.name:
+            continue
+        prefix, qualifier = (part.strip() for part in country.name.split(",", 1))
+        names.setdefault(normalize_country_name(f"{qualifier} {prefix}"), country.alpha_2)
+        if prefixes[prefix] == 1:
+            names.setdefault(normalize_country_name(prefix), country.alpha_2)
+
+    # PCS spellings take precedence over anything derived above
+    for alias, code in PCS_ALIASES.items():
+        names[normalize_country_name(alias)] = code
+
+    return dict(sorted(names.items()))
+
+
+def build_names(table: dict[str, str]) -> dict[str, str]:
+    """
+    Pick the display name of every code in `table`: the spelling PCS uses for that
+    nationality if it has one, otherwise pycountry's common name or name.
+
+    Returns:
+        dict[str, str]: ISO 3166-1 alpha-2 code -> country name.
+    """
+    import pycountry
+
+    names = {}
+    for nationality in PCS_NATIONALITIES:
+        names.setdefault(table[normalize_country_name(nationality)], nationality)
+    for country in pycountry.countries:
+        names.setdefault(country.alpha_2, getattr(country, "common_name", None) or country.name)
+    return dict(sorted((code, name) for code, name in names.items() if code in table.values()))
+
+
+def check_pcs_nationalities(table: dict[str, str]) -> list[str]:
+    """Return every PCS nationality that does not resolve to a flag with `table`."""
+    return [name for name in PCS_NATIONALITIES if normalize_country_name(name) not in table]
+
+
+def write_module(table: dict[str, str], names: dict[str, str]):
+    lines = [
+        '"""',
+        "Frozen lookup tables from normalized country names to (ISO 3166-1 alpha-2 code, flag emoji),",
+        "and from those codes back to country names.",
+        "",
+        "Generated by `python -m tools.build_country_table`, do not edit by hand.",
+        "",
+        "Every code is an ISO 3166-1 alpha-2 code except \"XK\" for Kosovo, which has no ISO code;",
+        "XK is the user-assigned code used by the UCI and the Unicode flag sequences.",
+        '"""',
+        "from types import MappingProxyType",
+        "",
+        "COUNTRIES = MappingProxyType({",
+    ]
+    lines += [f"    {name!r}: ({code!r}, {country_code_to_emoji(code)!r})," for name, code in table.items()]
+    lines += ["})", "", "# ISO code -> country name, as PCS spells the nationality where it lists it", "COUNTRY_NAMES = MappingProxyType({"]
+    lines += [f"    {code!r}: {name!r}," for code, name in names.items()]
+    lines += ["})", ""]
+    OUTPUT.write_text("\n".join(lines), encoding="utf-8")
+
+
+def main() -> int:
+    table = build_table()
+    unresolved = check_pcs_nationalities(table)
+    if unresolved:
+        print("PCS nationalities without a flag: " + ", ".join(unresolved))
+        return 1
+
+    write_module(table, build_names(table))
+    print(f"Wrote {len(table)} country names to {OUTPUT}, all {len(PCS_NATIONALITIES)} PCS nationalities resolve")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())